@@ -0,0 +1,539 @@
+"""
+Result Formatters
+Convert CAPA SDK result objects into JSON-ready dicts for the Reflex UI.
+
+Shared by the single-image and multi-angle paths in capa_service so both
+produce the same structure for each module result.
+"""
+
+import operator
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Optional, Dict, List, Any
+
+import numpy as np
+
+# Numba is optional; it compiles the canon range test for large canon batches
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    njit = None
+    HAS_NUMBA = False
+
+
+# =============================================================================
+# Field specs
+# =============================================================================
+# Each spec is a tuple of (output_key, sdk_attribute, default). Attributes are
+# resolved with a single getattr() instead of a hasattr() + getattr() pair.
+
+_MISSING = object()
+
+WD_OPTIONAL_FIELDS = (
+    ("wd_ratio", "wd_ratio", None),
+    ("normalized_wd_value", "normalized_wd_value", None),
+    ("demographic_percentile", "demographic_percentile", None),
+)
+
+# (output_key, preferred attribute with _score suffix, legacy attribute)
+PERSONALITY_FIELDS = (
+    ("social_orientation", "social_orientation_score", "social_orientation"),
+    ("relational_field", "relational_field_score", "relational_field"),
+    ("communication_style", "communication_style_score", "communication_style"),
+    ("leadership", "leadership_tendency", "leadership"),
+    ("interpersonal_effectiveness", "interpersonal_effectiveness", None),
+    ("emotional_expressiveness", "emotional_expressiveness", None),
+    ("social_energy_level", "social_energy_level", None),
+    ("conflict_resolution_style", "conflict_resolution_style", None),
+)
+_PERSONALITY_KEYS = tuple(key for key, _, _ in PERSONALITY_FIELDS)
+_get_preferred_personality = operator.attrgetter(*(attr for _, attr, _ in PERSONALITY_FIELDS))
+
+GEOMETRY_FIELDS = (
+    ("forehead_width", "forehead_width", 0),
+    ("curvature", "forehead_curvature", 0),
+    ("frontal_prominence", "frontal_prominence", 0),
+    ("temporal_width", "temporal_width", 0),
+    ("width_height_ratio", "width_height_ratio", 0),
+)
+
+# Numeric attributes of the SDK's neuroscience correlations object (charted by the UI)
+NEUROSCIENCE_FIELDS = (
+    "cortical_thickness_correlation",
+    "gray_matter_volume_correlation",
+    "prefrontal_activity_indicator",
+    "dopamine_system_activity",
+    "serotonin_system_balance",
+    "gaba_system_function",
+    "executive_function_score",
+    "working_memory_capacity",
+    "attention_control_score",
+    "cognitive_flexibility",
+    "inhibitory_control",
+)
+
+# Geometry subset reported by the forehead-only analyzer
+BASIC_GEOMETRY_FIELDS = (
+    ("forehead_width", "forehead_width", 0),
+    ("curvature", "forehead_curvature", 0),
+    ("frontal_prominence", "frontal_prominence", 0),
+)
+
+# Neurotransmitter/cognitive predictions derived from neuroscience_correlations
+NEUROTRANSMITTER_FIELDS = (
+    ("dopamine_activity", "dopamine_system_activity", None),
+    ("serotonin_balance", "serotonin_system_balance", None),
+    ("gaba_function", "gaba_system_function", None),
+)
+
+COGNITIVE_FIELDS = (
+    ("executive_function", "executive_function_score", None),
+    ("working_memory", "working_memory_capacity", None),
+    ("attention_control", "attention_control_score", None),
+    ("cognitive_flexibility", "cognitive_flexibility", None),
+    ("inhibitory_control", "inhibitory_control", None),
+)
+
+# Some SDK versions expose neurotransmitters/cognitive functions as separate objects
+DIRECT_NEUROTRANSMITTER_FIELDS = (
+    ("dopamine_activity", "dopamine_activity", 0.0),
+    ("serotonin_balance", "serotonin_balance", 0.0),
+    ("gaba_function", "gaba_function", 0.0),
+)
+
+DIRECT_COGNITIVE_FIELDS = (
+    ("executive_function", "executive_function", 0.0),
+    ("working_memory", "working_memory", 0.0),
+    ("attention_control", "attention_control", 0.0),
+)
+
+IMPULSIVITY_FIELDS = (
+    ("motor_impulsiveness", "motor_impulsiveness", None),
+    ("cognitive_impulsiveness", "cognitive_impulsiveness", None),
+    ("non_planning_impulsiveness", "non_planning_impulsiveness", None),
+    ("attentional_impulsiveness", "attentional_impulsiveness", None),
+    ("risk_taking_tendency", "risk_taking_tendency", None),
+    ("sensation_seeking", "sensation_seeking", None),
+    ("behavioral_inhibition", "behavioral_inhibition", None),
+    ("emotional_regulation", "emotional_regulation", None),
+)
+
+PROPORTION_FIELDS = (
+    ("upper_face_ratio", "upper_face_ratio", 0),
+    ("middle_face_ratio", "middle_face_ratio", 0),
+    ("lower_face_ratio", "lower_face_ratio", 0),
+    ("bizygomatic_width", "bizygomatic_width", 0),
+    ("bigonial_width", "bigonial_width", 0),
+    ("facial_width", "bizygomatic_width", 0),
+    ("facial_height", "total_face_height", 0),
+    ("facial_index", "facial_index", 0),
+    ("nasal_width", "nasal_width", 0),
+    ("mouth_width", "mouth_width", 0),
+)
+
+# Proportions subset reported by the morphology-only analyzer
+BASIC_PROPORTION_FIELDS = (
+    ("upper_face_ratio", "upper_face_ratio", 0),
+    ("middle_face_ratio", "middle_face_ratio", 0),
+    ("lower_face_ratio", "lower_face_ratio", 0),
+    ("facial_width", "bizygomatic_width", 0),
+    ("facial_height", "total_face_height", 0),
+)
+
+SYMMETRY_FIELDS = (
+    ("horizontal_symmetry", "horizontal_symmetry", None),
+    ("vertical_symmetry", "vertical_symmetry", None),
+    ("overall_symmetry", "overall_symmetry", None),
+)
+
+NEO_FIELDS = (
+    ("overall_score", "overall_validity_score", 0.0),
+    ("beauty_score", "beauty_score", None),
+    ("proportion_balance", "proportion_balance", None),
+    ("confidence", "confidence", 0.0),
+)
+
+CANON_FIELDS = (
+    ("measured_value", "measured_ratio", 0.0),
+    ("deviation", "deviation_percentage", 0.0),
+    ("confidence", "confidence", 0.8),
+)
+CANON_KEYS = tuple(key for key, _, _ in CANON_FIELDS)
+_DEVIATION_COLUMN = CANON_KEYS.index("deviation")
+
+# Canon measurements from the standalone NeoclassicalCanonsAnalyzer (same output keys)
+CANON_MEASUREMENT_FIELDS = (
+    ("measured_value", "measured_value", 0.0),
+    ("deviation", "deviation_from_ideal", 0.0),
+    ("confidence", "measurement_confidence", 0.8),
+)
+CANON_MEASUREMENT_KEYS = tuple(key for key, _, _ in CANON_MEASUREMENT_FIELDS)
+
+# SDK validity score and reference ratios, kept for transparency
+CANON_REFERENCE_FIELDS = (
+    ("validity_score", "validity_score", None),
+    ("expected_ratio", "expected_ratio", None),
+    ("acceptable_deviation", "acceptable_deviation", None),
+)
+
+# Enum labels of the primary classifications, resolved in one C-level call
+get_wd_classification = operator.attrgetter('primary_classification.value')
+get_impulsiveness_level = operator.attrgetter('impulsiveness_level.value')
+get_face_shape = operator.attrgetter('shape_classification.primary_shape.value')
+
+# Evidence level and source paper attached to each module result (read-only)
+WD_EVIDENCE = MappingProxyType({
+    "evidence_level": "validated",
+    "paper_reference": "Lefevre et al. (2012) - fWHR correlations",
+})
+
+FOREHEAD_EVIDENCE = MappingProxyType({
+    "evidence_level": "validated",
+    "paper_reference": "Guerrero-Apolo et al. (2018) - FID-BIS11 correlation",
+})
+
+
+# =============================================================================
+# Helpers
+# =============================================================================
+
+def to_floats(values) -> List[float]:
+    """Convert a sequence of numbers (often numpy scalars) to Python floats in one pass."""
+    return np.asarray(values, dtype=np.float64).tolist()
+
+
+def extract_fields(
+    obj: Any,
+    spec: tuple,
+    cast=float,
+    into: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Build a dict from a field spec, using defaults for missing attributes.
+
+    With the default cast, present values are converted to Python floats in a
+    single batch; pass cast=None to keep raw values. Pass into= to add the
+    fields to an existing dict instead of allocating a new one.
+    """
+    out = {} if into is None else into
+    present_keys = []
+    present_values = []
+    for key, attr, default in spec:
+        val = getattr(obj, attr, _MISSING)
+        if val is _MISSING or val is None:
+            out[key] = default
+        elif cast is float:
+            out[key] = None  # Reserve key order; filled from the batch below
+            present_keys.append(key)
+            present_values.append(val)
+        else:
+            out[key] = cast(val) if cast else val
+    if present_values:
+        out.update(zip(present_keys, to_floats(present_values)))
+    return out
+
+
+def _value_or_default(obj: Any, attr: str, default: Any) -> Any:
+    """Return an attribute value, or the default when it is missing or None."""
+    val = getattr(obj, attr, None)
+    return default if val is None else val
+
+
+def _field_matrix(objects: List[Any], spec: tuple) -> np.ndarray:
+    """Extract a numeric field spec from many objects into one (objects x fields) float array."""
+    rows = [[_value_or_default(obj, attr, default) for _, attr, default in spec] for obj in objects]
+    return np.array(rows, dtype=np.float64).reshape(len(objects), len(spec))
+
+
+def extract_personality(pp: Any) -> Dict[str, Any]:
+    """Extract personality profile scores, preferring the _score attribute names."""
+    try:
+        # Fast path: every preferred attribute is present
+        return dict(zip(_PERSONALITY_KEYS, _get_preferred_personality(pp)))
+    except AttributeError:
+        pass
+    out = {}
+    for key, attr, legacy_attr in PERSONALITY_FIELDS:
+        val = getattr(pp, attr, _MISSING)
+        if val is _MISSING and legacy_attr:
+            val = getattr(pp, legacy_attr, _MISSING)
+        out[key] = 'N/A' if val is _MISSING else val
+    return out
+
+
+def _numeric_attributes(obj: Any, fields: tuple) -> Dict[str, float]:
+    """Collect the numeric attributes among the given fields of an SDK object."""
+    values = {}
+    for attr in fields:
+        val = getattr(obj, attr, None)
+        if isinstance(val, (int, float)):
+            values[attr] = float(val)
+    return values
+
+
+def _shape_name(shape: Any) -> str:
+    """Return the display name of a face shape enum (or its string form)."""
+    return shape.value if hasattr(shape, 'value') else str(shape)
+
+
+# Below this many canons the numpy ufunc is cheaper than a compiled-kernel call
+_JIT_MIN_CANONS = 64
+
+if HAS_NUMBA:
+    @njit(cache=True)
+    def _within_mask_jit(deviations, threshold):
+        out = np.empty(deviations.size, np.bool_)
+        for i in range(deviations.size):
+            out[i] = abs(deviations[i]) <= threshold
+        return out
+
+
+def within_mask(deviations: np.ndarray, threshold: float) -> np.ndarray:
+    """Return a boolean mask of deviations (%) whose magnitude is within the threshold."""
+    if HAS_NUMBA and deviations.size >= _JIT_MIN_CANONS:
+        return _within_mask_jit(np.ascontiguousarray(deviations), float(threshold))
+    return np.abs(deviations) <= threshold
+
+
+def clamp_confidence(value: float) -> float:
+    """Clamp a confidence value to 0-1 (SDK sometimes returns out-of-range values)."""
+    return 0.0 if value < 0.0 else (1.0 if value > 1.0 else value)
+
+
+# =============================================================================
+# Module formatters
+# =============================================================================
+
+def format_wd_result(wd: Any) -> Dict[str, Any]:
+    """Format a WD analysis result with personality profile and demographic data."""
+    (
+        wd_value_px, bizygomatic_width_px, bigonial_width_px, confidence,
+        wd_value_cm, bizygomatic_width_cm, bigonial_width_cm,
+    ) = to_floats((
+        wd.wd_value, wd.bizygomatic_width, wd.bigonial_width, wd.measurement_confidence,
+        getattr(wd, 'wd_value_cm', None) or 0,
+        getattr(wd, 'bizygomatic_width_cm', None) or 0,
+        getattr(wd, 'bigonial_width_cm', None) or 0,
+    ))
+    # Calibrated (paper cm) values are used when the SDK provides them
+    has_cm = wd_value_cm != 0
+    wd_dict = {
+        "wd_value": wd_value_cm if has_cm else wd_value_px,
+        "wd_value_px": wd_value_px,  # Keep pixel value for reference
+        "classification": get_wd_classification(wd),
+        # Widths in cm when available
+        "bizygomatic_width": bizygomatic_width_cm if bizygomatic_width_cm != 0 else bizygomatic_width_px,
+        "bizygomatic_width_px": bizygomatic_width_px,
+        "bigonial_width": bigonial_width_cm if bigonial_width_cm != 0 else bigonial_width_px,
+        "bigonial_width_px": bigonial_width_px,
+        "confidence": clamp_confidence(confidence),
+    }
+    # wd_ratio, normalized_wd_value and demographic_percentile
+    extract_fields(wd, WD_OPTIONAL_FIELDS, into=wd_dict)
+    wd_dict["robust_classification"] = getattr(wd, 'robust_classification', None)
+    # Flag to indicate if values are in cm
+    wd_dict["units"] = "cm" if has_cm else "px"
+
+    # Add personality profile if available (use correct attribute names with _score suffix)
+    pp = getattr(wd, 'personality_profile', None)
+    if pp:
+        wd_dict["personality_profile"] = extract_personality(pp)
+
+    # Add secondary traits if available
+    secondary_traits = getattr(wd, 'secondary_traits', None)
+    if secondary_traits:
+        wd_dict["secondary_traits"] = list(secondary_traits)
+
+    # Add Z-score demographic data if available
+    z_score = getattr(wd, 'normalized_wd_z_score', None)
+    if z_score is not None:
+        wd_dict["demographic_data"] = {
+            "z_score": float(z_score),
+            "percentile": wd_dict["demographic_percentile"] or 50.0,
+            "robust_classification": wd_dict["robust_classification"],
+            "reference_population": getattr(wd, 'demographic_reference', None),
+        }
+
+    # Add evidence level for scientific transparency
+    wd_dict.update(WD_EVIDENCE)
+
+    return wd_dict
+
+
+def format_forehead_result(fh: Any) -> Dict[str, Any]:
+    """Format a forehead analysis result with geometry, neuroscience and BIS-11 data."""
+    geom = fh.forehead_geometry
+    slant_angle, forehead_height, confidence = to_floats(
+        (geom.slant_angle_degrees, geom.forehead_height, fh.measurement_confidence)
+    )
+    fh_dict = {
+        "slant_angle": slant_angle,
+        "forehead_height": forehead_height,
+        "impulsiveness_level": get_impulsiveness_level(fh),
+        "confidence": clamp_confidence(confidence),
+    }
+
+    # Add detailed geometry
+    geometry = {
+        "slant_angle": fh_dict["slant_angle"],
+        "forehead_height": fh_dict["forehead_height"],
+    }
+    extract_fields(geom, GEOMETRY_FIELDS, into=geometry)
+    if not geometry["width_height_ratio"] and geometry["forehead_height"] > 0:
+        geometry["width_height_ratio"] = geometry["forehead_width"] / geometry["forehead_height"]
+    fh_dict["geometry"] = geometry
+
+    # Add neuroscience correlations if available
+    nc = getattr(fh, 'neuroscience_correlations', None)
+    if nc:
+        neuroscience = _numeric_attributes(nc, NEUROSCIENCE_FIELDS)
+        if neuroscience:
+            fh_dict["neuroscience"] = neuroscience
+
+        # Add neurotransmitter and cognitive function predictions
+        fh_dict["neurotransmitters"] = extract_fields(nc, NEUROTRANSMITTER_FIELDS, cast=None)
+        fh_dict["cognitive_functions"] = extract_fields(nc, COGNITIVE_FIELDS, cast=None)
+
+    # Prefer dedicated neurotransmitter/cognitive objects when the SDK provides them
+    neurotransmitters = getattr(fh, 'neurotransmitters', None)
+    if neurotransmitters:
+        fh_dict["neurotransmitters"] = extract_fields(neurotransmitters, DIRECT_NEUROTRANSMITTER_FIELDS)
+
+    cognitive_functions = getattr(fh, 'cognitive_functions', None)
+    if cognitive_functions:
+        fh_dict["cognitive_functions"] = extract_fields(cognitive_functions, DIRECT_COGNITIVE_FIELDS)
+
+    # Add impulsivity profile (BIS-11 dimensions) if available
+    ip = getattr(fh, 'impulsivity_profile', None)
+    if ip:
+        fh_dict["impulsivity_profile"] = extract_fields(ip, IMPULSIVITY_FIELDS, cast=None)
+
+    # Add confidence intervals (95% CI) if available
+    ci = getattr(fh, 'confidence_intervals', None)
+    if ci:
+        fh_dict["confidence_intervals"] = {
+            "angle_95ci": ci.get('angle_95ci', None),
+            "impulsiveness_95ci": ci.get('impulsiveness_95ci', None),
+        }
+
+    # Add evidence level for scientific transparency
+    fh_dict.update(FOREHEAD_EVIDENCE)
+
+    return fh_dict
+
+
+def format_morphology_result(morph: Any) -> Dict[str, Any]:
+    """Format a morphology analysis result with proportions, shape distribution and symmetry."""
+    shape_class = morph.shape_classification
+    props = morph.facial_proportions
+    facial_index, width_height_ratio, confidence = to_floats(
+        (props.facial_index, props.facial_width_height_ratio, morph.measurement_confidence)
+    )
+    morph_dict = {
+        "face_shape": get_face_shape(morph),
+        "facial_index": facial_index,
+        "width_height_ratio": width_height_ratio,
+        "confidence": clamp_confidence(confidence),
+    }
+
+    # Add shape confidence if available
+    shape_confidence = getattr(shape_class, 'confidence', None)
+    if shape_confidence is not None:
+        morph_dict["shape_confidence"] = float(shape_confidence)
+
+    # Add detailed proportions
+    morph_dict["proportions"] = extract_fields(props, PROPORTION_FIELDS)
+
+    # Add shape probabilities distribution if available
+    shape_probabilities = getattr(shape_class, 'shape_probabilities', None)
+    secondary_shapes = getattr(shape_class, 'secondary_shapes', None)
+    if shape_probabilities:
+        morph_dict["shape_probabilities"] = dict(zip(
+            map(_shape_name, shape_probabilities.keys()),
+            to_floats(list(shape_probabilities.values())),
+        ))
+    elif secondary_shapes:
+        # Fallback: create probabilities from primary + secondary shapes,
+        # splitting the remaining probability evenly (max 4 secondary)
+        primary_prob = morph_dict.get("shape_confidence", 0.7)
+        secondary = secondary_shapes[:4]
+        share = (1.0 - primary_prob) / len(secondary)
+        shape_probs = {_shape_name(sec_shape): share for sec_shape in secondary}
+        morph_dict["shape_probabilities"] = {morph_dict["face_shape"]: primary_prob, **shape_probs}
+
+    # Add symmetry analysis if available
+    sym = getattr(morph, 'symmetry_analysis', None)
+    if sym:
+        morph_dict["symmetry"] = extract_fields(sym, SYMMETRY_FIELDS, cast=None)
+
+    return morph_dict
+
+
+def format_neoclassical_result(
+    neo: Any,
+    deviation_threshold: Optional[float] = None
+) -> Dict[str, Any]:
+    """
+    Format a neoclassical canons result.
+
+    Args:
+        neo: SDK neoclassical result
+        deviation_threshold: If given, a canon is within range when its absolute
+            deviation (%) is at most this value; otherwise the SDK's is_valid is used
+
+    Returns:
+        Dictionary with overall scores and per-canon measurements
+    """
+    neo_dict = extract_fields(neo, NEO_FIELDS)
+
+    # Extract individual canon measurements
+    canons = getattr(neo, 'canons', None)
+    if canons:
+        canons = list(canons)
+        # One (canons x fields) array: a single float conversion and a single
+        # vectorized threshold test instead of per-canon casts and comparisons
+        values = _field_matrix(canons, CANON_FIELDS)
+        if deviation_threshold is None:
+            within_range = [getattr(canon, 'is_valid', False) for canon in canons]
+        else:
+            within_range = within_mask(values[:, _DEVIATION_COLUMN], deviation_threshold).tolist()
+
+        canon_measurements = {}
+        for canon, row, within in zip(canons, values.tolist(), within_range):
+            canon_name = getattr(canon, 'canon_name', None)
+            if canon_name is None:
+                canon_name = f'Canon {len(canon_measurements)+1}'
+            canon_dict = dict(zip(CANON_KEYS, row))
+            canon_dict["within_range"] = within
+            extract_fields(canon, CANON_REFERENCE_FIELDS, into=canon_dict)
+            canon_measurements[canon_name] = canon_dict
+        neo_dict["canon_measurements"] = canon_measurements
+
+    # Add recommendations if available
+    recommendations = getattr(neo, 'recommendations', None)
+    if recommendations:
+        neo_dict["recommendations"] = list(recommendations)
+
+    return neo_dict
+
+
+def format_canon_measurements(canon_measurements: Mapping) -> Dict[str, Dict[str, Any]]:
+    """
+    Format the canon measurements of a standalone neoclassical analysis.
+
+    Args:
+        canon_measurements: Mapping of canon name to SDK canon measurement
+
+    Returns:
+        Dictionary of canon name to measured value, deviation, range flag and confidence
+    """
+    measurements = list(canon_measurements.values())
+    rows = _field_matrix(measurements, CANON_MEASUREMENT_FIELDS).tolist()
+    formatted = {}
+    for canon_name, measurement, row in zip(canon_measurements, measurements, rows):
+        canon_dict = dict(zip(CANON_MEASUREMENT_KEYS, row))
+        canon_dict["within_range"] = getattr(measurement, 'within_acceptable_range', False)
+        formatted[canon_name] = canon_dict
+    return formatted
+
@@ -0,0 +1,38 @@
+"""
+Markdown Prerendering
+Convert the static documentation markdown to HTML once on the server, so the
+browser receives ready HTML instead of parsing markdown on every render.
+"""
+
+from functools import lru_cache
+from typing import Optional
+
+# Python-Markdown is optional; without it the docs fall back to rx.markdown
+try:
+    import markdown as _markdown
+    HAS_MARKDOWN = True
+except ImportError:
+    _markdown = None
+    HAS_MARKDOWN = False
+
+# sane_lists keeps list parsing close to the GFM rules the docs were written for;
+# codehilite highlights fenced code with Pygments (inline styles, so no stylesheet
+# is needed) and falls back to plain <pre><code> when Pygments is missing
+_EXTENSIONS = ("fenced_code", "tables", "sane_lists", "codehilite")
+_EXTENSION_CONFIGS = {
+    "codehilite": {"guess_lang": False, "noclasses": True, "pygments_style": "monokai"},
+}
+
+
+@lru_cache(maxsize=32)
+def render_markdown_html(source: str) -> Optional[str]:
+    """Return the HTML for a markdown document, or None if Markdown is unavailable.
+
+    Cached per source string; the docs content is static, so each section is
+    converted once per process.
+    """
+    if not HAS_MARKDOWN:
+        return None
+    return _markdown.markdown(
+        source, extensions=list(_EXTENSIONS), extension_configs=_EXTENSION_CONFIGS
+    )
@@ -3,17 +3,24 @@ CAPA Service Module
 Encapsulates all CAPA SDK functionalities for use in Reflex.
 """
 
+import os
 import sys
+import copy
+import asyncio
+import atexit
+import threading
+import functools
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import cv2
-import numpy as np
-from typing import Optional, Dict, List, Any
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Final, Optional, Dict, List, Tuple, Any
 import traceback
-import json
 
-# Add parent directory to path to import capa
-parent_dir = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(parent_dir))
+# Add parent directory to path to import capa (once, even across hot reloads)
+parent_dir = str(Path(__file__).parent.parent.parent)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
 
 from capa import (
     CoreAnalyzer,
@@ -38,17 +45,210 @@ except ImportError:
     ResultsIntegrator = None
     EvidenceLevel = None
 
+if TYPE_CHECKING:
+    import numpy as np
+
+from ._formatters import (
+    BASIC_GEOMETRY_FIELDS,
+    BASIC_PROPORTION_FIELDS,
+    clamp_confidence,
+    extract_fields,
+    extract_personality,
+    format_canon_measurements,
+    format_wd_result,
+    format_forehead_result,
+    format_morphology_result,
+    format_neoclassical_result,
+    get_face_shape,
+    get_impulsiveness_level,
+    get_wd_classification,
+    to_floats,
+)
+
+
+# Fixed top-level schema of analyze_single_image results (copied per call)
+_SINGLE_RESULT_TEMPLATE = {
+    "success": True,
+    "wd_result": None,
+    "forehead_result": None,
+    "morphology_result": None,
+    "neoclassical_result": None,
+    "metadata": None
+}
+
+
+# Include formatted tracebacks in error results (set CAPA_DEMO_DEBUG=1)
+_DEBUG = os.environ.get("CAPA_DEMO_DEBUG", "").lower() in ("1", "true", "yes")
+
+# Analysis modes by name; unknown names fall back to STANDARD
+_MODE_LOOKUP = {m.name: m for m in AnalysisMode}
+_DEFAULT_MODE = "STANDARD"
+
+# Scientific threshold: ±10% deviation is acceptable
+# Note: SDK has per-canon tolerances (3-15%) from papers, but many are too strict
+# for practical use (e.g., Canon 1 has 3% tolerance, but only ~30% of population meets it)
+# Using uniform 10% threshold for consistent user experience
+_DEVIATION_THRESHOLD: Final = 10.0
+
+# WD measurements of analyze_wd_only as (output key, cm attribute, px attribute);
+# cm values are used when calibrated (non-zero) and the first entry decides the units
+_WD_MEASUREMENT_SPEC = (
+    ("wd_value", "wd_value_cm", "wd_value"),
+    ("bizygomatic_width", "bizygomatic_width_cm", "bizygomatic_width"),
+    ("bigonial_width", "bigonial_width_cm", "bigonial_width"),
+)
+
+# Result keys of analyze_all, one per single-module analyzer
+_MODULE_NAMES = ("wd", "forehead", "morphology", "neoclassical")
+
+# Top-level keys of the single-module results, in output order
+_FOREHEAD_ONLY_KEYS = ("success", "slant_angle", "forehead_height", "impulsiveness_level", "confidence")
+_MORPHOLOGY_ONLY_KEYS = ("success", "face_shape", "facial_index", "width_height_ratio", "confidence")
+
+
+@functools.lru_cache(maxsize=128)
+def _make_config(
+    mode: str,
+    enable_wd: bool,
+    enable_forehead: bool,
+    enable_morphology: bool,
+    enable_neoclassical: bool
+) -> AnalysisConfiguration:
+    """Build (once per flag combination) the AnalysisConfiguration for a mode and module set."""
+    return AnalysisConfiguration(
+        mode=_MODE_LOOKUP.get(mode) or AnalysisMode.STANDARD,
+        enable_wd_analysis=enable_wd,
+        enable_forehead_analysis=enable_forehead,
+        enable_morphology_analysis=enable_morphology,
+        enable_neoclassical_analysis=enable_neoclassical,
+    )
+
+
+@functools.lru_cache(maxsize=2)
+def _decode_image(image_path: str, mtime_ns: int) -> Optional["np.ndarray"]:
+    """
+    Decode an image file once per (path, mtime); the cached array is read-only.
+
+    Only the last couple of frames are kept: the cache exists so the analyzers of
+    one request share a decode, not to hold full-resolution images for the process.
+    """
+    import cv2  # Imported only when an image is actually decoded
+    image = cv2.imread(image_path)
+    if image is not None:
+        image.setflags(write=False)
+    return image
+
+
+def _load_image(image_path: str) -> Optional["np.ndarray"]:
+    """
+    Load an image for the single-module analyzers.
+
+    Returns the cached read-only array shared through _decode_image; the
+    _analyze_* methods hand each SDK analyzer its own writable copy of it.
+    """
+    try:
+        mtime_ns = os.stat(image_path).st_mtime_ns
+    except OSError:
+        return None
+    image = _decode_image(image_path, mtime_ns)
+    return image
+
+
+def _elapsed_seconds(start_ns: int) -> float:
+    """Seconds elapsed since a perf_counter_ns() reading (monotonic, ns resolution)."""
+    return (perf_counter_ns() - start_ns) / 1e9
+
+
+def _shutdown_quietly(analyzer: Any) -> None:
+    """Shut down an SDK analyzer, ignoring errors (used for background teardown)."""
+    try:
+        analyzer.shutdown()
+    except Exception:
+        pass
+
+
+def _modules_executed(
+    enable_wd: bool,
+    enable_forehead: bool,
+    enable_morphology: bool,
+    enable_neoclassical: bool
+) -> Dict[str, bool]:
+    """Build the modules_executed metadata entry."""
+    return {
+        "wd": enable_wd,
+        "forehead": enable_forehead,
+        "morphology": enable_morphology,
+        "neoclassical": enable_neoclassical,
+    }
+
 
 class CapaService:
     """Service class for CAPA SDK operations."""
 
+    # CoreAnalyzer instances keyed by (mode, enable_wd, enable_forehead,
+    # enable_morphology, enable_neoclassical). Shared by all service instances
+    # so the landmark/model load is paid once per configuration, not per image.
+    # Each analyzer is paired with a lock: concurrent requests may run different
+    # configurations in parallel, but a single analyzer is used by one thread at a time.
+    _analyzer_cache: Dict[tuple, Tuple[Any, threading.Lock]] = {}
+    _analyzer_cache_lock = threading.Lock()
+
+    # LRU cache of successful single-image results keyed by
+    # (image_path, mtime_ns, mode, module flags); mtime guards against stale entries
+    RESULT_CACHE_SIZE = 64
+    _result_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+    _result_cache_lock = threading.Lock()
+
+    # Shared pool for per-angle result formatting (avoids per-call thread startup)
+    _format_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="capa-format")
+
+    # Pool for running the four single-module analyzers side by side in analyze_all;
+    # the SDK spends most of its time in OpenCV/NumPy code that releases the GIL
+    _module_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="capa-module")
+
     def __init__(self):
-        self.core_analyzer = None
-        self.multi_angle_analyzer = None
+        # Single-module analyzers are shared by overlapping requests (analyze_all runs
+        # them on _module_executor); like the cached CoreAnalyzers, each is paired
+        # with a lock so one instance is used by one thread at a time
         self.wd_analyzer = WDAnalyzer()
+        self.wd_lock = threading.Lock()
         self.forehead_analyzer = ForeheadAnalyzer()
+        self.forehead_lock = threading.Lock()
         self.morphology_analyzer = MorphologyAnalyzer()
+        self.morphology_lock = threading.Lock()
         self.neoclassical_analyzer = NeoclassicalCanonsAnalyzer()
+        self.neoclassical_lock = threading.Lock()
+
+    def _get_core_analyzer(
+        self,
+        mode: str,
+        enable_wd: bool,
+        enable_forehead: bool,
+        enable_morphology: bool,
+        enable_neoclassical: bool
+    ) -> Tuple[CoreAnalyzer, threading.Lock]:
+        """Return the cached CoreAnalyzer (and its lock) for a configuration, creating it on first use."""
+        key = (mode, enable_wd, enable_forehead, enable_morphology, enable_neoclassical)
+        entry = CapaService._analyzer_cache.get(key)
+        if entry is None:
+            with CapaService._analyzer_cache_lock:
+                entry = CapaService._analyzer_cache.get(key)
+                if entry is None:
+                    config = _make_config(*key)
+                    entry = (CoreAnalyzer(config=config), threading.Lock())
+                    CapaService._analyzer_cache[key] = entry
+        return entry
+
+    @classmethod
+    def shutdown_analyzers(cls):
+        """Shut down all cached CoreAnalyzer instances."""
+        with cls._analyzer_cache_lock:
+            for analyzer, _ in cls._analyzer_cache.values():
+                try:
+                    analyzer.shutdown()
+                except Exception:
+                    pass
+            cls._analyzer_cache.clear()
 
     def analyze_single_image(
         self,
@@ -71,27 +271,59 @@ class CapaService:
             enable_neoclassical: Enable neoclassical canons analysis
 
         Returns:
-            Dictionary with analysis results
+            Dictionary with analysis results. Successful results are cached per
+            (image path, modification time, configuration); repeated calls return
+            a copy of the cached result.
         """
-        import time
-        start_time = time.time()
+        if mode not in _MODE_LOOKUP:
+            mode = _DEFAULT_MODE
+        flags = (enable_wd, enable_forehead, enable_morphology, enable_neoclassical)
 
         try:
-            # Create configuration
-            analysis_mode = AnalysisMode[mode]
-            config = AnalysisConfiguration(
-                mode=analysis_mode,
-                enable_wd_analysis=enable_wd,
-                enable_forehead_analysis=enable_forehead,
-                enable_morphology_analysis=enable_morphology,
-                enable_neoclassical_analysis=enable_neoclassical,
-            )
+            cache_key = (image_path, os.stat(image_path).st_mtime_ns, mode, flags)
+        except OSError:
+            cache_key = None  # Unreadable path: let the analyzer report the error
+
+        if cache_key is not None:
+            with CapaService._result_cache_lock:
+                cached = CapaService._result_cache.get(cache_key)
+                if cached is not None:
+                    CapaService._result_cache.move_to_end(cache_key)
+            if cached is not None:
+                return copy.deepcopy(cached)
 
-            # Initialize analyzer
-            self.core_analyzer = CoreAnalyzer(config=config)
+        results = self._run_single_image_analysis(image_path, mode, *flags)
+
+        if cache_key is not None and results.get("success"):
+            with CapaService._result_cache_lock:
+                CapaService._result_cache[cache_key] = copy.deepcopy(results)
+                while len(CapaService._result_cache) > self.RESULT_CACHE_SIZE:
+                    CapaService._result_cache.popitem(last=False)
+
+        return results
+
+    def _run_single_image_analysis(
+        self,
+        image_path: str,
+        mode: str,
+        enable_wd: bool,
+        enable_forehead: bool,
+        enable_morphology: bool,
+        enable_neoclassical: bool
+    ) -> Dict[str, Any]:
+        """Run the CoreAnalyzer on an image and format its results (uncached)."""
+        start_ns = perf_counter_ns()
+
+        try:
+            # Reuse analyzer for this configuration (avoids model reload per image).
+            # Kept local: the service is shared by concurrent requests
+            analyzer, analyzer_lock = self._get_core_analyzer(
+                mode, enable_wd, enable_forehead, enable_morphology, enable_neoclassical
+            )
 
             # Perform analysis
-            result = self.core_analyzer.analyze_image(image_path)
+            with analyzer_lock:
+                result = analyzer.analyze_image(image_path)
 
             if result is None:
                 return {
@@ -100,262 +332,39 @@ class CapaService:
                 }
 
             # Format results
-            results_dict = {
-                "success": True,
-                "wd_result": None,
-                "forehead_result": None,
-                "morphology_result": None,
-                "neoclassical_result": None,
-                "metadata": None
-            }
+            results_dict = _SINGLE_RESULT_TEMPLATE.copy()
 
             # WD Analysis results with full personality profile
             if result.wd_result:
-                wd = result.wd_result
-                wd_dict = {
-                    # Use cm values when available (paper-calibrated)
-                    "wd_value": float(wd.wd_value_cm) if hasattr(wd, 'wd_value_cm') and wd.wd_value_cm != 0 else float(wd.wd_value),
-                    "wd_value_px": float(wd.wd_value),  # Keep pixel value for reference
-                    "classification": wd.primary_classification.value,
-                    # Widths in cm when available
-                    "bizygomatic_width": float(wd.bizygomatic_width_cm) if hasattr(wd, 'bizygomatic_width_cm') and wd.bizygomatic_width_cm != 0 else float(wd.bizygomatic_width),
-                    "bizygomatic_width_px": float(wd.bizygomatic_width),
-                    "bigonial_width": float(wd.bigonial_width_cm) if hasattr(wd, 'bigonial_width_cm') and wd.bigonial_width_cm != 0 else float(wd.bigonial_width),
-                    "bigonial_width_px": float(wd.bigonial_width),
-                    "confidence": max(0.0, min(1.0, float(wd.measurement_confidence))),  # Clamp to 0-1
-                    "wd_ratio": float(wd.wd_ratio) if hasattr(wd, 'wd_ratio') else None,
-                    "normalized_wd_value": float(wd.normalized_wd_value) if hasattr(wd, 'normalized_wd_value') else None,
-                    # Demographic normalization data
-                    "demographic_percentile": float(wd.demographic_percentile) if hasattr(wd, 'demographic_percentile') else None,
-                    "robust_classification": wd.robust_classification if hasattr(wd, 'robust_classification') else None,
-                    # Flag to indicate if values are in cm
-                    "units": "cm" if hasattr(wd, 'wd_value_cm') and wd.wd_value_cm != 0 else "px",
-                }
-
-                # Add personality profile if available (use correct attribute names with _score suffix)
-                if hasattr(wd, 'personality_profile') and wd.personality_profile:
-                    pp = wd.personality_profile
-                    wd_dict["personality_profile"] = {
-                        "social_orientation": getattr(pp, 'social_orientation_score', getattr(pp, 'social_orientation', 'N/A')),
-                        "relational_field": getattr(pp, 'relational_field_score', getattr(pp, 'relational_field', 'N/A')),
-                        "communication_style": getattr(pp, 'communication_style_score', getattr(pp, 'communication_style', 'N/A')),
-                        "leadership": getattr(pp, 'leadership_tendency', getattr(pp, 'leadership', 'N/A')),
-                        "interpersonal_effectiveness": getattr(pp, 'interpersonal_effectiveness', 'N/A'),
-                        "emotional_expressiveness": getattr(pp, 'emotional_expressiveness', 'N/A'),
-                        "social_energy_level": getattr(pp, 'social_energy_level', 'N/A'),
-                        "conflict_resolution_style": getattr(pp, 'conflict_resolution_style', 'N/A'),
-                    }
-
-                # Add secondary traits if available
-                if hasattr(wd, 'secondary_traits') and wd.secondary_traits:
-                    wd_dict["secondary_traits"] = list(wd.secondary_traits)
-
-                # Add Z-score demographic data if available
-                if hasattr(wd, 'normalized_wd_z_score') and wd.normalized_wd_z_score is not None:
-                    wd_dict["demographic_data"] = {
-                        "z_score": float(wd.normalized_wd_z_score),
-                        "percentile": float(wd.demographic_percentile) if hasattr(wd, 'demographic_percentile') and wd.demographic_percentile else 50.0,
-                        "robust_classification": wd.robust_classification if hasattr(wd, 'robust_classification') else None,
-                        "reference_population": getattr(wd, 'demographic_reference', {}) if hasattr(wd, 'demographic_reference') else None,
-                    }
-
-                # Add evidence level for scientific transparency
-                wd_dict["evidence_level"] = "validated"
-                wd_dict["paper_reference"] = "Lefevre et al. (2012) - fWHR correlations"
-
-                results_dict["wd_result"] = wd_dict
+                results_dict["wd_result"] = format_wd_result(result.wd_result)
 
             # Forehead Analysis results with full geometry
             if result.forehead_result:
-                fh = result.forehead_result
-                fh_dict = {
-                    "slant_angle": float(fh.forehead_geometry.slant_angle_degrees),
-                    "forehead_height": float(fh.forehead_geometry.forehead_height),
-                    "impulsiveness_level": fh.impulsiveness_level.value,
-                    "confidence": float(fh.measurement_confidence),
-                }
-
-                # Add detailed geometry
-                geom = fh.forehead_geometry
-                fh_dict["geometry"] = {
-                    "slant_angle": float(geom.slant_angle_degrees),
-                    "forehead_height": float(geom.forehead_height),
-                    "forehead_width": float(geom.forehead_width) if hasattr(geom, 'forehead_width') else 0,
-                    "curvature": float(geom.forehead_curvature) if hasattr(geom, 'forehead_curvature') else 0,
-                    "frontal_prominence": float(geom.frontal_prominence) if hasattr(geom, 'frontal_prominence') else 0,
-                    "temporal_width": float(geom.temporal_width) if hasattr(geom, 'temporal_width') else 0,
-                    "width_height_ratio": float(geom.width_height_ratio) if hasattr(geom, 'width_height_ratio') else 0,
-                }
-
-                # Add neuroscience correlations if available
-                if hasattr(fh, 'neuroscience_correlations') and fh.neuroscience_correlations:
-                    nc = fh.neuroscience_correlations
-                    fh_dict["neuroscience"] = {
-                        "cortical_thickness_correlation": getattr(nc, 'cortical_thickness_correlation', None),
-                        "gray_matter_volume_correlation": getattr(nc, 'gray_matter_volume_correlation', None),
-                        "prefrontal_activity_indicator": getattr(nc, 'prefrontal_activity_indicator', None),
-                    }
-
-                    # Add neurotransmitter predictions
-                    fh_dict["neurotransmitters"] = {
-                        "dopamine_activity": getattr(nc, 'dopamine_system_activity', None),
-                        "serotonin_balance": getattr(nc, 'serotonin_system_balance', None),
-                        "gaba_function": getattr(nc, 'gaba_system_function', None),
-                    }
-
-                    # Add cognitive function predictions
-                    fh_dict["cognitive_functions"] = {
-                        "executive_function": getattr(nc, 'executive_function_score', None),
-                        "working_memory": getattr(nc, 'working_memory_capacity', None),
-                        "attention_control": getattr(nc, 'attention_control_score', None),
-                        "cognitive_flexibility": getattr(nc, 'cognitive_flexibility', None),
-                        "inhibitory_control": getattr(nc, 'inhibitory_control', None),
-                    }
-
-                # Add impulsivity profile (BIS-11 dimensions) if available
-                if hasattr(fh, 'impulsivity_profile') and fh.impulsivity_profile:
-                    ip = fh.impulsivity_profile
-                    fh_dict["impulsivity_profile"] = {
-                        "motor_impulsiveness": getattr(ip, 'motor_impulsiveness', None),
-                        "cognitive_impulsiveness": getattr(ip, 'cognitive_impulsiveness', None),
-                        "non_planning_impulsiveness": getattr(ip, 'non_planning_impulsiveness', None),
-                        "attentional_impulsiveness": getattr(ip, 'attentional_impulsiveness', None),
-                        "risk_taking_tendency": getattr(ip, 'risk_taking_tendency', None),
-                        "sensation_seeking": getattr(ip, 'sensation_seeking', None),
-                        "behavioral_inhibition": getattr(ip, 'behavioral_inhibition', None),
-                        "emotional_regulation": getattr(ip, 'emotional_regulation', None),
-                    }
-
-                # Add confidence intervals (95% CI) if available
-                if hasattr(fh, 'confidence_intervals') and fh.confidence_intervals:
-                    ci = fh.confidence_intervals
-                    fh_dict["confidence_intervals"] = {
-                        "angle_95ci": ci.get('angle_95ci', None),
-                        "impulsiveness_95ci": ci.get('impulsiveness_95ci', None),
-                    }
-
-                # Add evidence level for scientific transparency
-                fh_dict["evidence_level"] = "validated"
-                fh_dict["paper_reference"] = "Guerrero-Apolo et al. (2018) - FID-BIS11 correlation"
-
-                results_dict["forehead_result"] = fh_dict
+                results_dict["forehead_result"] = format_forehead_result(result.forehead_result)
 
             # Morphology Analysis results with full proportions
             if result.morphology_result:
-                morph = result.morphology_result
-                morph_dict = {
-                    "face_shape": morph.shape_classification.primary_shape.value,
-                    "facial_index": float(morph.facial_proportions.facial_index),
-                    "width_height_ratio": float(morph.facial_proportions.facial_width_height_ratio),
-                    "confidence": float(morph.measurement_confidence),
-                }
-
-                # Add shape confidence if available
-                if hasattr(morph.shape_classification, 'confidence'):
-                    morph_dict["shape_confidence"] = float(morph.shape_classification.confidence)
-
-                # Add detailed proportions
-                props = morph.facial_proportions
-                morph_dict["proportions"] = {
-                    "upper_face_ratio": float(props.upper_face_ratio) if hasattr(props, 'upper_face_ratio') else 0,
-                    "middle_face_ratio": float(props.middle_face_ratio) if hasattr(props, 'middle_face_ratio') else 0,
-                    "lower_face_ratio": float(props.lower_face_ratio) if hasattr(props, 'lower_face_ratio') else 0,
-                    "bizygomatic_width": float(props.bizygomatic_width) if hasattr(props, 'bizygomatic_width') else 0,
-                    "bigonial_width": float(props.bigonial_width) if hasattr(props, 'bigonial_width') else 0,
-                    "facial_width": float(props.bizygomatic_width) if hasattr(props, 'bizygomatic_width') else 0,
-                    "facial_height": float(props.total_face_height) if hasattr(props, 'total_face_height') else 0,
-                    "facial_index": float(props.facial_index) if hasattr(props, 'facial_index') else 0,
-                    "nasal_width": float(props.nasal_width) if hasattr(props, 'nasal_width') else 0,
-                    "mouth_width": float(props.mouth_width) if hasattr(props, 'mouth_width') else 0,
-                }
-
-                # Add shape probabilities distribution if available
-                shape_class = morph.shape_classification
-                if hasattr(shape_class, 'shape_probabilities') and shape_class.shape_probabilities:
-                    morph_dict["shape_probabilities"] = {
-                        shape.value if hasattr(shape, 'value') else str(shape): float(prob)
-                        for shape, prob in shape_class.shape_probabilities.items()
-                    }
-                elif hasattr(shape_class, 'secondary_shapes') and shape_class.secondary_shapes:
-                    # Fallback: create probabilities from primary + secondary shapes
-                    morph_dict["shape_probabilities"] = {
-                        shape_class.primary_shape.value: float(shape_class.confidence) if hasattr(shape_class, 'confidence') else 0.7,
-                    }
-                    remaining_prob = 1.0 - morph_dict["shape_probabilities"][shape_class.primary_shape.value]
-                    for i, sec_shape in enumerate(shape_class.secondary_shapes[:4]):  # Max 4 secondary
-                        shape_name = sec_shape.value if hasattr(sec_shape, 'value') else str(sec_shape)
-                        morph_dict["shape_probabilities"][shape_name] = remaining_prob / len(shape_class.secondary_shapes[:4])
-
-                # Add symmetry analysis if available
-                if hasattr(morph, 'symmetry_analysis') and morph.symmetry_analysis:
-                    sym = morph.symmetry_analysis
-                    morph_dict["symmetry"] = {
-                        "horizontal_symmetry": getattr(sym, 'horizontal_symmetry', None),
-                        "vertical_symmetry": getattr(sym, 'vertical_symmetry', None),
-                        "overall_symmetry": getattr(sym, 'overall_symmetry', None),
-                    }
-
-                results_dict["morphology_result"] = morph_dict
+                results_dict["morphology_result"] = format_morphology_result(result.morphology_result)
 
             # Neoclassical Canons results
             if result.neoclassical_result:
-                neo = result.neoclassical_result
-                neo_dict = {
-                    "overall_score": float(neo.overall_validity_score) if hasattr(neo, 'overall_validity_score') else 0.0,
-                    "beauty_score": float(neo.beauty_score) if hasattr(neo, 'beauty_score') else None,
-                    "proportion_balance": float(neo.proportion_balance) if hasattr(neo, 'proportion_balance') else None,
-                    "confidence": float(neo.confidence) if hasattr(neo, 'confidence') else 0.0,
-                }
-
-                # Extract individual canon measurements
-                if hasattr(neo, 'canons') and neo.canons:
-                    canon_measurements = {}
-                    for canon in neo.canons:
-                        canon_name = getattr(canon, 'canon_name', f'Canon {len(canon_measurements)+1}')
-                        canon_measurements[canon_name] = {
-                            "measured_value": float(getattr(canon, 'measured_ratio', 0)),
-                            "deviation": float(canon.deviation_percentage) if hasattr(canon, 'deviation_percentage') else 0,
-                            "within_range": canon.is_valid if hasattr(canon, 'is_valid') else False,
-                            "confidence": float(getattr(canon, 'confidence', 0.8)),
-                        }
-                    neo_dict["canon_measurements"] = canon_measurements
-
-                # Add recommendations if available
-                if hasattr(neo, 'recommendations') and neo.recommendations:
-                    neo_dict["recommendations"] = list(neo.recommendations)
-
-                results_dict["neoclassical_result"] = neo_dict
+                results_dict["neoclassical_result"] = format_neoclassical_result(result.neoclassical_result)
 
             # Processing metadata
+            # (provided even if processing_metadata is None)
+            overall_conf = 0.0
             if result.processing_metadata:
                 # Clamp confidence to valid range
-                overall_conf = float(result.processing_metadata.overall_confidence)
-                overall_conf = max(0.0, min(1.0, overall_conf))
-
-                results_dict["metadata"] = {
-                    "overall_confidence": overall_conf,
-                    "processing_time": time.time() - start_time,  # Use actual elapsed time
-                    "analysis_mode": mode,
-                    "modules_executed": {
-                        "wd": enable_wd,
-                        "forehead": enable_forehead,
-                        "morphology": enable_morphology,
-                        "neoclassical": enable_neoclassical,
-                    }
-                }
-            else:
-                # Provide metadata even if processing_metadata is None
-                results_dict["metadata"] = {
-                    "overall_confidence": 0.0,
-                    "processing_time": time.time() - start_time,
-                    "analysis_mode": mode,
-                    "modules_executed": {
-                        "wd": enable_wd,
-                        "forehead": enable_forehead,
-                        "morphology": enable_morphology,
-                        "neoclassical": enable_neoclassical,
-                    }
-                }
+                overall_conf = clamp_confidence(float(result.processing_metadata.overall_confidence))
+
+            results_dict["metadata"] = {
+                "overall_confidence": overall_conf,
+                "processing_time": _elapsed_seconds(start_ns),  # Use actual elapsed time
+                "analysis_mode": mode,
+                "modules_executed": _modules_executed(
+                    enable_wd, enable_forehead, enable_morphology, enable_neoclassical
+                ),
+            }
 
             return results_dict
 
@@ -363,17 +372,17 @@ class CapaService:
             return {
                 "success": False,
                 "error": f"Error during analysis: {str(e)}",
-                "traceback": traceback.format_exc()
+                "traceback": traceback.format_exc() if _DEBUG else None
             }
-        finally:
-            if self.core_analyzer:
-                self.core_analyzer.shutdown()
-                self.core_analyzer = None
 
     def analyze_multi_angle(
         self,
         image_paths: List[Dict[str, str]],
-        subject_id: str = "subject_001"
+        subject_id: str = "subject_001",
+        enable_wd: bool = True,
+        enable_forehead: bool = True,
+        enable_morphology: bool = True,
+        enable_neoclassical: bool = True
     ) -> Dict[str, Any]:
         """
         Perform multi-angle analysis.
@@ -381,15 +390,20 @@ class CapaService:
         Args:
             image_paths: List of dicts with 'path' and 'angle_type' keys
             subject_id: Subject identifier
+            enable_wd: Format WD results
+            enable_forehead: Format forehead results
+            enable_morphology: Format morphology results
+            enable_neoclassical: Format neoclassical canons results
 
         Returns:
             Dictionary with combined results
         """
-        import time
-        start_time = time.time()
+        start_ns = perf_counter_ns()
+        # Local rather than an attribute: concurrent requests share the service instance
+        multi_angle_analyzer = None
 
         try:
-            self.multi_angle_analyzer = MultiAngleAnalyzer()
+            multi_angle_analyzer = MultiAngleAnalyzer()
 
             # Create angle specifications
             angle_specs = []
@@ -403,7 +417,7 @@ class CapaService:
                 angle_specs.append(spec)
 
             # Perform analysis
-            result = self.multi_angle_analyzer.analyze_multiple_angles(
+            result = multi_angle_analyzer.analyze_multiple_angles(
                 angle_specs=angle_specs,
                 subject_id=subject_id
             )
@@ -411,9 +425,12 @@ class CapaService:
             # Clamp confidence to valid range (SDK sometimes returns corrupted values)
             combined_conf = float(result.combined_confidence) if result.combined_confidence else None
             if combined_conf is not None:
-                combined_conf = max(0.0, min(1.0, combined_conf))
+                combined_conf = clamp_confidence(combined_conf)
 
             # Format results
+            modules_executed = _modules_executed(
+                enable_wd, enable_forehead, enable_morphology, enable_neoclassical
+            )
             results_dict = {
                 "success": True,
                 "subject_id": subject_id,
@@ -424,180 +441,27 @@ class CapaService:
                 "combined_confidence": combined_conf,
                 "angle_results": {},
                 "metadata": {
-                    "processing_time": time.time() - start_time,
+                    "processing_time": 0.0,  # Set once formatting is done
                     "analysis_type": "multi_angle",
+                    "modules_executed": modules_executed,
                 }
             }
 
-            # Extract detailed results from individual angle analyses
-            for angle, angle_result in result.angle_results.items():
-                if angle_result:
-                    angle_data = {"status": "Success"}
-
-                    # Extract WD details from frontal analysis
-                    if angle_result.wd_result and angle == "frontal":
-                        wd = angle_result.wd_result
-                        # Clamp WD confidence
-                        wd_conf = float(wd.measurement_confidence)
-                        wd_conf = max(0.0, min(1.0, wd_conf))
-
-                        results_dict["wd_result"] = {
-                            "wd_value": float(wd.wd_value_cm) if hasattr(wd, 'wd_value_cm') and wd.wd_value_cm != 0 else float(wd.wd_value),
-                            "wd_value_px": float(wd.wd_value),
-                            "classification": wd.primary_classification.value,
-                            "bizygomatic_width": float(wd.bizygomatic_width_cm) if hasattr(wd, 'bizygomatic_width_cm') and wd.bizygomatic_width_cm != 0 else float(wd.bizygomatic_width),
-                            "bizygomatic_width_px": float(wd.bizygomatic_width),
-                            "bigonial_width": float(wd.bigonial_width_cm) if hasattr(wd, 'bigonial_width_cm') and wd.bigonial_width_cm != 0 else float(wd.bigonial_width),
-                            "bigonial_width_px": float(wd.bigonial_width),
-                            "confidence": wd_conf,
-                            "units": "cm" if hasattr(wd, 'wd_value_cm') and wd.wd_value_cm != 0 else "px",
-                        }
-
-                        # Add personality profile if available
-                        if hasattr(wd, 'personality_profile') and wd.personality_profile:
-                            pp = wd.personality_profile
-                            results_dict["wd_result"]["personality_profile"] = {
-                                "social_orientation": getattr(pp, 'social_orientation_score', getattr(pp, 'social_orientation', 'N/A')),
-                                "relational_field": getattr(pp, 'relational_field_score', getattr(pp, 'relational_field', 'N/A')),
-                                "communication_style": getattr(pp, 'communication_style_score', getattr(pp, 'communication_style', 'N/A')),
-                                "leadership": getattr(pp, 'leadership_tendency', getattr(pp, 'leadership', 'N/A')),
-                                "interpersonal_effectiveness": getattr(pp, 'interpersonal_effectiveness', 'N/A'),
-                                "emotional_expressiveness": getattr(pp, 'emotional_expressiveness', 'N/A'),
-                                "social_energy_level": getattr(pp, 'social_energy_level', 'N/A'),
-                                "conflict_resolution_style": getattr(pp, 'conflict_resolution_style', 'N/A'),
-                            }
-
-                    # Extract forehead details from profile analysis
-                    if angle_result.forehead_result and angle == "profile":
-                        fh = angle_result.forehead_result
-                        # Clamp forehead confidence
-                        fh_conf = float(fh.measurement_confidence)
-                        fh_conf = max(0.0, min(1.0, fh_conf))
-
-                        results_dict["forehead_result"] = {
-                            "slant_angle": float(fh.forehead_geometry.slant_angle_degrees),
-                            "forehead_height": float(fh.forehead_geometry.forehead_height),
-                            "impulsiveness_level": fh.impulsiveness_level.value,
-                            "confidence": fh_conf,
-                        }
-
-                        # Add geometry details
-                        geom = fh.forehead_geometry
-                        results_dict["forehead_result"]["geometry"] = {
-                            "slant_angle": float(geom.slant_angle_degrees),
-                            "forehead_height": float(geom.forehead_height),
-                            "forehead_width": float(geom.forehead_width) if hasattr(geom, 'forehead_width') else 0,
-                            "curvature": float(geom.forehead_curvature) if hasattr(geom, 'forehead_curvature') else 0,
-                            "frontal_prominence": float(geom.frontal_prominence) if hasattr(geom, 'frontal_prominence') else 0,
-                            "width_height_ratio": float(geom.forehead_width / geom.forehead_height) if hasattr(geom, 'forehead_width') and geom.forehead_height > 0 else 0,
-                        }
-
-                        # Extract neuroscience correlations if available
-                        if hasattr(fh, 'neurotransmitters') and fh.neurotransmitters:
-                            results_dict["forehead_result"]["neurotransmitters"] = {
-                                "dopamine_activity": float(getattr(fh.neurotransmitters, 'dopamine_activity', 0)),
-                                "serotonin_balance": float(getattr(fh.neurotransmitters, 'serotonin_balance', 0)),
-                                "gaba_function": float(getattr(fh.neurotransmitters, 'gaba_function', 0)),
-                            }
-
-                        if hasattr(fh, 'cognitive_functions') and fh.cognitive_functions:
-                            results_dict["forehead_result"]["cognitive_functions"] = {
-                                "executive_function": float(getattr(fh.cognitive_functions, 'executive_function', 0)),
-                                "working_memory": float(getattr(fh.cognitive_functions, 'working_memory', 0)),
-                                "attention_control": float(getattr(fh.cognitive_functions, 'attention_control', 0)),
-                            }
-
-                        if hasattr(fh, 'neuroscience_correlations') and fh.neuroscience_correlations:
-                            nc = fh.neuroscience_correlations
-                            nc_attrs = [attr for attr in dir(nc) if not attr.startswith('_')]
-
-                            # Dynamically extract all numeric attributes
-                            nc_dict = {}
-                            for attr in nc_attrs:
-                                try:
-                                    val = getattr(nc, attr)
-                                    if isinstance(val, (int, float)):
-                                        nc_dict[attr] = float(val)
-                                except Exception:
-                                    pass
-
-                            if nc_dict:
-                                results_dict["forehead_result"]["neuroscience"] = nc_dict
-
-                    # Extract morphology details from frontal analysis
-                    if angle_result.morphology_result and angle == "frontal":
-                        morph = angle_result.morphology_result
-                        # Clamp morphology confidence
-                        morph_conf = float(morph.measurement_confidence)
-                        morph_conf = max(0.0, min(1.0, morph_conf))
-
-                        results_dict["morphology_result"] = {
-                            "face_shape": morph.shape_classification.primary_shape.value,
-                            "facial_index": float(morph.facial_proportions.facial_index),
-                            "width_height_ratio": float(morph.facial_proportions.facial_width_height_ratio),
-                            "confidence": morph_conf,
-                        }
-
-                        # Add proportions
-                        props = morph.facial_proportions
-                        results_dict["morphology_result"]["proportions"] = {
-                            "upper_face_ratio": float(props.upper_face_ratio) if hasattr(props, 'upper_face_ratio') else 0,
-                            "middle_face_ratio": float(props.middle_face_ratio) if hasattr(props, 'middle_face_ratio') else 0,
-                            "lower_face_ratio": float(props.lower_face_ratio) if hasattr(props, 'lower_face_ratio') else 0,
-                            "facial_width": float(props.bizygomatic_width) if hasattr(props, 'bizygomatic_width') else 0,
-                            "facial_height": float(props.total_face_height) if hasattr(props, 'total_face_height') else 0,
-                        }
-
-                    # Extract neoclassical canons from frontal analysis
-                    if angle_result.neoclassical_result and angle == "frontal":
-                        neo = angle_result.neoclassical_result
-                        neo_dict = {
-                            "overall_score": float(neo.overall_validity_score) if hasattr(neo, 'overall_validity_score') else 0.0,
-                            "beauty_score": float(neo.beauty_score) if hasattr(neo, 'beauty_score') else None,
-                            "proportion_balance": float(neo.proportion_balance) if hasattr(neo, 'proportion_balance') else None,
-                            "confidence": float(neo.confidence) if hasattr(neo, 'confidence') else 0.0,
-                        }
-
-                        # Extract individual canon measurements
-                        if hasattr(neo, 'canons') and neo.canons:
-                            canon_measurements = {}
-
-                            # Scientific threshold: ±10% deviation is acceptable
-                            # Note: SDK has per-canon tolerances (3-15%) from papers, but many are too strict
-                            # for practical use (e.g., Canon 1 has 3% tolerance, but only ~30% of population meets it)
-                            # Using uniform 10% threshold for consistent user experience
-                            DEVIATION_THRESHOLD = 10.0
-
-                            for canon in neo.canons:
-                                canon_name = getattr(canon, 'canon_name', f'Canon {len(canon_measurements)+1}')
-                                deviation = float(canon.deviation_percentage) if hasattr(canon, 'deviation_percentage') else 0
-
-                                # Use uniform 10% threshold for practical validity assessment
-                                # SDK's per-canon tolerances are too strict for demo purposes
-                                is_within_range = abs(deviation) <= DEVIATION_THRESHOLD
-
-                                # Keep SDK validity_score for reference
-                                validity_score = float(getattr(canon, 'validity_score', 0)) if hasattr(canon, 'validity_score') else None
-
-                                canon_measurements[canon_name] = {
-                                    "measured_value": float(getattr(canon, 'measured_ratio', 0)),
-                                    "deviation": deviation,
-                                    "within_range": is_within_range,
-                                    "confidence": float(getattr(canon, 'confidence', 0.8)),
-                                    "validity_score": validity_score,
-                                    "expected_ratio": float(getattr(canon, 'expected_ratio', 0)) if hasattr(canon, 'expected_ratio') else None,
-                                    "acceptable_deviation": float(getattr(canon, 'acceptable_deviation', 0)) if hasattr(canon, 'acceptable_deviation') else None,
-                                }
-                            neo_dict["canon_measurements"] = canon_measurements
-
-                        results_dict["neoclassical_result"] = neo_dict
-
-                    results_dict["angle_results"][angle] = angle_data
-                else:
-                    results_dict["angle_results"][angle] = {"status": "Failed"}
+            # Extract detailed results from individual angle analyses.
+            # Angles are independent, so they are formatted concurrently.
+            angle_items = list(result.angle_results.items())
+            formatted = self._format_executor.map(
+                lambda item: self._format_angle(*item, modules_executed), angle_items
+            )
+            angle_status = results_dict["angle_results"]
+            for (angle, angle_result), module_results in zip(angle_items, formatted):
+                # Each entry stays a fresh plain dict: results are stored in Reflex
+                # state, which needs real dicts and must not alias across analyses
+                angle_status[angle] = {"status": "Success" if angle_result else "Failed"}
+                results_dict.update(module_results)
 
             # Update processing time
-            results_dict["metadata"]["processing_time"] = time.time() - start_time
+            results_dict["metadata"]["processing_time"] = _elapsed_seconds(start_ns)
 
             return results_dict
 
@@ -605,51 +469,106 @@ class CapaService:
             return {
                 "success": False,
                 "error": f"Error during multi-angle analysis: {str(e)}",
-                "traceback": traceback.format_exc()
+                "traceback": traceback.format_exc() if _DEBUG else None
             }
         finally:
-            if self.multi_angle_analyzer:
-                self.multi_angle_analyzer.shutdown()
-                self.multi_angle_analyzer = None
+            if multi_angle_analyzer:
+                # SDK shutdown joins worker threads; don't make the response wait for it
+                threading.Thread(
+                    target=_shutdown_quietly, args=(multi_angle_analyzer,),
+                    name="capa-multi-angle-shutdown", daemon=True,
+                ).start()
+
+    async def analyze_single_image_async(self, image_path: str, **kwargs) -> Dict[str, Any]:
+        """Run analyze_single_image in a worker thread so the event loop stays responsive."""
+        return await asyncio.to_thread(self.analyze_single_image, image_path, **kwargs)
+
+    async def analyze_multi_angle_async(
+        self,
+        image_paths: List[Dict[str, str]],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Run analyze_multi_angle in a worker thread so the event loop stays responsive."""
+        return await asyncio.to_thread(self.analyze_multi_angle, image_paths, **kwargs)
+
+    @staticmethod
+    def _format_angle(angle: str, angle_result: Any, modules: Dict[str, bool]) -> Dict[str, Any]:
+        """Format the enabled module results contributed by one angle of a multi-angle analysis."""
+        formatted = {}
+        if not angle_result:
+            return formatted
+
+        # Extract WD details from frontal analysis
+        if modules["wd"] and angle == "frontal" and angle_result.wd_result:
+            formatted["wd_result"] = format_wd_result(angle_result.wd_result)
+
+        # Extract forehead details from profile analysis
+        if modules["forehead"] and angle == "profile" and angle_result.forehead_result:
+            formatted["forehead_result"] = format_forehead_result(angle_result.forehead_result)
+
+        # Extract morphology details from frontal analysis
+        if modules["morphology"] and angle == "frontal" and angle_result.morphology_result:
+            formatted["morphology_result"] = format_morphology_result(angle_result.morphology_result)
+
+        # Extract neoclassical canons from frontal analysis
+        if modules["neoclassical"] and angle == "frontal" and angle_result.neoclassical_result:
+            formatted["neoclassical_result"] = format_neoclassical_result(
+                angle_result.neoclassical_result,
+                deviation_threshold=_DEVIATION_THRESHOLD,
+            )
+
+        return formatted
+
+    @staticmethod
+    def _run_on_image(analyze, image_path: str, *args) -> Dict[str, Any]:
+        """Load image_path and pass the decoded array to one of the _analyze_* methods."""
+        try:
+            image = _load_image(image_path)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        return analyze(image, *args)
 
     def analyze_wd_only(self, image_path: str) -> Dict[str, Any]:
         """Analyze WD (bizygomatic width) only."""
+        return self._run_on_image(self._analyze_wd, image_path)
+
+    def _analyze_wd(self, image: Optional["np.ndarray"]) -> Dict[str, Any]:
+        """Run the WD analyzer on a decoded image (see analyze_wd_only)."""
         try:
-            image = cv2.imread(image_path)
             if image is None:
                 return {"success": False, "error": "Could not load image"}
 
-            result = self.wd_analyzer.analyze_image(image)
+            # SDK analyzers may draw on their input, so each gets a writable copy of
+            # the shared read-only decode (freed as soon as the call returns)
+            with self.wd_lock:
+                result = self.wd_analyzer.analyze_image(image.copy())
+            # Drop our reference to the decoded image before building the result dict
+            del image
             if not result:
                 return {"success": False, "error": "Analysis failed"}
 
-            wd_dict = {
-                "success": True,
-                # Use cm values when available
-                "wd_value": float(result.wd_value_cm) if hasattr(result, 'wd_value_cm') and result.wd_value_cm != 0 else float(result.wd_value),
-                "wd_value_px": float(result.wd_value),
-                "bizygomatic_width": float(result.bizygomatic_width_cm) if hasattr(result, 'bizygomatic_width_cm') and result.bizygomatic_width_cm != 0 else float(result.bizygomatic_width),
-                "bizygomatic_width_px": float(result.bizygomatic_width),
-                "bigonial_width": float(result.bigonial_width_cm) if hasattr(result, 'bigonial_width_cm') and result.bigonial_width_cm != 0 else float(result.bigonial_width),
-                "bigonial_width_px": float(result.bigonial_width),
-                "classification": result.primary_classification.value,
-                "confidence": float(result.measurement_confidence),
-                "units": "cm" if hasattr(result, 'wd_value_cm') and result.wd_value_cm != 0 else "px",
-            }
+            # px values, cm values and confidence converted in one batch
+            n = len(_WD_MEASUREMENT_SPEC)
+            values = to_floats(
+                [getattr(result, px_attr) for _, _, px_attr in _WD_MEASUREMENT_SPEC]
+                + [getattr(result, cm_attr, None) or 0 for _, cm_attr, _ in _WD_MEASUREMENT_SPEC]
+                + [result.measurement_confidence]
+            )
+            px_values, cm_values = values[:n], values[n:2 * n]
+
+            # Use cm values when available, keeping pixel values for reference
+            wd_dict = {"success": True}
+            for (key, _, _), px_value, cm_value in zip(_WD_MEASUREMENT_SPEC, px_values, cm_values):
+                wd_dict[key] = cm_value if cm_value else px_value
+                wd_dict[key + "_px"] = px_value
+            wd_dict["classification"] = get_wd_classification(result)
+            wd_dict["confidence"] = values[-1]
+            wd_dict["units"] = "cm" if cm_values[0] else "px"
 
             # Add personality profile if available (use correct attribute names)
-            if hasattr(result, 'personality_profile') and result.personality_profile:
-                pp = result.personality_profile
-                wd_dict["personality_profile"] = {
-                    "social_orientation": getattr(pp, 'social_orientation_score', getattr(pp, 'social_orientation', 'N/A')),
-                    "relational_field": getattr(pp, 'relational_field_score', getattr(pp, 'relational_field', 'N/A')),
-                    "communication_style": getattr(pp, 'communication_style_score', getattr(pp, 'communication_style', 'N/A')),
-                    "leadership": getattr(pp, 'leadership_tendency', getattr(pp, 'leadership', 'N/A')),
-                    "interpersonal_effectiveness": getattr(pp, 'interpersonal_effectiveness', 'N/A'),
-                    "emotional_expressiveness": getattr(pp, 'emotional_expressiveness', 'N/A'),
-                    "social_energy_level": getattr(pp, 'social_energy_level', 'N/A'),
-                    "conflict_resolution_style": getattr(pp, 'conflict_resolution_style', 'N/A'),
-                }
+            pp = getattr(result, 'personality_profile', None)
+            if pp:
+                wd_dict["personality_profile"] = extract_personality(pp)
 
             return wd_dict
         except Exception as e:
@@ -657,32 +576,37 @@ class CapaService:
 
     def analyze_forehead_only(self, image_path: str) -> Dict[str, Any]:
         """Analyze forehead inclination only."""
+        return self._run_on_image(self._analyze_forehead, image_path)
+
+    def _analyze_forehead(self, image: Optional["np.ndarray"]) -> Dict[str, Any]:
+        """Run the forehead analyzer on a decoded image (see analyze_forehead_only)."""
         try:
-            image = cv2.imread(image_path)
             if image is None:
                 return {"success": False, "error": "Could not load image"}
 
-            result = self.forehead_analyzer.analyze_image(image)
+            with self.forehead_lock:
+                result = self.forehead_analyzer.analyze_image(image.copy())
+            del image
             if not result:
                 return {"success": False, "error": "Analysis failed"}
 
-            fh_dict = {
-                "success": True,
-                "slant_angle": float(result.forehead_geometry.slant_angle_degrees),
-                "forehead_height": float(result.forehead_geometry.forehead_height),
-                "impulsiveness_level": result.impulsiveness_level.value,
-                "confidence": float(result.measurement_confidence),
-            }
+            geom = result.forehead_geometry
+            slant_angle, forehead_height, confidence = to_floats(
+                (geom.slant_angle_degrees, geom.forehead_height, result.measurement_confidence)
+            )
+            fh_dict = dict(zip(_FOREHEAD_ONLY_KEYS, (
+                True,
+                slant_angle,
+                forehead_height,
+                get_impulsiveness_level(result),
+                confidence,
+            )))
 
             # Add detailed geometry
-            geom = result.forehead_geometry
-            fh_dict["geometry"] = {
-                "slant_angle": float(geom.slant_angle_degrees),
-                "forehead_height": float(geom.forehead_height),
-                "forehead_width": float(geom.forehead_width) if hasattr(geom, 'forehead_width') else 0,
-                "curvature": float(geom.forehead_curvature) if hasattr(geom, 'forehead_curvature') else 0,
-                "frontal_prominence": float(geom.frontal_prominence) if hasattr(geom, 'frontal_prominence') else 0,
-            }
+            fh_dict["geometry"] = extract_fields(geom, BASIC_GEOMETRY_FIELDS, into={
+                "slant_angle": slant_angle,
+                "forehead_height": forehead_height,
+            })
 
             return fh_dict
         except Exception as e:
@@ -690,32 +614,29 @@ class CapaService:
 
     def analyze_morphology_only(self, image_path: str) -> Dict[str, Any]:
         """Analyze facial morphology only."""
+        return self._run_on_image(self._analyze_morphology, image_path)
+
+    def _analyze_morphology(self, image: Optional["np.ndarray"]) -> Dict[str, Any]:
+        """Run the morphology analyzer on a decoded image (see analyze_morphology_only)."""
         try:
-            image = cv2.imread(image_path)
             if image is None:
                 return {"success": False, "error": "Could not load image"}
 
-            result = self.morphology_analyzer.analyze_image(image)
+            with self.morphology_lock:
+                result = self.morphology_analyzer.analyze_image(image.copy())
+            del image
             if not result:
                 return {"success": False, "error": "Analysis failed"}
 
-            morph_dict = {
-                "success": True,
-                "face_shape": result.shape_classification.primary_shape.value,
-                "facial_index": float(result.facial_proportions.facial_index),
-                "width_height_ratio": float(result.facial_proportions.facial_width_height_ratio),
-                "confidence": float(result.measurement_confidence),
-            }
+            props = result.facial_proportions
+            morph_dict = dict(zip(_MORPHOLOGY_ONLY_KEYS, (
+                True,
+                get_face_shape(result),
+                *to_floats((props.facial_index, props.facial_width_height_ratio, result.measurement_confidence)),
+            )))
 
             # Add detailed proportions
-            props = result.facial_proportions
-            morph_dict["proportions"] = {
-                "upper_face_ratio": float(props.upper_face_ratio) if hasattr(props, 'upper_face_ratio') else 0,
-                "middle_face_ratio": float(props.middle_face_ratio) if hasattr(props, 'middle_face_ratio') else 0,
-                "lower_face_ratio": float(props.lower_face_ratio) if hasattr(props, 'lower_face_ratio') else 0,
-                "facial_width": float(props.bizygomatic_width) if hasattr(props, 'bizygomatic_width') else 0,
-                "facial_height": float(props.total_face_height) if hasattr(props, 'total_face_height') else 0,
-            }
+            morph_dict["proportions"] = extract_fields(props, BASIC_PROPORTION_FIELDS)
 
             return morph_dict
         except Exception as e:
@@ -723,34 +644,55 @@ class CapaService:
 
     def analyze_neoclassical_only(self, image_path: str, ethnic_group: str = 'caucasian') -> Dict[str, Any]:
         """Analyze neoclassical canons only."""
+        return self._run_on_image(self._analyze_neoclassical, image_path, ethnic_group)
+
+    def _analyze_neoclassical(self, image: Optional["np.ndarray"], ethnic_group: str) -> Dict[str, Any]:
+        """Run the neoclassical canons analyzer on a decoded image (see analyze_neoclassical_only)."""
         try:
-            image = cv2.imread(image_path)
             if image is None:
                 return {"success": False, "error": "Could not load image"}
 
-            result = self.neoclassical_analyzer.analyze_image(image, ethnic_group=ethnic_group)
+            with self.neoclassical_lock:
+                result = self.neoclassical_analyzer.analyze_image(image.copy(), ethnic_group=ethnic_group)
+            del image
             if not result:
                 return {"success": False, "error": "Analysis failed"}
 
-            # Format canon measurements
-            canon_measurements = {}
-            for canon_name, measurement in result.canon_measurements.items():
-                canon_measurements[canon_name] = {
-                    "measured_value": float(measurement.measured_value),
-                    "deviation": float(measurement.deviation_from_ideal),
-                    "within_range": measurement.within_acceptable_range,
-                    "confidence": float(measurement.measurement_confidence)
-                }
-
             return {
                 "success": True,
                 "overall_score": float(result.overall_harmony_score),
-                "canon_measurements": canon_measurements,
+                "canon_measurements": format_canon_measurements(result.canon_measurements),
                 "ethnic_group": ethnic_group
             }
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def analyze_all(self, image_path: str, ethnic_group: str = 'caucasian') -> Dict[str, Dict[str, Any]]:
+        """
+        Run the WD, forehead, morphology and neoclassical analyzers concurrently.
+
+        The image is decoded once, before fanning out, and the workers share that
+        array. Returns the per-module results keyed by "wd", "forehead",
+        "morphology" and "neoclassical", each in the same format as the
+        matching *_only method.
+        """
+        try:
+            image = _load_image(image_path)
+        except Exception as e:
+            return {name: {"success": False, "error": str(e)} for name in _MODULE_NAMES}
+        futures = {
+            "wd": self._module_executor.submit(self._analyze_wd, image),
+            "forehead": self._module_executor.submit(self._analyze_forehead, image),
+            "morphology": self._module_executor.submit(self._analyze_morphology, image),
+            "neoclassical": self._module_executor.submit(
+                self._analyze_neoclassical, image, ethnic_group
+            ),
+        }
+        return {name: future.result() for name, future in futures.items()}
+
 
 # Singleton instance
 capa_service = CapaService()
+
+# Cached analyzers live for the whole process; release them on exit
+atexit.register(CapaService.shutdown_analyzers)
@@ -3,14 +3,113 @@ Components Module
 Reusable components for the CAPA Demo.
 """
 
+import functools
+import json
+import os
+
 import reflex as rx
-from typing import Dict, Any, Optional, List, cast
+from reflex.event import EventChain
+from typing import Callable, Dict, Any, Final, Optional, List, Tuple, Union, cast
 
 # Import only the components we use directly (figures are pre-computed in state.py)
 from .plotly_charts import (
     evidence_level_badge,
     confidence_interval_display,
 )
+from ._markdown import render_markdown_html
+
+
+# =============================================================================
+# Shared Tailwind class names
+# =============================================================================
+
+
+def _cls(*parts: str) -> str:
+    """Join Tailwind class fragments, skipping empty ones."""
+    return " ".join(part for part in parts if part)
+
+
+# Navigation link text (active: gradient like the CAPA logo)
+_NAV_ACTIVE_CLS: Final[str] = "bg-gradient-to-r from-orange-400 to-amber-400 bg-clip-text text-transparent font-medium text-sm"
+_NAV_INACTIVE_CLS: Final[str] = "text-slate-300 font-medium text-sm"
+# Mobile bottom nav item; the active state comes from the link's data-active attribute
+_MOBILE_NAV_ITEM_CLS: Final[str] = "group flex-1 py-2 no-underline hover:no-underline transition-all"
+_MOBILE_NAV_ICON_CLS: Final[str] = "text-slate-400 group-data-[active=true]:text-orange-400"
+_MOBILE_NAV_TEXT_CLS: Final[str] = "text-slate-400 group-data-[active=true]:bg-gradient-to-r group-data-[active=true]:from-orange-400 group-data-[active=true]:to-amber-400 group-data-[active=true]:bg-clip-text group-data-[active=true]:text-transparent group-data-[active=true]:font-medium"
+
+# Hero section
+_HERO_TITLE_CLS: Final[str] = "bg-gradient-to-r from-orange-400 via-amber-400 to-yellow-400 bg-clip-text text-transparent text-4xl md:text-5xl lg:text-6xl"
+_HERO_CLS: Final[str] = "bg-gradient-to-b from-slate-900 to-slate-800"
+
+# Cards and panels
+_STAT_CARD_CLS: Final[str] = "bg-slate-800/50 border border-slate-700/50 rounded-xl p-6 hover:border-orange-500/50 transition-all duration-300 min-w-[150px]"
+_FEATURE_CARD_CLS: Final[str] = "bg-slate-800/50 border border-slate-700/50 rounded-xl p-6 hover:border-orange-500/50 hover:-translate-y-1 transition-all duration-300"
+_METRIC_CARD_CLS: Final[str] = "bg-slate-800/30 border border-slate-700/30 rounded-lg p-4 w-full"
+_PANEL_CLS: Final[str] = "bg-slate-800/50 border border-slate-700/50 rounded-xl p-5 w-full"
+_HOVER_BORDER_CLS: Final[str] = "hover:border-orange-500/30 transition-colors"
+_PAPER_CARD_CLS: Final[str] = _cls("bg-slate-800/30 border border-slate-700/50 rounded-lg p-4 w-full", _HOVER_BORDER_CLS)
+_API_METHOD_CARD_CLS: Final[str] = _cls(_PANEL_CLS, _HOVER_BORDER_CLS)
+_MODE_CARD_CLS: Final[str] = _cls("bg-slate-800/50 border border-slate-700/50 rounded-xl p-4 min-h-[80px]", _HOVER_BORDER_CLS)
+
+# Capture page: mode tabs, oval face guide, capture button and captured photos
+# Mode tab; the active state comes from the tab's data-active attribute
+_MODE_TAB_CLS: Final[str] = "group cursor-pointer px-4 py-2 rounded-md hover:bg-slate-700/50 data-[active=true]:bg-gradient-to-br data-[active=true]:from-orange-500 data-[active=true]:to-amber-500 data-[active=true]:shadow-sm transition-all duration-200"
+_MODE_TAB_TEXT_CLS: Final[str] = "text-slate-400 group-data-[active=true]:text-white"
+# The capture zone carries data-status={face_status} on a `group/capture` container;
+# the oval, status message and button restyle through group-data variants
+_CAPTURE_ZONE_CLS: Final[str] = "group/capture py-2"
+_OVAL_CLS: Final[str] = (
+    "absolute top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-48 h-64 rounded-[50%] pointer-events-none "
+    "border-2 border-dashed border-slate-500/60 "
+    "group-data-[status=detected]/capture:border-solid group-data-[status=detected]/capture:border-orange-400 "
+    "group-data-[status=centered]/capture:border-solid group-data-[status=centered]/capture:border-amber-400 "
+    "group-data-[status=ready]/capture:border-solid group-data-[status=ready]/capture:border-3 group-data-[status=ready]/capture:border-green-400 "
+    "group-data-[status=ready]/capture:animate-pulse group-data-[status=ready]/capture:shadow-lg group-data-[status=ready]/capture:shadow-green-500/30"
+)
+_STATUS_MSG_CLS: Final[str] = (
+    "text-slate-500 "
+    "group-data-[status=detected]/capture:text-orange-400 "
+    "group-data-[status=centered]/capture:text-amber-400 "
+    "group-data-[status=ready]/capture:text-green-400 group-data-[status=ready]/capture:font-medium"
+)
+_CAPTURE_BTN_CLS: Final[str] = (
+    "p-4 bg-gradient-to-br rounded-full shadow-lg transition-all duration-300 "
+    "from-orange-500 to-amber-500 shadow-orange-500/30 "
+    "group-data-[status=centered]/capture:from-amber-500 group-data-[status=centered]/capture:to-orange-500 group-data-[status=centered]/capture:shadow-amber-500/30 "
+    "group-data-[status=ready]/capture:from-green-500 group-data-[status=ready]/capture:to-emerald-500 group-data-[status=ready]/capture:shadow-green-500/50"
+)
+# Corner framing marks as one SVG, drawn on a 448x336 (max-w-md, 4:3) box that
+# stretches with the webcam; strokes keep their 2px width when scaled
+_FRAME_CORNERS_SVG: Final[str] = (
+    '<svg class="w-full h-full" viewBox="0 0 448 336" preserveAspectRatio="none" aria-hidden="true">'
+    '<path d="M17,40 V17 H40 M408,17 H431 V40 M17,296 V319 H40 M408,319 H431 V296" '
+    'fill="none" stroke="#fb923c" stroke-opacity="0.5" stroke-width="2" vector-effect="non-scaling-stroke"/>'
+    "</svg>"
+)
+_PHOTO_IMAGE_CLS: Final[str] = "w-32 h-40 object-cover rounded data-[mirrored=true]:-scale-x-100"
+_PHOTO_FRAME_CLS: Final[str] = "p-1 bg-white/10 rounded shadow-inner"
+_PHOTO_CAPTION_CLS: Final[str] = "text-slate-500 uppercase tracking-widest mt-1 text-center"
+_UPLOAD_ZONE_LARGE_CLS: Final[str] = "border-2 border-dashed border-slate-600 hover:border-orange-500 bg-slate-800/30 hover:bg-slate-800/50 rounded-xl p-12 transition-all duration-300 cursor-pointer min-h-[300px] flex items-center justify-center w-full"
+
+# Result tables: rows scroll inside a bounded viewport under a sticky header
+_TABLE_PANEL_CLS: Final[str] = "bg-slate-800/30 border border-slate-700/50 rounded-xl overflow-hidden"
+_TABLE_VIEWPORT_CLS: Final[str] = "max-h-[28rem] overflow-y-auto"
+_TABLE_HEADER_ROW_CLS: Final[str] = "bg-slate-800/95 backdrop-blur-sm border-b border-slate-700 sticky top-0 z-10"
+_TABLE_HEADER_CELL_CLS: Final[str] = "text-slate-300 font-semibold"
+_CANON_ROW_CLS: Final[str] = "border-b border-slate-700/50 hover:bg-slate-800/30 transition-colors"
+_TABLE_ROW_CLS: Final[str] = "border-b border-slate-700/30 hover:bg-slate-800/30 transition-colors"
+_CELL_CODE_CLS: Final[str] = "text-orange-300 bg-slate-800 px-2 py-0.5 rounded"
+_CANON_TABLE_HEADERS: Final = ("Canon", "Measured", "Deviation", "Status", "Confidence")
+_TRAIT_TABLE_HEADERS: Final = ("Trait", "Value")
+_DETAIL_TABLE_HEADERS: Final = ("Metric", "Value")
+
+# Markdown documentation (doc_section cards and the full docs content column)
+_DOC_SECTION_PROSE_CLS: Final[str] = "prose prose-invert prose-slate max-w-none prose-headings:text-white prose-p:text-slate-300 prose-li:text-slate-300 prose-strong:text-white prose-code:text-orange-300 prose-code:bg-slate-800 prose-code:px-1 prose-code:py-0.5 prose-code:rounded prose-pre:bg-slate-800 prose-pre:border prose-pre:border-slate-700 prose-a:text-orange-400 prose-table:border-slate-700 prose-th:border-slate-700 prose-td:border-slate-700"
+_DOCS_PROSE_CLS: Final[str] = "prose prose-invert prose-slate max-w-none prose-headings:text-white prose-p:text-slate-300 prose-li:text-slate-300 prose-strong:text-white prose-code:text-orange-300 prose-code:bg-slate-800 prose-code:px-1.5 prose-code:py-0.5 prose-code:rounded prose-code:before:content-none prose-code:after:content-none prose-pre:bg-slate-800 prose-pre:border prose-pre:border-slate-700 prose-pre:overflow-x-auto prose-a:text-orange-400 prose-a:no-underline hover:prose-a:underline prose-table:border-slate-700 prose-th:border-slate-700 prose-td:border-slate-700 prose-th:text-slate-300 prose-td:text-slate-400 prose-hr:border-slate-700 prose-table:text-sm prose-table:overflow-x-auto"
+
+# Upload and preview
+_UPLOAD_ZONE_CLS: Final[str] = "border-2 border-dashed border-slate-600 hover:border-orange-500 bg-slate-800/30 hover:bg-slate-800/50 rounded-xl p-8 transition-all duration-300 cursor-pointer"
+_IMAGE_PREVIEW_CLS: Final[str] = "border border-slate-700 rounded-xl p-4 bg-slate-800/30"
 
 
 # Custom Webcam component without the muted special_props issue
@@ -25,7 +124,11 @@ class SafeWebcam(rx.Component):
     audio: rx.Var[bool] = rx.Var.create(False)
     screenshot_format: rx.Var[str] = rx.Var.create("image/jpeg")
     mirrored: rx.Var[bool] = rx.Var.create(False)
-    video_constraints: rx.Var[dict] = rx.Var.create({})
+    # 640x480 @ 15fps is plenty for face capture and detection; pass
+    # video_constraints={} to let the browser pick its default resolution
+    video_constraints: rx.Var[dict] = rx.Var.create(
+        {"width": {"ideal": 640}, "height": {"ideal": 480}, "frameRate": {"ideal": 15}}
+    )
 
     @classmethod
     def create(cls, *children, **props) -> "SafeWebcam":
@@ -38,149 +141,415 @@ class SafeWebcam(rx.Component):
 safe_webcam = SafeWebcam.create
 
 
-def upload_screenshot_safe(webcam_id: str, handler):
-    """Capture cropped screenshot from webcam component - only the face area inside the oval guide."""
-    # JavaScript to capture and crop to oval area using DOM queries
-    crop_script = f"""
-(async function() {{
+# Log from the injected scripts only when debugging (set CAPA_DEMO_DEBUG=1)
+_JS_DEBUG = os.environ.get("CAPA_DEMO_DEBUG", "").lower() in ("1", "true", "yes")
+
+
+def _minify_js(source: str) -> str:
+    """Strip indentation, blank lines and full-line comments from a script.
+
+    Line breaks are kept so automatic semicolon insertion is unaffected;
+    single-line console.log calls are dropped unless debugging.
+    """
+    lines = []
+    for line in source.splitlines():
+        line = line.strip()
+        if not line or line.startswith("//"):
+            continue
+        if not _JS_DEBUG and line.startswith("console.log(") and line.endswith(");"):
+            continue
+        lines.append(line)
+    return "\n".join(lines)
+
+
+# Worker that encodes the cropped webcam frame off the main thread.
+# Created once from a Blob URL and cached on window across captures.
+_CROP_WORKER_SCRIPT = """
+let canvas = null;
+let ctx = null;
+
+self.onmessage = async (event) => {
+    const { id, bitmap, quality } = event.data;
+    try {
+        // Reuse one canvas; it is only reallocated when the crop size changes
+        if (!canvas) {
+            canvas = new OffscreenCanvas(bitmap.width, bitmap.height);
+            ctx = canvas.getContext('2d', { alpha: false });
+        } else if (canvas.width !== bitmap.width || canvas.height !== bitmap.height) {
+            canvas.width = bitmap.width;
+            canvas.height = bitmap.height;
+        }
+        ctx.drawImage(bitmap, 0, 0);
+        bitmap.close();
+        const blob = await canvas.convertToBlob({ type: 'image/jpeg', quality });
+        const dataUrl = await new Promise((resolve, reject) => {
+            const reader = new FileReader();
+            reader.onload = () => resolve(reader.result);
+            reader.onerror = () => reject(reader.error);
+            reader.readAsDataURL(blob);
+        });
+        self.postMessage({ id, dataUrl });
+    } catch (err) {
+        self.postMessage({ id, error: String(err) });
+    }
+};
+"""
+
+
+# Crop script source; __WEBCAM_ID__ is filled in per webcam by _build_crop_js
+_CROP_SCRIPT_SOURCE = """
+(async function() {
     // Find video element via DOM (webcam component renders a video element)
-    const video = document.querySelector('#{webcam_id} video') || document.querySelector('video');
-    if (!video) {{
-        console.warn('[Capture] Video element not found');
-        return null;
-    }}
-
-    // Create canvas to capture screenshot
-    const captureCanvas = document.createElement('canvas');
-    captureCanvas.width = video.videoWidth;
-    captureCanvas.height = video.videoHeight;
-    const captureCtx = captureCanvas.getContext('2d');
-    captureCtx.drawImage(video, 0, 0);
-    const originalDataUrl = captureCanvas.toDataURL('image/jpeg', 0.92);
-
-    if (!originalDataUrl) {{
-        console.warn('[Capture] Failed to get screenshot');
+    const container = document.getElementById('__WEBCAM_ID__');
+    const video = (container && container.querySelector('video')) || document.querySelector('video');
+    if (!video || !video.videoWidth) {
+        console.warn('[Capture] Video element not found or not ready');
         return null;
-    }}
-
-    // Load image and crop
-    return await new Promise((resolve) => {{
-        const img = new Image();
-        img.onload = function() {{
-            // Calculate crop area (matching oval guide proportions)
-            const cropWidthPercent = 0.50;  // 50% width for face
-            const cropHeightPercent = 0.75; // 75% height for head + chin
-            const cropCenterXPercent = 0.50;
-            const cropCenterYPercent = 0.45;
-
-            const cropWidth = img.width * cropWidthPercent;
-            const cropHeight = img.height * cropHeightPercent;
-            const cropX = (img.width * cropCenterXPercent) - (cropWidth / 2);
-            const cropY = (img.height * cropCenterYPercent) - (cropHeight / 2);
-
-            // Clamp values to valid range
-            const finalX = Math.max(0, cropX);
-            const finalY = Math.max(0, cropY);
-            const finalWidth = Math.min(cropWidth, img.width - finalX);
-            const finalHeight = Math.min(cropHeight, img.height - finalY);
-
-            // Create canvas and crop
-            const canvas = document.createElement('canvas');
-            canvas.width = finalWidth;
-            canvas.height = finalHeight;
-            const ctx = canvas.getContext('2d');
-
-            // Draw cropped region
-            ctx.drawImage(
-                img,
-                finalX, finalY, finalWidth, finalHeight,
-                0, 0, finalWidth, finalHeight
-            );
-
-            const croppedDataUrl = canvas.toDataURL('image/jpeg', 0.92);
+    }
+
+    // JPEG quality for the capture; downstream models downscale the face anyway
+    const JPEG_QUALITY = 0.75;
+    // ms to wait for the crop worker before encoding on the main thread
+    const WORKER_TIMEOUT = 2000;
+
+    // Calculate crop area (matching oval guide proportions)
+    const cropWidthPercent = 0.50;  // 50% width for face
+    const cropHeightPercent = 0.75; // 75% height for head + chin
+    const cropCenterXPercent = 0.50;
+    const cropCenterYPercent = 0.45;
+
+    const width = video.videoWidth;
+    const height = video.videoHeight;
+    const cropWidth = width * cropWidthPercent;
+    const cropHeight = height * cropHeightPercent;
+    const cropX = (width * cropCenterXPercent) - (cropWidth / 2);
+    const cropY = (height * cropCenterYPercent) - (cropHeight / 2);
+
+    // Clamp values to valid range
+    const finalX = Math.round(Math.max(0, cropX));
+    const finalY = Math.round(Math.max(0, cropY));
+    const finalWidth = Math.round(Math.min(cropWidth, width - finalX));
+    const finalHeight = Math.round(Math.min(cropHeight, height - finalY));
+
+    // Fast path: grab only the crop region and JPEG-encode it in a worker
+    if (typeof OffscreenCanvas !== 'undefined' && typeof Worker !== 'undefined' && window.createImageBitmap) {
+        try {
+            const bitmap = await createImageBitmap(video, finalX, finalY, finalWidth, finalHeight);
+            if (!window.__capaCropWorker) {
+                const workerUrl = URL.createObjectURL(
+                    new Blob([__CROP_WORKER_SCRIPT__], { type: 'text/javascript' })
+                );
+                window.__capaCropWorker = new Worker(workerUrl);
+            }
+            const worker = window.__capaCropWorker;
+            const id = (window.__capaCropSeq = (window.__capaCropSeq || 0) + 1);
+            const croppedDataUrl = await new Promise((resolve, reject) => {
+                const cleanup = () => {
+                    clearTimeout(timer);
+                    worker.removeEventListener('message', onMessage);
+                    worker.removeEventListener('error', onFailure);
+                    worker.removeEventListener('messageerror', onFailure);
+                };
+                const onMessage = (event) => {
+                    if (event.data.id !== id) return;
+                    cleanup();
+                    if (event.data.error) reject(new Error(event.data.error));
+                    else resolve(event.data.dataUrl);
+                };
+                // A worker that failed to load (e.g. blob: blocked by CSP) or stopped
+                // replying is dropped, so later captures start a fresh one
+                const onFailure = (event) => {
+                    cleanup();
+                    worker.terminate();
+                    if (window.__capaCropWorker === worker) window.__capaCropWorker = null;
+                    reject(new Error((event && event.message) || 'crop worker failed'));
+                };
+                const timer = setTimeout(() => onFailure({ message: 'crop worker timed out' }), WORKER_TIMEOUT);
+                worker.addEventListener('message', onMessage);
+                worker.addEventListener('error', onFailure);
+                worker.addEventListener('messageerror', onFailure);
+                worker.postMessage({ id, bitmap, quality: JPEG_QUALITY }, [bitmap]);
+            });
             console.log('[Capture] Cropped image:', finalWidth, 'x', finalHeight);
-            resolve(croppedDataUrl);
-        }};
-        img.onerror = function() {{
-            console.error('[Capture] Failed to load image for cropping');
-            resolve(originalDataUrl);  // Fallback to original
-        }};
-        img.src = originalDataUrl;
-    }});
-}})()
+            return croppedDataUrl;
+        } catch (err) {
+            console.warn('[Capture] Worker crop failed, using canvas fallback', err);
+        }
+    }
+
+    // Fallback: draw only the cropped region and encode on the main thread,
+    // reusing one canvas across captures (the opaque draw covers it fully)
+    if (!window.__capaCaptureCanvas) {
+        window.__capaCaptureCanvas = document.createElement('canvas');
+    }
+    const canvas = window.__capaCaptureCanvas;
+    if (canvas.width !== finalWidth || canvas.height !== finalHeight) {
+        canvas.width = finalWidth;
+        canvas.height = finalHeight;
+    }
+    canvas.getContext('2d', { alpha: false }).drawImage(
+        video,
+        finalX, finalY, finalWidth, finalHeight,
+        0, 0, finalWidth, finalHeight
+    );
+    const croppedDataUrl = canvas.toDataURL('image/jpeg', JPEG_QUALITY);
+    console.log('[Capture] Cropped image:', finalWidth, 'x', finalHeight);
+    return croppedDataUrl;
+})()
 """
+
+# Minified once at import; only the webcam id is substituted per call
+_CROP_SCRIPT_TEMPLATE = _minify_js(
+    _CROP_SCRIPT_SOURCE.replace("__CROP_WORKER_SCRIPT__", json.dumps(_minify_js(_CROP_WORKER_SCRIPT)))
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_crop_js(webcam_id: str) -> str:
+    """Return the crop script for a webcam id (built once per id)."""
+    return _CROP_SCRIPT_TEMPLATE.replace("__WEBCAM_ID__", webcam_id)
+
+
+def upload_screenshot_safe(webcam_id: str, handler):
+    """Capture cropped screenshot from webcam component - only the face area inside the oval guide."""
+    # JavaScript to crop the oval area straight from the video frame and encode it once
     return rx.call_script(
-        crop_script,
+        _build_crop_js(webcam_id),
         callback=handler,
     )
 
 
-def face_detection_script(
-    webcam_id: str,
-    on_status_change,
-    on_auto_capture
-) -> rx.Component:
-    """
-    Face detection script using browser's FaceDetector API.
-    Provides visual feedback and auto-capture when face is properly positioned.
-    Auto-capture is always enabled by default.
-    """
-    script = f"""
-(function() {{
+# Worker that owns a FaceDetector and answers with plain bounding boxes, so
+# detect() never blocks main-thread paint. Replies with an error if the
+# browser does not expose FaceDetector to workers.
+_FACE_DETECTOR_WORKER_SCRIPT = """
+const detector = typeof FaceDetector !== 'undefined'
+    ? new FaceDetector({ fastMode: true, maxDetectedFaces: 1 })
+    : null;
+
+self.onmessage = async (event) => {
+    const { id, bitmap } = event.data;
+    try {
+        if (!detector) throw new Error('FaceDetector not available in worker');
+        const faces = await detector.detect(bitmap);
+        const boxes = faces.map((face) => {
+            const box = face.boundingBox;
+            return { x: box.x, y: box.y, width: box.width, height: box.height };
+        });
+        self.postMessage({ id, boxes });
+    } catch (err) {
+        self.postMessage({ id, error: String(err) });
+    } finally {
+        bitmap.close();
+    }
+};
+"""
+
+
+# Face detection script source; __WEBCAM_ID__ is filled in by _build_face_detection_js
+_FACE_DETECTION_SOURCE = """
+(function() {
     // Configuration
-    const WEBCAM_ID = '{webcam_id}';
-    const DETECTION_INTERVAL = 200; // ms between detection checks
+    const WEBCAM_ID = '__WEBCAM_ID__';
+    const DETECTION_INTERVAL = 200; // ms between checks when requestVideoFrameCallback is unavailable
+    const WORKER_TIMEOUT = 1000; // ms to wait for a worker reply before detecting on the main thread
     const CENTERED_HOLD_TIME = 2000; // ms to hold centered before ready
     const READY_COUNTDOWN = 3; // seconds countdown before capture
 
     // State
     let faceDetector = null;
     let detectionInterval = null;
+    let detectionLoopId = 0; // Incremented to cancel the running per-frame loop
+    let detectionPending = false;
     let centeredStartTime = null;
+    let tickTime = 0; // Timestamp read once per detection tick
     let countdownInterval = null;
     let currentCountdown = 0;
     let lastStatus = 'scanning';
+    let pendingStatus = null;
+    let statusFlushScheduled = false;
     let isCapturing = false;
 
     // Check if FaceDetector API is available
     const hasFaceDetector = 'FaceDetector' in window;
 
-    // Get webcam video element via DOM query
-    function getVideoElement() {{
+    // Run detection once per decoded video frame when supported
+    const hasVideoFrameCallback = 'requestVideoFrameCallback' in HTMLVideoElement.prototype;
+
+    // Detection runs on a downscaled copy of the frame (canvas reused every frame
+    // and across remounts); face boxes stay stable at this size and detect() cost
+    // scales with pixel count
+    const DETECTION_MAX_SIZE = 192;
+    if (!window.__capaDetectionCanvas && typeof OffscreenCanvas !== 'undefined') {
+        window.__capaDetectionCanvas = new OffscreenCanvas(DETECTION_MAX_SIZE, DETECTION_MAX_SIZE);
+    }
+    const detectionCanvas = window.__capaDetectionCanvas || null;
+    const detectionCtx = detectionCanvas ? detectionCanvas.getContext('2d', { alpha: false }) : null;
+
+    // Worker-hosted FaceDetector; null when unsupported (main-thread detector is used)
+    let detectorWorker = null;
+    let workerRequestId = 0;
+    const pendingWorkerRequests = new Map();
+
+    // DOM references resolved once and reused by the detection loop
+    let cachedVideo = null;
+    let autoCaptureEl = null;
+    let autoCaptureObserver = null;
+    let autoCaptureEnabled = false;
+
+    // Get webcam video element (queried again only if it was removed or emptied)
+    function getVideoElement() {
+        if (cachedVideo && cachedVideo.isConnected) {
+            return cachedVideo;
+        }
         // Try to find video by webcam container id first, then fallback to any video
-        const video = document.querySelector('#' + WEBCAM_ID + ' video') || document.querySelector('video');
-        return video;
-    }}
+        const container = document.getElementById(WEBCAM_ID);
+        cachedVideo = (container && container.querySelector('video')) || document.querySelector('video');
+        if (cachedVideo) {
+            cachedVideo.addEventListener('emptied', () => { cachedVideo = null; }, { once: true });
+        }
+        return cachedVideo;
+    }
+
+    // Auto-capture flag from the data-auto-capture attribute, kept current by a MutationObserver
+    function isAutoCaptureEnabled() {
+        if (!autoCaptureEl || !autoCaptureEl.isConnected) {
+            if (autoCaptureObserver) {
+                autoCaptureObserver.disconnect();
+                autoCaptureObserver = null;
+            }
+            autoCaptureEl = document.querySelector('[data-auto-capture]');
+            autoCaptureEnabled = autoCaptureEl?.dataset.autoCapture === 'true';
+            if (autoCaptureEl) {
+                const el = autoCaptureEl;
+                autoCaptureObserver = new MutationObserver(() => {
+                    autoCaptureEnabled = el.dataset.autoCapture === 'true';
+                });
+                autoCaptureObserver.observe(el, { attributes: true, attributeFilter: ['data-auto-capture'] });
+            }
+        }
+        return autoCaptureEnabled;
+    }
 
     // Initialize face detector
-    async function initFaceDetector() {{
-        if (hasFaceDetector) {{
-            try {{
-                faceDetector = new FaceDetector({{
+    async function initFaceDetector() {
+        if (hasFaceDetector) {
+            try {
+                faceDetector = new FaceDetector({
                     fastMode: true,
                     maxDetectedFaces: 1
-                }});
+                });
                 console.log('[FaceDetection] FaceDetector API initialized');
+                initDetectorWorker();
                 return true;
-            }} catch (e) {{
+            } catch (e) {
                 console.warn('[FaceDetection] FaceDetector init failed:', e);
                 return false;
-            }}
-        }}
+            }
+        }
         console.log('[FaceDetection] FaceDetector API not available, using fallback');
         return false;
-    }}
+    }
+
+    // Start the detector worker once (frames are transferred to it as ImageBitmaps)
+    function initDetectorWorker() {
+        if (detectorWorker || typeof Worker === 'undefined' || !window.createImageBitmap) return;
+        try {
+            const workerUrl = URL.createObjectURL(
+                new Blob([__FACE_DETECTOR_WORKER_SCRIPT__], { type: 'text/javascript' })
+            );
+            detectorWorker = new Worker(workerUrl);
+            detectorWorker.onmessage = (event) => {
+                const pending = pendingWorkerRequests.get(event.data.id);
+                if (!pending) return;
+                pendingWorkerRequests.delete(event.data.id);
+                if (event.data.error) pending.reject(new Error(event.data.error));
+                else pending.resolve(event.data.boxes);
+            };
+            // A worker that fails to load or to deliver a reply would never answer
+            detectorWorker.onerror = (event) => disableDetectorWorker(event.message || 'worker error');
+            detectorWorker.onmessageerror = () => disableDetectorWorker('worker message error');
+        } catch (e) {
+            console.warn('[FaceDetection] Detector worker unavailable:', e);
+            detectorWorker = null;
+        }
+    }
+
+    // Stop using the worker and detect on the main thread from now on; outstanding
+    // requests are rejected so their detection ticks finish instead of hanging
+    function disableDetectorWorker(reason) {
+        if (!detectorWorker && pendingWorkerRequests.size === 0) return;
+        console.warn('[FaceDetection] Falling back to main-thread detection:', reason);
+        if (detectorWorker) {
+            detectorWorker.terminate();
+            detectorWorker = null;
+        }
+        const error = new Error('Detector worker disabled');
+        pendingWorkerRequests.forEach((pending) => pending.reject(error));
+        pendingWorkerRequests.clear();
+    }
+
+    // Detect faces on a downscaled frame (aspect ratio kept); boxes are in video pixels
+    async function detectFaceBoxes(video) {
+        const scale = Math.min(1, DETECTION_MAX_SIZE / Math.max(video.videoWidth, video.videoHeight));
+        const width = Math.max(1, Math.round(video.videoWidth * scale));
+        const height = Math.max(1, Math.round(video.videoHeight * scale));
+        let scaleX = video.videoWidth / width;
+        let scaleY = video.videoHeight / height;
+        let boxes;
+
+        if (detectorWorker) {
+            const bitmap = await createImageBitmap(video, {
+                resizeWidth: width,
+                resizeHeight: height,
+                resizeQuality: 'low'
+            });
+            const id = ++workerRequestId;
+            boxes = await new Promise((resolve, reject) => {
+                const timer = setTimeout(() => {
+                    pendingWorkerRequests.delete(id);
+                    reject(new Error('Detector worker timed out'));
+                }, WORKER_TIMEOUT);
+                pendingWorkerRequests.set(id, {
+                    resolve: (value) => { clearTimeout(timer); resolve(value); },
+                    reject: (err) => { clearTimeout(timer); reject(err); }
+                });
+                detectorWorker.postMessage({ id, bitmap }, [bitmap]);
+            });
+        } else {
+            let source = video;
+            if (detectionCtx) {
+                if (detectionCanvas.width !== width || detectionCanvas.height !== height) {
+                    detectionCanvas.width = width;
+                    detectionCanvas.height = height;
+                }
+                detectionCtx.drawImage(video, 0, 0, width, height);
+                source = detectionCanvas;
+            } else {
+                scaleX = 1;
+                scaleY = 1;
+            }
+            boxes = (await faceDetector.detect(source)).map((face) => face.boundingBox);
+        }
+
+        // Map boxes from detection size back to video pixels
+        return boxes.map((box) => ({
+            x: box.x * scaleX,
+            y: box.y * scaleY,
+            width: box.width * scaleX,
+            height: box.height * scaleY
+        }));
+    }
 
     // Check if face is centered in the guide oval
-    function isFaceCentered(face, videoWidth, videoHeight) {{
+    function isFaceCentered(faceBox, videoWidth, videoHeight) {
         // Guide oval is centered at 50%, 50% with ~40% width and ~55% height
         const guideCenterX = videoWidth * 0.5;
         const guideCenterY = videoHeight * 0.45;
         const guideWidth = videoWidth * 0.4;
         const guideHeight = videoHeight * 0.55;
 
-        // Face bounding box
-        const faceBox = face.boundingBox;
+        // Face bounding box (in video pixels)
         const faceCenterX = faceBox.x + faceBox.width / 2;
         const faceCenterY = faceBox.y + faceBox.height / 2;
 
@@ -198,49 +567,68 @@ def face_detection_script(
         const sizeOk = faceSize >= minFaceSize && faceSize <= maxFaceSize;
 
         return xInRange && yInRange && sizeOk;
-    }}
-
-    // Update status (calls Reflex event handler)
-    function updateStatus(status, message) {{
-        if (status !== lastStatus) {{
-            lastStatus = status;
-            // Dispatch custom event that Reflex can handle
-            window.dispatchEvent(new CustomEvent('faceDetectionStatus', {{
-                detail: {{ status, message }}
-            }}));
-        }}
-    }}
+    }
+
+    // Dispatch the latest pending status if it changed (calls Reflex event handler)
+    function flushStatus() {
+        statusFlushScheduled = false;
+        const detail = pendingStatus;
+        pendingStatus = null;
+        if (detail && detail.status !== lastStatus) {
+            lastStatus = detail.status;
+            if (typeof window.__capaOnStatus === 'function') {
+                // Direct callback registered by the page, no DOM event round-trip
+                window.__capaOnStatus(detail);
+            } else {
+                // Dispatch custom event that Reflex can handle
+                window.dispatchEvent(new CustomEvent('faceDetectionStatus', { detail }));
+            }
+        }
+    }
+
+    // Update status; calls within one animation frame coalesce into one dispatch
+    function updateStatus(status, message) {
+        pendingStatus = { status, message };
+        if (!statusFlushScheduled) {
+            statusFlushScheduled = true;
+            if (window.requestAnimationFrame) {
+                window.requestAnimationFrame(flushStatus);
+            } else {
+                setTimeout(flushStatus, 0);
+            }
+        }
+    }
 
     // Start countdown for auto-capture
-    function startCountdown() {{
+    function startCountdown() {
         if (countdownInterval) return;
 
         currentCountdown = READY_COUNTDOWN;
         updateStatus('ready', 'Capturing in ' + currentCountdown + '...');
 
-        countdownInterval = setInterval(() => {{
+        countdownInterval = setInterval(() => {
             currentCountdown--;
-            if (currentCountdown > 0) {{
+            if (currentCountdown > 0) {
                 updateStatus('ready', 'Capturing in ' + currentCountdown + '...');
-            }} else {{
+            } else {
                 clearInterval(countdownInterval);
                 countdownInterval = null;
                 triggerAutoCapture();
-            }}
-        }}, 1000);
-    }}
+            }
+        }, 1000);
+    }
 
     // Stop countdown
-    function stopCountdown() {{
-        if (countdownInterval) {{
+    function stopCountdown() {
+        if (countdownInterval) {
             clearInterval(countdownInterval);
             countdownInterval = null;
             currentCountdown = 0;
-        }}
-    }}
+        }
+    }
 
     // Trigger auto-capture
-    function triggerAutoCapture() {{
+    function triggerAutoCapture() {
         if (isCapturing) return;
         isCapturing = true;
 
@@ -248,141 +636,273 @@ def face_detection_script(
 
         // Click the capture button to trigger Reflex handler
         const captureBtn = document.getElementById('face-capture-btn');
-        if (captureBtn) {{
+        if (captureBtn) {
             console.log('[FaceDetection] Triggering auto-capture via button click');
             captureBtn.click();
-        }} else {{
+        } else {
             console.warn('[FaceDetection] Capture button not found');
-        }}
+        }
 
         // Stop detection after capture
         stopDetection();
-    }}
+    }
 
     // Fallback detection (no FaceDetector API)
     // Uses simple brightness/motion analysis as proxy
-    function fallbackDetection(video) {{
+    function fallbackDetection(video) {
         // For browsers without FaceDetector, we'll show a simpler flow
         // After 3 seconds of video feed, consider it "ready"
-        if (!centeredStartTime) {{
-            centeredStartTime = Date.now();
+        if (!centeredStartTime) {
+            centeredStartTime = tickTime;
             updateStatus('detected', 'Position your face in the oval');
-        }} else if (Date.now() - centeredStartTime > 3000) {{
+            return;
+        }
+        const elapsed = tickTime - centeredStartTime;
+        if (elapsed > 3000) {
             updateStatus('centered', 'Hold still...');
-            if (Date.now() - centeredStartTime > 5000) {{
+            if (elapsed > 5000) {
                 // Check if auto-capture is enabled before starting countdown
-                const autoEnabled = document.querySelector('[data-auto-capture]')?.dataset.autoCapture === 'true';
-                if (autoEnabled && !countdownInterval) {{
+                if (isAutoCaptureEnabled() && !countdownInterval) {
                     startCountdown();
-                }}
-            }}
-        }}
-    }}
+                }
+            }
+        }
+    }
 
     // Main detection loop
-    async function detectFace() {{
-        if (isCapturing) return;
+    async function detectFace() {
+        if (isCapturing || document.hidden) return;
 
         const video = getVideoElement();
-        if (!video || video.readyState < 2) {{
+        if (!video || video.readyState < 2) {
             updateStatus('scanning', 'Initializing camera...');
             return;
-        }}
+        }
 
         // Check if auto-capture is enabled
-        const autoEnabled = document.querySelector('[data-auto-capture]')?.dataset.autoCapture === 'true';
+        const autoEnabled = isAutoCaptureEnabled();
 
-        if (!faceDetector) {{
+        if (!faceDetector) {
             // Fallback mode
             fallbackDetection(video);
             return;
-        }}
+        }
 
-        try {{
-            const faces = await faceDetector.detect(video);
+        const usingWorker = detectorWorker !== null;
+        try {
+            const faces = await detectFaceBoxes(video);
 
-            if (faces.length === 0) {{
+            if (faces.length === 0) {
                 centeredStartTime = null;
                 stopCountdown();
                 updateStatus('scanning', 'Looking for face...');
-            }} else {{
-                const face = faces[0];
-                const isCentered = isFaceCentered(face, video.videoWidth, video.videoHeight);
+            } else {
+                const isCentered = isFaceCentered(faces[0], video.videoWidth, video.videoHeight);
 
-                if (isCentered) {{
-                    if (!centeredStartTime) {{
-                        centeredStartTime = Date.now();
-                    }}
+                if (isCentered) {
+                    if (!centeredStartTime) {
+                        centeredStartTime = tickTime;
+                    }
 
-                    const holdTime = Date.now() - centeredStartTime;
+                    const holdTime = tickTime - centeredStartTime;
 
-                    if (holdTime < CENTERED_HOLD_TIME) {{
+                    if (holdTime < CENTERED_HOLD_TIME) {
                         updateStatus('centered', 'Hold still...');
-                    }} else if (autoEnabled) {{
-                        if (!countdownInterval) {{
+                    } else if (autoEnabled) {
+                        if (!countdownInterval) {
                             startCountdown();
-                        }}
-                    }} else {{
+                        }
+                    } else {
                         updateStatus('ready', 'Ready! Tap to capture');
-                    }}
-                }} else {{
+                    }
+                } else {
                     centeredStartTime = null;
                     stopCountdown();
                     updateStatus('detected', 'Center your face in the oval');
-                }}
-            }}
-        }} catch (e) {{
+                }
+            }
+        } catch (e) {
+            if (usingWorker) {
+                // Retry on the next frame with the main-thread detector
+                disableDetectorWorker(e);
+                return;
+            }
             console.warn('[FaceDetection] Detection error:', e);
             fallbackDetection(video);
-        }}
-    }}
+        }
+    }
+
+    // Run one detection, skipping (not queueing) while a previous detect() is pending
+    async function runDetection() {
+        if (detectionPending) return;
+        detectionPending = true;
+        tickTime = performance.now();
+        try {
+            await detectFace();
+        } finally {
+            detectionPending = false;
+        }
+    }
+
+    // Request the next frame; the video element may be re-created, so look it up each time.
+    // A paused, reset or replaced <video> never fires its frame callback, so a timer
+    // races it: whichever fires first continues the loop (stale loops stop on loopId)
+    function scheduleFrame(loopId) {
+        const video = getVideoElement();
+        let frameHandle = null;
+        let fired = false;
+        const next = () => {
+            if (fired) return;
+            fired = true;
+            clearTimeout(watchdog);
+            onVideoFrame(loopId);
+        };
+        const watchdog = setTimeout(() => {
+            if (video && frameHandle !== null && video.cancelVideoFrameCallback) {
+                video.cancelVideoFrameCallback(frameHandle);
+            }
+            cachedVideo = null; // Re-acquire the video element on the next lookup
+            next();
+        }, video ? DETECTION_INTERVAL * 2 : DETECTION_INTERVAL);
+        if (video) {
+            frameHandle = video.requestVideoFrameCallback(next);
+        }
+    }
+
+    // Per-frame loop: the next frame is requested only after detection resolves,
+    // so detection never runs on a stale frame and never piles up
+    async function onVideoFrame(loopId) {
+        if (loopId !== detectionLoopId) return;
+        await runDetection();
+        if (loopId === detectionLoopId) {
+            scheduleFrame(loopId);
+        }
+    }
+
+    // Cancel the per-frame loop or polling interval
+    function stopLoop() {
+        detectionLoopId++;
+        if (detectionInterval) {
+            clearInterval(detectionInterval);
+            detectionInterval = null;
+        }
+    }
+
+    // (Re)start the per-frame loop, or the polling interval as a fallback
+    function startLoop() {
+        stopLoop();
+        if (hasVideoFrameCallback) {
+            scheduleFrame(detectionLoopId);
+        } else {
+            detectionInterval = setInterval(runDetection, DETECTION_INTERVAL);
+        }
+    }
+
+    // Pause the loop while the tab is hidden and resume it when visible again
+    function onVisibilityChange() {
+        if (document.hidden) {
+            stopLoop();
+            stopCountdown();
+            centeredStartTime = null;
+        } else if (!isCapturing) {
+            startLoop();
+        }
+    }
 
     // Start detection loop
-    async function startDetection() {{
+    async function startDetection() {
         await initFaceDetector();
 
-        if (detectionInterval) {{
-            clearInterval(detectionInterval);
-        }}
-
-        detectionInterval = setInterval(detectFace, DETECTION_INTERVAL);
+        startLoop();
+        document.removeEventListener('visibilitychange', onVisibilityChange);
+        document.addEventListener('visibilitychange', onVisibilityChange);
         console.log('[FaceDetection] Detection started');
-    }}
+    }
 
     // Stop detection loop
-    function stopDetection() {{
-        if (detectionInterval) {{
-            clearInterval(detectionInterval);
-            detectionInterval = null;
-        }}
+    function stopDetection() {
+        stopLoop();
         stopCountdown();
+        document.removeEventListener('visibilitychange', onVisibilityChange);
         console.log('[FaceDetection] Detection stopped');
-    }}
+    }
 
     // Cleanup on page unload
     window.addEventListener('beforeunload', stopDetection);
 
     // Start detection when webcam is ready
-    const checkWebcam = setInterval(() => {{
+    const checkWebcam = setInterval(() => {
         const video = getVideoElement();
-        if (video && video.readyState >= 2) {{
+        if (video && video.readyState >= 2) {
             clearInterval(checkWebcam);
             startDetection();
-        }}
-    }}, 100);
+        }
+    }, 100);
 
-    // Expose stop function globally for cleanup
-    window.stopFaceDetection = stopDetection;
-    window.resetFaceDetection = () => {{
+    // Expose stop function globally for cleanup (also stops waiting for the webcam)
+    window.stopFaceDetection = () => {
+        clearInterval(checkWebcam);
+        stopDetection();
+    };
+    window.resetFaceDetection = () => {
         isCapturing = false;
         centeredStartTime = null;
         stopCountdown();
         lastStatus = 'scanning';
         startDetection();
-    }};
-}})();
+    };
+})();
 """
-    return rx.script(script)
+
+_FACE_DETECTION_TEMPLATE = _minify_js(
+    _FACE_DETECTION_SOURCE.replace(
+        "__FACE_DETECTOR_WORKER_SCRIPT__", json.dumps(_minify_js(_FACE_DETECTOR_WORKER_SCRIPT))
+    )
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _build_face_detection_js(webcam_id: str) -> str:
+    """Return the face detection script for a webcam id (built once per id)."""
+    return _FACE_DETECTION_TEMPLATE.replace("__WEBCAM_ID__", webcam_id)
+
+
+def face_detection_script(
+    webcam_id: str,
+    on_status_change,
+    on_auto_capture,
+    active: Optional[rx.Var] = None,
+) -> rx.Component:
+    """
+    Face detection script using browser's FaceDetector API.
+    Provides visual feedback and auto-capture when face is properly positioned.
+    Auto-capture is always enabled by default.
+
+    When ``active`` is given, the script is only mounted while it is true
+    (e.g. while the camera is open); unmounting stops the detection loop.
+    Status changes are passed to ``on_status_change`` as a ``{status, message}``
+    dict through ``window.__capaOnStatus``, registered on mount and removed on
+    unmount.
+    """
+    # Frontend function that queues on_status_change with the status detail
+    status_callback = rx.Var.create(
+        EventChain.create(on_status_change, args_spec=lambda detail: [detail])
+    )
+    script = rx.fragment(
+        rx.script(_build_face_detection_js(webcam_id)),
+        on_mount=rx.run_script(
+            rx.Var(
+                f"(window.__capaOnStatus = {status_callback})",
+                _var_data=status_callback._get_all_var_data(),
+            )
+        ),
+        on_unmount=rx.call_script(
+            "window.stopFaceDetection && window.stopFaceDetection(); delete window.__capaOnStatus"
+        ),
+    )
+    if active is None:
+        return script
+    return rx.cond(active, script, rx.fragment())
 
 
 def language_selector() -> rx.Component:
@@ -439,27 +959,19 @@ def language_selector() -> rx.Component:
     )
 
 
-def nav_link(text: str, href: str, path: rx.Var) -> rx.Component:
-    """Navigation link with active state styling."""
-    # Check if this link is active (current page)
-    # For root path "/" use negative logic: not /docs and not /demo
-    if href == "/":
-        is_active = ~path.contains("/docs") & ~path.contains("/demo")
-    else:
-        is_active = path.contains(href)
+def nav_link(text: str, href: str, route: str) -> rx.Component:
+    """Navigation link with active state styling (route is the RouteState.active_route key)."""
+    from .state import RouteState
 
     return rx.link(
-        rx.cond(
-            is_active,
-            # Active: gradient text like CAPA logo
-            rx.text(
-                text,
-                class_name="bg-gradient-to-r from-orange-400 to-amber-400 bg-clip-text text-transparent font-medium text-sm",
-            ),
-            # Inactive: default slate color
-            rx.text(
-                text,
-                class_name="text-slate-300 font-medium text-sm",
+        rx.text(
+            text,
+            class_name=rx.cond(
+                RouteState.active_route == route,
+                # Active: gradient text like CAPA logo
+                _NAV_ACTIVE_CLS,
+                # Inactive: default slate color
+                _NAV_INACTIVE_CLS,
             ),
         ),
         href=href,
@@ -469,9 +981,6 @@ def nav_link(text: str, href: str, path: rx.Var) -> rx.Component:
 
 def navbar() -> rx.Component:
     """Navigation bar component with centered menu, language selector and GitHub link."""
-    # Get current page path
-    current_path = rx.State.router.page.path
-
     return rx.box(
         rx.hstack(
             # Logo (left)
@@ -488,9 +997,9 @@ def navbar() -> rx.Component:
             rx.spacer(),
             # Desktop Navigation Links (centered)
             rx.hstack(
-                nav_link("About", "/", current_path),
-                nav_link("Documentation", "/docs", current_path),
-                nav_link("Demo", "/demo", current_path),
+                nav_link("About", "/", "home"),
+                nav_link("Documentation", "/docs", "docs"),
+                nav_link("Demo", "/demo", "demo"),
                 spacing="1",
                 class_name="hidden md:flex",
             ),
@@ -520,55 +1029,30 @@ def navbar() -> rx.Component:
     )
 
 
-def mobile_nav_item(icon: str, label: str, href: str, path: rx.Var) -> rx.Component:
-    """Mobile bottom navigation item with icon and label."""
-    # For root path "/" use negative logic: not /docs and not /demo
-    if href == "/":
-        is_active = ~path.contains("/docs") & ~path.contains("/demo")
-    else:
-        is_active = path.contains(href)
+def mobile_nav_item(icon: str, label: str, href: str, route: str) -> rx.Component:
+    """Mobile bottom navigation item with icon and label (route is the RouteState.active_route key)."""
+    from .state import RouteState
 
     return rx.link(
         rx.vstack(
-            rx.icon(
-                icon,
-                size=20,
-                class_name=rx.cond(
-                    is_active,
-                    "text-orange-400",
-                    "text-slate-400",
-                ),
-            ),
-            rx.cond(
-                is_active,
-                rx.text(
-                    label,
-                    size="1",
-                    class_name="bg-gradient-to-r from-orange-400 to-amber-400 bg-clip-text text-transparent font-medium",
-                ),
-                rx.text(
-                    label,
-                    size="1",
-                    class_name="text-slate-400",
-                ),
-            ),
+            rx.icon(icon, size=20, class_name=_MOBILE_NAV_ICON_CLS),
+            rx.text(label, size="1", class_name=_MOBILE_NAV_TEXT_CLS),
             spacing="1",
             align="center",
         ),
         href=href,
-        class_name="flex-1 py-2 no-underline hover:no-underline transition-all",
+        custom_attrs={"data-active": RouteState.active_route == route},
+        class_name=_MOBILE_NAV_ITEM_CLS,
     )
 
 
 def mobile_bottom_nav() -> rx.Component:
     """Mobile bottom navigation bar - visible only on mobile devices."""
-    current_path = rx.State.router.page.path
-
     return rx.box(
         rx.hstack(
-            mobile_nav_item("info", "About", "/", current_path),
-            mobile_nav_item("book-open", "Docs", "/docs", current_path),
-            mobile_nav_item("play", "Demo", "/demo", current_path),
+            mobile_nav_item("info", "About", "/", "home"),
+            mobile_nav_item("book-open", "Docs", "/docs", "docs"),
+            mobile_nav_item("play", "Demo", "/demo", "demo"),
             width="100%",
             justify="between",
             align="center",
@@ -619,7 +1103,7 @@ def hero_section(
                 size="9",
                 weight="bold",
                 align="center",
-                class_name="bg-gradient-to-r from-orange-400 via-amber-400 to-yellow-400 bg-clip-text text-transparent text-4xl md:text-5xl lg:text-6xl",
+                class_name=_HERO_TITLE_CLS,
             )
         )
 
@@ -644,7 +1128,7 @@ def hero_section(
             class_name="py-10 md:py-16 px-4 md:px-8",
         ),
         width="100%",
-        class_name="bg-gradient-to-b from-slate-900 to-slate-800",
+        class_name=_HERO_CLS,
     )
 
 
@@ -661,7 +1145,7 @@ def stat_card(value: str, label: str, icon: str = "bar-chart") -> rx.Component:
             spacing="1",
             align="center",
         ),
-        class_name="bg-slate-800/50 border border-slate-700/50 rounded-xl p-6 hover:border-orange-500/50 transition-all duration-300 min-w-[150px]",
+        class_name=_STAT_CARD_CLS,
     )
 
 
@@ -678,7 +1162,7 @@ def feature_card(title: str, description: str, icon: str = "star") -> rx.Compone
             spacing="3",
             align="start",
         ),
-        class_name="bg-slate-800/50 border border-slate-700/50 rounded-xl p-6 hover:border-orange-500/50 hover:-translate-y-1 transition-all duration-300",
+        class_name=_FEATURE_CARD_CLS,
     )
 
 
@@ -696,77 +1180,64 @@ def metric_card(title: str, value: str, subtitle: Optional[str] = None) -> rx.Co
             align="start",
             spacing="1",
         ),
-        class_name="bg-slate-800/30 border border-slate-700/30 rounded-lg p-4 w-full",
+        class_name=_METRIC_CARD_CLS,
     )
 
 
-def confidence_badge(confidence: float) -> rx.Component:
-    """Display confidence level with color coding."""
-    color = rx.cond(
-        confidence >= 0.8,
-        "green",
-        rx.cond(confidence >= 0.6, "amber", "red")
-    )
+def confidence_badge(label: rx.Var, color: rx.Var) -> rx.Component:
+    """Display confidence level with color coding.
 
-    return rx.badge(
-        f"{confidence * 100:.1f}%",
-        color_scheme=color,
-        size="2",
-    )
+    Takes the formatted percentage and color tier computed in state (like
+    confidence_meter), so the badge carries no rx.cond nodes.
+    """
+    return rx.badge(label, color_scheme=color, size="2")
 
 
-def confidence_meter(value: rx.Var, label: str = "Confidence") -> rx.Component:
+def confidence_meter(percent: rx.Var, color: rx.Var, label: str = "Confidence") -> rx.Component:
     """Visual confidence meter/progress bar.
 
-    Values are clamped to 0-100% range for safety.
-    Displays percentage rounded to nearest integer.
+    Takes the integer percentage (0-100) and color tier computed in state,
+    so clamping and tiering happen once server-side instead of per render.
     """
-    # Clamp value to valid 0-1 range
-    clamped_value = rx.cond(value > 1.0, 1.0, rx.cond(value < 0.0, 0.0, value))
-
-    color = rx.cond(
-        clamped_value >= 0.8,
-        "green",
-        rx.cond(clamped_value >= 0.6, "amber", "red")
-    )
-
-    # Calculate percentage as integer (0-100)
-    percentage_int = (clamped_value * 100).to(int)
-
     return rx.vstack(
         rx.hstack(
             rx.text(label, size="2", weight="medium", class_name="text-slate-300"),
             rx.spacer(),
-            rx.text(percentage_int.to_string() + "%", size="2", weight="bold", class_name="text-white"),
+            rx.text(percent.to_string() + "%", size="2", weight="bold", class_name="text-white"),
             width="100%",
         ),
-        rx.progress(value=percentage_int, color_scheme=color, width="100%", class_name="h-2"),
+        rx.progress(value=percent, color_scheme=color, width="100%", class_name="h-2"),
         width="100%",
         spacing="1",
         class_name="p-3 bg-slate-800/30 rounded-lg",
     )
 
 
-def result_section(title: str, data: Dict[str, Any]) -> rx.Component:
-    """Display a results section."""
+def result_section(title: str, items: List[Tuple[str, str]]) -> rx.Component:
+    """Display a results section.
+
+    Args:
+        title: Section heading
+        items: (label, value) pairs, e.g. [(k, str(v)) for k, v in data.items()]
+    """
     return rx.box(
         rx.vstack(
             rx.heading(title, size="5", class_name="text-white"),
             rx.divider(class_name="border-slate-700"),
-            rx.foreach(
-                list(data.keys()),
-                lambda key: rx.hstack(
-                    rx.text(f"{key}:", weight="bold", width="200px", class_name="text-slate-400"),
-                    rx.text(str(data[key]), class_name="text-white"),
+            *[
+                rx.hstack(
+                    rx.text(f"{label}:", weight="bold", width="200px", class_name="text-slate-400"),
+                    rx.text(value, class_name="text-white"),
                     width="100%",
                     justify="between",
                 )
-            ),
+                for label, value in items
+            ],
             align="start",
             spacing="2",
             width="100%",
         ),
-        class_name="bg-slate-800/50 border border-slate-700/50 rounded-xl p-5 w-full",
+        class_name=_PANEL_CLS,
     )
 
 
@@ -817,7 +1288,7 @@ def info_card(title: str, description: str, icon: str = "info") -> rx.Component:
             align="start",
             spacing="2",
         ),
-        class_name="bg-slate-800/50 border border-slate-700/50 rounded-xl p-5 w-full",
+        class_name=_PANEL_CLS,
     )
 
 
@@ -847,7 +1318,7 @@ def file_upload_zone(upload_id: str, multiple: bool = False, text: str = "Select
         accept={"image/*": []},
         multiple=multiple,
         max_files=5 if multiple else 1,
-        class_name="border-2 border-dashed border-slate-600 hover:border-orange-500 bg-slate-800/30 hover:bg-slate-800/50 rounded-xl p-8 transition-all duration-300 cursor-pointer",
+        class_name=_UPLOAD_ZONE_CLS,
     )
 
 
@@ -891,32 +1362,96 @@ def image_preview(
                 spacing="3",
                 width="100%",
             ),
-            class_name="border border-slate-700 rounded-xl p-4 bg-slate-800/30",
+            class_name=_IMAGE_PREVIEW_CLS,
         ),
     )
 
 
-def results_grid(results: Dict[str, Any]) -> rx.Component:
-    """Display results in a grid layout."""
-    return rx.grid(
+def results_grid(
+    items: rx.Var,
+    show_all: Optional[rx.Var] = None,
+    on_show_all=None,
+    limit: int = 12,
+) -> rx.Component:
+    """Display results in a grid layout.
+
+    Args:
+        items: Rows prepared in state once per analysis, e.g.
+            [{"label": k.replace("_", " ").title(), "value": str(v)} for k, v in results.items()]
+        show_all: Optional bool Var; while false only the first ``limit`` cards
+            are mounted and a "Show all" button is offered
+        on_show_all: Event handler for the "Show all" button
+        limit: Number of cards shown before expanding
+    """
+    visible = items if show_all is None else rx.cond(show_all, items, items[:limit])
+    grid = rx.grid(
         rx.foreach(
-            list(results.keys()),
-            lambda key: metric_card(
-                key.replace("_", " ").title(),
-                str(results[key]),
-            )
+            visible,
+            lambda item: rx.fragment(metric_card(item["label"], item["value"]), key=item["label"]),
         ),
         columns="3",
         spacing="4",
         width="100%",
     )
+    if show_all is None:
+        return grid
+    return rx.vstack(
+        grid,
+        rx.cond(
+            ~show_all & (items.length() > limit),
+            rx.button("Show all", variant="soft", color_scheme="orange", on_click=on_show_all),
+            rx.fragment(),
+        ),
+        width="100%",
+        align="center",
+        spacing="3",
+    )
 
 
-def canon_table_row(canon: Dict[str, Any]) -> rx.Component:
-    """Single row for canon measurements table."""
+def _table_header(headers: Tuple[str, ...]) -> rx.Component:
+    """Sticky header row built from column labels."""
+    return rx.table.header(
+        rx.table.row(
+            *[rx.table.column_header_cell(header, class_name=_TABLE_HEADER_CELL_CLS) for header in headers],
+            class_name=_TABLE_HEADER_ROW_CLS,
+        ),
+    )
+
+
+def scroll_table(
+    headers: Tuple[str, ...],
+    items: rx.Var,
+    row: Callable[[rx.Var], rx.Component],
+    full_width: bool = True,
+) -> rx.Component:
+    """Result table whose rows scroll inside a bounded viewport.
+
+    Args:
+        headers: Column header labels
+        items: List Var rendered with rx.foreach
+        row: Row renderer for a single item; set a stable key (e.g. the row
+            label) so rows are not reconciled by index
+        full_width: Stretch the panel to the container width
+    """
+    return rx.box(
+        rx.box(
+            rx.table.root(
+                _table_header(headers),
+                rx.table.body(rx.foreach(items, row)),
+                width="100%",
+            ),
+            class_name=_TABLE_VIEWPORT_CLS,
+        ),
+        class_name=_cls(_TABLE_PANEL_CLS, "w-full" if full_width else ""),
+    )
+
+
+@rx.memo
+def canon_table_row(canon: rx.Var[Dict[str, Any]]) -> rx.Component:
+    """Single row for canon measurements table (memoized; call with canon=...)."""
     return rx.table.row(
         rx.table.cell(rx.text(canon["name"], weight="medium", class_name="text-white")),
-        rx.table.cell(rx.code(canon["measured"], class_name="text-orange-300 bg-slate-800 px-2 py-0.5 rounded")),
+        rx.table.cell(rx.code(canon["measured"], class_name=_CELL_CODE_CLS)),
         rx.table.cell(rx.text(canon["deviation"], class_name="text-slate-300")),
         rx.table.cell(
             rx.cond(
@@ -926,110 +1461,67 @@ def canon_table_row(canon: Dict[str, Any]) -> rx.Component:
             )
         ),
         rx.table.cell(rx.text(canon["confidence"], class_name="text-slate-400")),
-        class_name="border-b border-slate-700/50 hover:bg-slate-800/30 transition-colors",
+        class_name=_CANON_ROW_CLS,
     )
 
 
 def canon_table(canons: List[Dict[str, Any]]) -> rx.Component:
     """Formatted table for neoclassical canons."""
     return rx.vstack(
-        rx.box(
-            rx.table.root(
-                rx.table.header(
-                    rx.table.row(
-                        rx.table.column_header_cell("Canon", class_name="text-slate-300 font-semibold"),
-                        rx.table.column_header_cell("Measured", class_name="text-slate-300 font-semibold"),
-                        rx.table.column_header_cell("Deviation", class_name="text-slate-300 font-semibold"),
-                        rx.table.column_header_cell("Status", class_name="text-slate-300 font-semibold"),
-                        rx.table.column_header_cell("Confidence", class_name="text-slate-300 font-semibold"),
-                        class_name="bg-slate-800/50 border-b border-slate-700",
-                    ),
-                ),
-                rx.table.body(
-                    rx.foreach(canons, canon_table_row)
-                ),
-                width="100%",
-            ),
-            class_name="bg-slate-800/30 border border-slate-700/50 rounded-xl overflow-hidden w-full",
+        scroll_table(
+            _CANON_TABLE_HEADERS,
+            canons,
+            lambda canon: canon_table_row(canon=canon, key=canon["name"]),
         ),
-        # Status legend
-        rx.hstack(
-            rx.hstack(
-                rx.badge("In Range", color_scheme="green", size="1"),
-                rx.text("≤10% deviation", size="1", class_name="text-slate-500"),
-                spacing="1",
-                align="center",
-            ),
-            rx.hstack(
-                rx.badge("Out of Range", color_scheme="red", size="1"),
-                rx.text(">10% deviation", size="1", class_name="text-slate-500"),
-                spacing="1",
-                align="center",
-            ),
-            spacing="4",
-            class_name="mt-2",
+        # Status legend (one flex row; ml-3 separates the two badge/label pairs)
+        rx.box(
+            rx.badge("In Range", color_scheme="green", size="1"),
+            rx.text("≤10% deviation", size="1", class_name="text-slate-500"),
+            rx.badge("Out of Range", color_scheme="red", size="1", class_name="ml-3"),
+            rx.text(">10% deviation", size="1", class_name="text-slate-500"),
+            class_name="flex flex-wrap items-center gap-1 mt-2",
         ),
         width="100%",
         spacing="2",
     )
 
 
-def trait_row(trait: Dict[str, str]) -> rx.Component:
-    """Row for personality traits table."""
+@rx.memo
+def trait_row(trait: rx.Var[Dict[str, str]]) -> rx.Component:
+    """Row for personality traits table (memoized; call with trait=...)."""
     return rx.table.row(
         rx.table.cell(rx.text(trait["trait"], weight="medium", class_name="text-slate-300")),
         rx.table.cell(rx.badge(trait["value"], color_scheme="orange")),
-        class_name="border-b border-slate-700/30 hover:bg-slate-800/30 transition-colors",
+        class_name=_TABLE_ROW_CLS,
     )
 
 
 def personality_table(traits: List[Dict[str, str]]) -> rx.Component:
     """Table for personality traits."""
-    return rx.box(
-        rx.table.root(
-            rx.table.header(
-                rx.table.row(
-                    rx.table.column_header_cell("Trait", class_name="text-slate-300 font-semibold"),
-                    rx.table.column_header_cell("Value", class_name="text-slate-300 font-semibold"),
-                    class_name="bg-slate-800/50 border-b border-slate-700",
-                ),
-            ),
-            rx.table.body(
-                rx.foreach(traits, trait_row)
-            ),
-            width="100%",
-        ),
-        class_name="bg-slate-800/30 border border-slate-700/50 rounded-xl overflow-hidden",
-    )
+    return scroll_table(_TRAIT_TABLE_HEADERS, traits, lambda trait: trait_row(trait=trait, key=trait["trait"]), full_width=False)
 
 
-def detail_row(item: Dict[str, str]) -> rx.Component:
-    """Row for detail tables."""
+@rx.memo
+def detail_row(item: rx.Var[Dict[str, str]]) -> rx.Component:
+    """Row for detail tables (memoized; call with item=...)."""
     return rx.table.row(
         rx.table.cell(rx.text(item["metric"], weight="medium", class_name="text-slate-300")),
-        rx.table.cell(rx.code(item["value"], class_name="text-orange-300 bg-slate-800 px-2 py-0.5 rounded")),
-        class_name="border-b border-slate-700/30 hover:bg-slate-800/30 transition-colors",
+        rx.table.cell(rx.code(item["value"], class_name=_CELL_CODE_CLS)),
+        class_name=_TABLE_ROW_CLS,
     )
 
 
 def details_table(items: List[Dict[str, str]]) -> rx.Component:
     """Table for detailed metrics."""
-    return rx.box(
-        rx.table.root(
-            rx.table.header(
-                rx.table.row(
-                    rx.table.column_header_cell("Metric", class_name="text-slate-300 font-semibold"),
-                    rx.table.column_header_cell("Value", class_name="text-slate-300 font-semibold"),
-                    class_name="bg-slate-800/50 border-b border-slate-700",
-                ),
-            ),
-            rx.table.body(
-                rx.foreach(items, detail_row)
-            ),
-            width="100%",
-        ),
-        class_name="bg-slate-800/30 border border-slate-700/50 rounded-xl overflow-hidden w-full",
-    )
+    return scroll_table(_DETAIL_TABLE_HEADERS, items, lambda item: detail_row(item=item, key=item["metric"]))
+
+
+def markdown_content(source: str, class_name: str = "") -> rx.Component:
+    """Static markdown, prerendered to HTML on the server when Markdown is installed."""
+    html = render_markdown_html(source)
+    if html is None:
+        return rx.markdown(source, class_name=class_name)
+    return rx.html(html, class_name=class_name)
 
 
 def doc_section(title: str, content: str) -> rx.Component:
@@ -1037,10 +1529,7 @@ def doc_section(title: str, content: str) -> rx.Component:
     return rx.vstack(
         rx.heading(title, size="6", weight="bold", class_name="text-white"),
         rx.box(
-            rx.markdown(
-                content,
-                class_name="prose prose-invert prose-slate max-w-none prose-headings:text-white prose-p:text-slate-300 prose-li:text-slate-300 prose-strong:text-white prose-code:text-orange-300 prose-code:bg-slate-800 prose-code:px-1 prose-code:py-0.5 prose-code:rounded prose-pre:bg-slate-800 prose-pre:border prose-pre:border-slate-700 prose-a:text-orange-400 prose-table:border-slate-700 prose-th:border-slate-700 prose-td:border-slate-700",
-            ),
+            markdown_content(content, class_name=_DOC_SECTION_PROSE_CLS),
             class_name="w-full",
         ),
         width="100%",
@@ -1053,26 +1542,28 @@ def paper_card(title: str, description: str, key_findings: str = "") -> rx.Compo
     """Card for scientific papers."""
     return rx.box(
         rx.vstack(
-            rx.hstack(
+            rx.box(
                 rx.icon("file-text", size=20, class_name="text-orange-400"),
                 rx.text(title, weight="bold", size="3", class_name="text-white"),
-                align="center",
-                spacing="2",
+                class_name="flex items-center gap-2",
             ),
             rx.text(description, size="2", class_name="text-slate-400"),
-            rx.cond(
-                key_findings != "",
-                rx.box(
-                    rx.text("Key Findings:", size="2", weight="bold", class_name="text-slate-300"),
-                    rx.text(key_findings, size="2", class_name="text-slate-500"),
-                    class_name="pt-2",
-                ),
-                rx.fragment(),
+            # Optional block decided at build time (arguments are plain strings)
+            *(
+                [
+                    rx.box(
+                        rx.text("Key Findings:", size="2", weight="bold", class_name="text-slate-300"),
+                        rx.text(key_findings, size="2", class_name="text-slate-500"),
+                        class_name="pt-2",
+                    )
+                ]
+                if key_findings
+                else []
             ),
             align="start",
             spacing="2",
         ),
-        class_name="bg-slate-800/30 border border-slate-700/50 rounded-lg p-4 w-full hover:border-orange-500/30 transition-colors",
+        class_name=_PAPER_CARD_CLS,
     )
 
 
@@ -1090,7 +1581,7 @@ def api_method_card(name: str, signature: str, description: str) -> rx.Component
             spacing="3",
             width="100%",
         ),
-        class_name="bg-slate-800/50 border border-slate-700/50 rounded-xl p-5 w-full hover:border-orange-500/30 transition-colors",
+        class_name=_API_METHOD_CARD_CLS,
     )
 
 
@@ -1098,11 +1589,8 @@ def section_header(title: str, subtitle: str = "") -> rx.Component:
     """Section header with optional subtitle."""
     return rx.vstack(
         rx.heading(title, size="7", weight="bold", class_name="text-white"),
-        rx.cond(
-            subtitle != "",
-            rx.text(subtitle, size="3", class_name="text-slate-400"),
-            rx.fragment(),
-        ),
+        # Subtitle is a plain string, so it is included or dropped at build time
+        *([rx.text(subtitle, size="3", class_name="text-slate-400")] if subtitle else []),
         align="start",
         spacing="1",
         width="100%",
@@ -1119,29 +1607,56 @@ def analysis_mode_card(mode: str, description: str, color: str = "orange") -> rx
             align="start",
             spacing="2",
         ),
-        class_name="bg-slate-800/50 border border-slate-700/50 rounded-xl p-4 min-h-[80px] hover:border-orange-500/30 transition-colors",
+        class_name=_MODE_CARD_CLS,
     )
 
 
 def quick_link_button(text: str, href: str, icon: str = "arrow-right") -> rx.Component:
     """Quick link button with icon."""
     return rx.link(
+        # The Radix button is already an inline flex row; gap-2 matches the old spacing
         rx.button(
-            rx.hstack(
-                rx.text(text),
-                rx.icon(icon, size=16),
-                spacing="2",
-                align="center",
-            ),
+            text,
+            rx.icon(icon, size=16),
             color_scheme="orange",
             size="3",
-            class_name="hover:scale-105 transition-transform",
+            class_name="gap-2 hover:scale-105 transition-transform",
         ),
         href=href,
         class_name="no-underline",
     )
 
 
+# Docs sidebar item; the active state comes from the item's data-active attribute
+_DOCS_ITEM_CLS: Final[str] = "group px-4 py-2.5 rounded-md cursor-pointer transition-all border-l-2 border-transparent ml-1 data-[active=false]:hover:bg-slate-800/30 data-[active=true]:bg-orange-500/10 data-[active=true]:border-orange-400"
+_DOCS_ITEM_ICON_CLS: Final[str] = "text-slate-500 group-data-[active=true]:text-orange-400"
+_DOCS_ITEM_TEXT_CLS: Final[str] = "text-slate-400 group-data-[active=false]:hover:text-slate-300 group-data-[active=true]:text-white group-data-[active=true]:font-medium"
+
+# Docs navigation: (group, ((section, sidebar label, mobile label, icon), ...))
+_DocsNavItem = Tuple[str, str, str, str]
+_DOCS_NAV_GROUPS: Final[Tuple[Tuple[str, Tuple[_DocsNavItem, ...]], ...]] = (
+    ("Getting Started", (
+        ("intro", "Introduction", "Introduction", "home"),
+        ("getting_started", "Installation", "Installation", "download"),
+        ("quick_start", "Quick Start", "Quick Start", "rocket"),
+    )),
+    ("API Reference", (
+        ("api_core", "Core Classes", "Core Classes", "box"),
+        ("api_config", "Configuration", "Configuration", "settings"),
+        ("api_results", "Result Types", "Result Types", "file-json"),
+        ("api_modules", "Modules", "Modules", "layers"),
+    )),
+    ("Guides", (
+        ("configuration", "Configuration", "Configuration Guide", "sliders-horizontal"),
+        ("examples", "Examples", "Examples", "code"),
+    )),
+    ("Science", (
+        ("scientific", "Scientific Foundation", "Scientific Foundation", "flask-conical"),
+        ("papers", "Research Papers", "Research Papers", "book-open"),
+    )),
+)
+
+
 def docs_sidebar_item(
     label: str,
     section: str,
@@ -1149,31 +1664,27 @@ def docs_sidebar_item(
     active_section: rx.Var,
     on_click
 ) -> rx.Component:
-    """Sidebar item for documentation navigation."""
-    is_active = active_section == section
+    """Sidebar item for documentation navigation.
 
+    The active state is a single data-active attribute; the _DOCS_ITEM_*
+    classes style both states through data-[active=...] variants, so the
+    item carries one Var and no rx.cond.
+    """
     return rx.box(
         rx.hstack(
             rx.box(
-                rx.icon(icon, size=16, class_name=rx.cond(is_active, "text-orange-400", "text-slate-500")),
+                rx.icon(icon, size=16, class_name=_DOCS_ITEM_ICON_CLS),
                 class_name="w-5 flex-shrink-0",
             ),
-            rx.text(
-                label,
-                size="2",
-                weight=rx.cond(is_active, "medium", "regular"),
-                class_name=rx.cond(is_active, "text-white", "text-slate-400 hover:text-slate-300"),
-            ),
+            rx.text(label, size="2", class_name=_DOCS_ITEM_TEXT_CLS),
             spacing="3",
             align="center",
             width="100%",
         ),
-        on_click=lambda: on_click(section),
-        class_name=rx.cond(
-            is_active,
-            "px-4 py-2.5 rounded-md bg-orange-500/10 border-l-2 border-orange-400 cursor-pointer transition-all ml-1",
-            "px-4 py-2.5 rounded-md hover:bg-slate-800/30 cursor-pointer transition-all border-l-2 border-transparent ml-1",
-        ),
+        # Bound once at build time to a serialized event spec for this section
+        on_click=on_click(section),
+        custom_attrs={"data-active": active_section == section},
+        class_name=_DOCS_ITEM_CLS,
     )
 
 
@@ -1198,45 +1709,21 @@ def docs_sidebar_section(title: str, children: List[rx.Component]) -> rx.Compone
 
 
 def docs_sidebar(active_section: rx.Var, on_section_change) -> rx.Component:
-    """Nextra-style documentation sidebar - responsive."""
-    from .state import DocsState
+    """Nextra-style documentation sidebar - responsive.
 
+    Built from the static _DOCS_NAV_GROUPS table; only active_section varies.
+    """
     sidebar_content = rx.vstack(
-        # Getting Started section
-        docs_sidebar_section(
-            "Getting Started",
-            [
-                docs_sidebar_item("Introduction", "intro", "home", active_section, on_section_change),
-                docs_sidebar_item("Installation", "getting_started", "download", active_section, on_section_change),
-                docs_sidebar_item("Quick Start", "quick_start", "rocket", active_section, on_section_change),
-            ],
-        ),
-        # API Reference section
-        docs_sidebar_section(
-            "API Reference",
-            [
-                docs_sidebar_item("Core Classes", "api_core", "box", active_section, on_section_change),
-                docs_sidebar_item("Configuration", "api_config", "settings", active_section, on_section_change),
-                docs_sidebar_item("Result Types", "api_results", "file-json", active_section, on_section_change),
-                docs_sidebar_item("Modules", "api_modules", "layers", active_section, on_section_change),
-            ],
-        ),
-        # Guides section
-        docs_sidebar_section(
-            "Guides",
-            [
-                docs_sidebar_item("Configuration", "configuration", "sliders-horizontal", active_section, on_section_change),
-                docs_sidebar_item("Examples", "examples", "code", active_section, on_section_change),
-            ],
-        ),
-        # Science section
-        docs_sidebar_section(
-            "Science",
-            [
-                docs_sidebar_item("Scientific Foundation", "scientific", "flask-conical", active_section, on_section_change),
-                docs_sidebar_item("Research Papers", "papers", "book-open", active_section, on_section_change),
-            ],
-        ),
+        *[
+            docs_sidebar_section(
+                group,
+                [
+                    docs_sidebar_item(label, section, icon, active_section, on_section_change)
+                    for section, label, _, icon in items
+                ],
+            )
+            for group, items in _DOCS_NAV_GROUPS
+        ],
         spacing="6",
         align="start",
         width="100%",
@@ -1254,7 +1741,7 @@ def docs_content_wrapper(content: rx.Component) -> rx.Component:
     return rx.box(
         rx.box(
             content,
-            class_name="prose prose-invert prose-slate max-w-none prose-headings:text-white prose-p:text-slate-300 prose-li:text-slate-300 prose-strong:text-white prose-code:text-orange-300 prose-code:bg-slate-800 prose-code:px-1.5 prose-code:py-0.5 prose-code:rounded prose-code:before:content-none prose-code:after:content-none prose-pre:bg-slate-800 prose-pre:border prose-pre:border-slate-700 prose-pre:overflow-x-auto prose-a:text-orange-400 prose-a:no-underline hover:prose-a:underline prose-table:border-slate-700 prose-th:border-slate-700 prose-td:border-slate-700 prose-th:text-slate-300 prose-td:text-slate-400 prose-hr:border-slate-700 prose-table:text-sm prose-table:overflow-x-auto",
+            class_name=_DOCS_PROSE_CLS,
         ),
         class_name="flex-1 p-4 md:p-6 lg:p-8 max-w-4xl mx-auto w-full",
     )
@@ -1262,20 +1749,16 @@ def docs_content_wrapper(content: rx.Component) -> rx.Component:
 
 def docs_mobile_nav(active_section: rx.Var, on_section_change) -> rx.Component:
     """Mobile navigation for documentation pages with searchable select."""
-    # Section options with readable labels
-    sections = [
-        ("intro", "Introduction"),
-        ("getting_started", "Installation"),
-        ("quick_start", "Quick Start"),
-        ("api_core", "Core Classes"),
-        ("api_config", "Configuration (API)"),
-        ("api_results", "Result Types"),
-        ("api_modules", "Modules"),
-        ("configuration", "Configuration Guide"),
-        ("examples", "Examples"),
-        ("scientific", "Scientific Foundation"),
-        ("papers", "Research Papers"),
-    ]
+    groups = []
+    for group, items in _DOCS_NAV_GROUPS:
+        if groups:
+            groups.append(rx.select.separator())
+        groups.append(
+            rx.select.group(
+                rx.select.label(group),
+                *[rx.select.item(mobile_label, value=section) for section, _, mobile_label, _ in items],
+            )
+        )
 
     return rx.box(
         rx.select.root(
@@ -1283,34 +1766,7 @@ def docs_mobile_nav(active_section: rx.Var, on_section_change) -> rx.Component:
                 placeholder="Select section...",
                 class_name="w-full",
             ),
-            rx.select.content(
-                rx.select.group(
-                    rx.select.label("Getting Started"),
-                    rx.select.item("Introduction", value="intro"),
-                    rx.select.item("Installation", value="getting_started"),
-                    rx.select.item("Quick Start", value="quick_start"),
-                ),
-                rx.select.separator(),
-                rx.select.group(
-                    rx.select.label("API Reference"),
-                    rx.select.item("Core Classes", value="api_core"),
-                    rx.select.item("Configuration", value="api_config"),
-                    rx.select.item("Result Types", value="api_results"),
-                    rx.select.item("Modules", value="api_modules"),
-                ),
-                rx.select.separator(),
-                rx.select.group(
-                    rx.select.label("Guides"),
-                    rx.select.item("Configuration Guide", value="configuration"),
-                    rx.select.item("Examples", value="examples"),
-                ),
-                rx.select.separator(),
-                rx.select.group(
-                    rx.select.label("Science"),
-                    rx.select.item("Scientific Foundation", value="scientific"),
-                    rx.select.item("Research Papers", value="papers"),
-                ),
-            ),
+            rx.select.content(*groups),
             value=active_section,
             on_change=on_section_change,
             size="3",
@@ -1323,6 +1779,21 @@ def docs_mobile_nav(active_section: rx.Var, on_section_change) -> rx.Component:
 # CAPTURE ANALYSIS COMPONENTS
 # =============================================================================
 
+def _capture_mode_tab(icon: str, label: str, is_active: rx.Var, on_click) -> rx.Component:
+    """One tab of the capture mode selector."""
+    return rx.box(
+        rx.hstack(
+            rx.icon(icon, size=16, class_name=_MODE_TAB_TEXT_CLS),
+            rx.text(label, weight="medium", size="2", class_name=_MODE_TAB_TEXT_CLS),
+            spacing="2",
+            align="center",
+        ),
+        on_click=on_click,
+        custom_attrs={"data-active": is_active},
+        class_name=_MODE_TAB_CLS,
+    )
+
+
 def capture_mode_selector(
     is_webcam: rx.Var,
     on_webcam_click,
@@ -1332,70 +1803,13 @@ def capture_mode_selector(
     return rx.box(
         # Tabs container with background
         rx.hstack(
-            # Camera tab
-            rx.box(
-                rx.hstack(
-                    rx.icon(
-                        "camera",
-                        size=16,
-                        class_name=rx.cond(
-                            is_webcam,
-                            "text-white",
-                            "text-slate-400"
-                        ),
-                    ),
-                    rx.text(
-                        "Camera",
-                        weight="medium",
-                        size="2",
-                        class_name=rx.cond(
-                            is_webcam,
-                            "text-white",
-                            "text-slate-400"
-                        ),
-                    ),
-                    spacing="2",
-                    align="center",
-                ),
-                on_click=on_webcam_click,
-                class_name=rx.cond(
-                    is_webcam,
-                    "cursor-pointer px-4 py-2 rounded-md bg-gradient-to-br from-orange-500 to-amber-500 shadow-sm transition-all duration-200",
-                    "cursor-pointer px-4 py-2 rounded-md hover:bg-slate-700/50 transition-all duration-200"
-                ),
-            ),
-            # Gallery tab
-            rx.box(
-                rx.hstack(
-                    rx.icon(
-                        "image",
-                        size=16,
-                        class_name=rx.cond(
-                            ~is_webcam,
-                            "text-white",
-                            "text-slate-400"
-                        ),
-                    ),
-                    rx.text(
-                        "Gallery",
-                        weight="medium",
-                        size="2",
-                        class_name=rx.cond(
-                            ~is_webcam,
-                            "text-white",
-                            "text-slate-400"
-                        ),
-                    ),
-                    spacing="2",
-                    align="center",
-                ),
-                on_click=on_upload_click,
-                class_name=rx.cond(
-                    ~is_webcam,
-                    "cursor-pointer px-4 py-2 rounded-md bg-gradient-to-br from-orange-500 to-amber-500 shadow-sm transition-all duration-200",
-                    "cursor-pointer px-4 py-2 rounded-md hover:bg-slate-700/50 transition-all duration-200"
-                ),
-            ),
+            *[
+                _capture_mode_tab(icon, label, is_webcam == is_cam, on_click)
+                for icon, label, is_cam, on_click in (
+                    ("camera", "Camera", True, on_webcam_click),
+                    ("image", "Gallery", False, on_upload_click),
+                )
+            ],
             spacing="1",
             class_name="p-1",
         ),
@@ -1403,6 +1817,28 @@ def capture_mode_selector(
     )
 
 
+@rx.memo
+def face_guide_frame() -> rx.Component:
+    """Static part of the webcam face guide: shoulders line and corner markers.
+
+    Memoized without props, so face-status updates only re-render the oval.
+    """
+    return rx.fragment(
+        # Shoulders guide line
+        rx.box(
+            class_name="absolute bottom-8 left-1/2 -translate-x-1/2 w-72 h-0.5 bg-gradient-to-r from-transparent via-orange-400/40 to-transparent pointer-events-none",
+        ),
+        # Corner markers for framing
+        rx.html(_FRAME_CORNERS_SVG, class_name="absolute inset-0 pointer-events-none"),
+    )
+
+
+# Shared defaults for webcam_capture_zone, created once instead of per call
+_DEFAULT_FACE_STATUS = rx.Var.create("scanning")
+_DEFAULT_FACE_MESSAGE = rx.Var.create("Position your face in the oval")
+_DEFAULT_STAGE_TITLE = rx.Var.create("Frontal Photo")
+
+
 def webcam_capture_zone(
     webcam_component,
     on_capture,
@@ -1415,95 +1851,30 @@ def webcam_capture_zone(
     Auto-capture is always enabled by default.
     """
 
-    # Default values if not provided
+    # Default values if not provided (button_class is kept for compatibility; the
+    # button now takes its colors from data-status)
     if face_status is None:
-        face_status = rx.Var.create("scanning")
+        face_status = _DEFAULT_FACE_STATUS
     if face_message is None:
-        face_message = rx.Var.create("Position your face in the oval")
-    if button_class is None:
-        button_class = rx.Var.create("bg-gradient-to-br from-slate-500 to-slate-600")
+        face_message = _DEFAULT_FACE_MESSAGE
     if stage_title is None:
-        stage_title = rx.Var.create("Frontal Photo")
-
-    # Dynamic oval guide color based on status
-    oval_class = rx.cond(
-        face_status == "ready",
-        "absolute top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-48 h-64 border-3 border-green-400 rounded-[50%] pointer-events-none animate-pulse shadow-lg shadow-green-500/30",
-        rx.cond(
-            face_status == "centered",
-            "absolute top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-48 h-64 border-2 border-amber-400 rounded-[50%] pointer-events-none",
-            rx.cond(
-                face_status == "detected",
-                "absolute top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-48 h-64 border-2 border-orange-400 rounded-[50%] pointer-events-none",
-                "absolute top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-48 h-64 border-2 border-dashed border-slate-500/60 rounded-[50%] pointer-events-none"
-            )
-        )
-    )
-
-    # Status icon based on detection state
-    status_icon = rx.cond(
-        face_status == "ready",
-        rx.icon("circle-check", size=16, class_name="text-green-400"),
-        rx.cond(
-            face_status == "centered",
-            rx.icon("scan-face", size=16, class_name="text-amber-400 animate-pulse"),
-            rx.cond(
-                face_status == "detected",
-                rx.icon("user", size=16, class_name="text-orange-400"),
-                rx.icon("scan", size=16, class_name="text-slate-500 animate-spin")
-            )
-        )
-    )
-
-    # Status message color
-    status_class = rx.cond(
-        face_status == "ready",
-        "text-green-400 font-medium",
-        rx.cond(
-            face_status == "centered",
-            "text-amber-400",
-            rx.cond(
-                face_status == "detected",
-                "text-orange-400",
-                "text-slate-500"
-            )
-        )
-    )
-
-    # Button outer styling based on status
-    button_outer_class = rx.cond(
-        face_status == "ready",
-        "p-4 bg-gradient-to-br from-green-500 to-emerald-500 rounded-full shadow-lg shadow-green-500/50 transition-all duration-300",
-        rx.cond(
-            face_status == "centered",
-            "p-4 bg-gradient-to-br from-amber-500 to-orange-500 rounded-full shadow-lg shadow-amber-500/30 transition-all duration-300",
-            rx.cond(
-                face_status == "detected",
-                "p-4 bg-gradient-to-br from-orange-500 to-amber-500 rounded-full shadow-lg shadow-orange-500/30 transition-all duration-300",
-                # Default (scanning): Orange primary color
-                "p-4 bg-gradient-to-br from-orange-500 to-amber-500 rounded-full shadow-lg shadow-orange-500/30 transition-all duration-300"
-            )
-        )
-    )
+        stage_title = _DEFAULT_STAGE_TITLE
 
     # Button content based on status - spinning ring for scanning, camera icon for ready
-    button_content = rx.cond(
-        face_status == "ready",
+    button_content = rx.match(
+        face_status,
         # Ready: Show camera icon
-        rx.icon("camera", size=32, class_name="text-white"),
-        rx.cond(
-            face_status == "capturing",
-            # Capturing: Spinning loader
-            rx.icon("loader", size=32, class_name="text-white animate-spin"),
-            # Default/scanning/detected/centered: Spinning ring (like scan icon)
+        ("ready", rx.icon("camera", size=32, class_name="text-white")),
+        # Capturing: Spinning loader
+        ("capturing", rx.icon("loader", size=32, class_name="text-white animate-spin")),
+        # Default/scanning/detected/centered: Spinning ring (like scan icon)
+        rx.box(
+            # Outer ring that spins
             rx.box(
-                # Outer ring that spins
-                rx.box(
-                    class_name="w-8 h-8 rounded-full border-2 border-white/30 border-t-white animate-spin"
-                ),
-                class_name="relative flex items-center justify-center",
-            )
-        )
+                class_name="w-8 h-8 rounded-full border-2 border-white/30 border-t-white animate-spin"
+            ),
+            class_name="relative flex items-center justify-center",
+        ),
     )
 
     return rx.vstack(
@@ -1520,24 +1891,14 @@ def webcam_capture_zone(
             webcam_component,
             # Face positioning guide overlay
             rx.box(
-                # Oval face guide (dynamic color)
-                rx.box(class_name=oval_class),
-                # Shoulders guide line
-                rx.box(
-                    class_name="absolute bottom-8 left-1/2 -translate-x-1/2 w-72 h-0.5 bg-gradient-to-r from-transparent via-orange-400/40 to-transparent pointer-events-none",
-                ),
-                # Corner markers for framing
-                rx.box(class_name="absolute top-4 left-4 w-6 h-6 border-l-2 border-t-2 border-orange-400/50 pointer-events-none"),
-                rx.box(class_name="absolute top-4 right-4 w-6 h-6 border-r-2 border-t-2 border-orange-400/50 pointer-events-none"),
-                rx.box(class_name="absolute bottom-4 left-4 w-6 h-6 border-l-2 border-b-2 border-orange-400/50 pointer-events-none"),
-                rx.box(class_name="absolute bottom-4 right-4 w-6 h-6 border-r-2 border-b-2 border-orange-400/50 pointer-events-none"),
+                # Oval face guide (color follows data-status)
+                rx.box(class_name=_OVAL_CLS),
+                # Shoulders line and corner markers (static, memoized)
+                face_guide_frame(),
                 class_name="absolute inset-0 pointer-events-none",
             ),
-            # Hidden data attribute for JS - auto-capture always enabled
-            rx.el.div(
-                **{"data-auto-capture": "true"},
-                class_name="hidden"
-            ),
+            # Data attribute for JS - auto-capture always enabled
+            custom_attrs={"data-auto-capture": "true"},
             class_name="relative bg-slate-800/50 rounded-xl overflow-hidden border-2 border-slate-700 w-full max-w-md mx-auto",
         ),
         # Status message
@@ -1545,7 +1906,7 @@ def webcam_capture_zone(
             rx.text(
                 face_message,
                 size="2",
-                class_name=status_class,
+                class_name=_STATUS_MSG_CLS,
             ),
             class_name="mt-2 transition-all duration-300",
         ),
@@ -1553,7 +1914,7 @@ def webcam_capture_zone(
         rx.box(
             rx.box(
                 button_content,
-                class_name=button_outer_class,
+                class_name=_CAPTURE_BTN_CLS,
             ),
             id="face-capture-btn",
             on_click=on_capture,
@@ -1562,61 +1923,52 @@ def webcam_capture_zone(
         spacing="1",
         align="center",
         width="100%",
-        class_name="py-2",
+        custom_attrs={"data-status": face_status},
+        class_name=_CAPTURE_ZONE_CLS,
     )
 
 
-def capture_photos_column(
-    frontal_image: rx.Var,
-    profile_image: rx.Var = None,
-    image_src: rx.Var = None,
+@rx.memo
+def photo_tile(
+    src: rx.Var[str],
+    label: rx.Var[str],
+    alt: rx.Var[str],
+    mirrored: rx.Var[bool],
 ) -> rx.Component:
-    """Left column with captured photos displayed side by side."""
-    # Use rx.cond to select the image source
-    frontal_src = rx.cond(
-        frontal_image,
-        frontal_image,
-        image_src,
-    ) if image_src else frontal_image
-
-    return rx.hstack(
-        # Frontal photo (mirrored display)
+    """A single captured photo with its caption; mirrored flips the image horizontally."""
+    return rx.box(
         rx.box(
-            rx.box(
-                rx.image(
-                    src=frontal_src,
-                    alt="Frontal photo",
-                    class_name="w-32 h-40 object-cover rounded",
-                    style={"transform": "scaleX(-1)"},  # Mirror frontal for natural look
-                ),
-                class_name="p-1 bg-white/10 rounded shadow-inner",
-            ),
-            rx.text(
-                "FRONTAL",
-                size="1",
-                class_name="text-slate-500 uppercase tracking-widest mt-1 text-center",
+            rx.image(
+                src=src,
+                alt=alt,
+                class_name=_PHOTO_IMAGE_CLS,
+                custom_attrs={"data-mirrored": mirrored},
             ),
-            class_name="flex flex-col items-center",
+            class_name=_PHOTO_FRAME_CLS,
+        ),
+        rx.text(
+            label,
+            size="1",
+            class_name=_PHOTO_CAPTION_CLS,
         ),
+        class_name="flex flex-col items-center",
+    )
+
+
+@rx.memo
+def captured_photos(frontal_src: rx.Var[str], profile_src: rx.Var[str]) -> rx.Component:
+    """Captured frontal and (optional) profile photos side by side.
+
+    Memoized, so face-status updates elsewhere on the capture page do not
+    re-render the photos; call with keyword arguments.
+    """
+    return rx.hstack(
+        # Frontal photo (mirrored display for a natural look)
+        photo_tile(src=frontal_src, label="FRONTAL", alt="Frontal photo", mirrored=True),
         # Profile photo (optional, not mirrored)
         rx.cond(
-            profile_image,
-            rx.box(
-                rx.box(
-                    rx.image(
-                        src=profile_image,
-                        alt="Profile photo",
-                        class_name="w-32 h-40 object-cover rounded",
-                    ),
-                    class_name="p-1 bg-white/10 rounded shadow-inner",
-                ),
-                rx.text(
-                    "PROFILE",
-                    size="1",
-                    class_name="text-slate-500 uppercase tracking-widest mt-1 text-center",
-                ),
-                class_name="flex flex-col items-center",
-            ),
+            profile_src,
+            photo_tile(src=profile_src, label="PROFILE", alt="Profile photo", mirrored=False),
             rx.fragment(),
         ),
         spacing="4",
@@ -1624,14 +1976,35 @@ def capture_photos_column(
     )
 
 
+def capture_photos_column(
+    frontal_image: rx.Var,
+    profile_image: Optional[rx.Var] = None,
+    image_src: Optional[rx.Var] = None,
+) -> rx.Component:
+    """Left column with captured photos displayed side by side."""
+    # Fall back to image_src while no frontal photo has been captured; a Var-level
+    # `||` compiles to a single JS expression instead of a cond ternary
+    frontal_src = frontal_image if image_src is None else frontal_image | image_src
+    return captured_photos(
+        frontal_src=frontal_src,
+        profile_src=profile_image if profile_image is not None else "",
+    )
+
+
 def capture_actions_column(
     on_retake,
     on_analyze,
     is_processing: rx.Var,
     has_results: rx.Var,
-    results_component: rx.Component = None,
+    results_component: Union[rx.Component, Callable[[], rx.Component], None] = None,
 ) -> rx.Component:
-    """Right column with action buttons and results."""
+    """Right column with action buttons and results.
+
+    ``results_component`` may be a component or a zero-argument builder; a builder
+    is only called here, so callers need not construct the results tree up front.
+    """
+    if results_component is not None and not isinstance(results_component, rx.Component):
+        results_component = results_component()
     return rx.vstack(
         # Action buttons
         rx.hstack(
@@ -1663,11 +2036,7 @@ def capture_actions_column(
             spacing="3",
         ),
         # Results section (shown after analysis)
-        rx.cond(
-            has_results,
-            results_component if results_component else rx.fragment(),
-            rx.fragment(),
-        ),
+        *([rx.cond(has_results, results_component, rx.fragment())] if results_component is not None else []),
         spacing="4",
         align="start",
         width="100%",
@@ -1685,98 +2054,55 @@ def capture_preview(
     on_retake_profile = None,
 ) -> rx.Component:
     """Preview captured images - DEPRECATED: Use capture_photos_column and capture_actions_column instead."""
-    # Use rx.cond to select the image source
-    frontal_src = rx.cond(
-        frontal_image,
-        frontal_image,
-        image_src,
-    )
-
     return rx.hstack(
         # Left side - Photos side by side
-        rx.hstack(
-            # Frontal photo (mirrored display)
-            rx.box(
-                rx.box(
-                    rx.image(
-                        src=frontal_src,
-                        alt="Frontal photo",
-                        class_name="w-32 h-40 object-cover rounded",
-                        style={"transform": "scaleX(-1)"},  # Mirror frontal for natural look
-                    ),
-                    class_name="p-1 bg-white/10 rounded shadow-inner",
-                ),
-                rx.text(
-                    "FRONTAL",
-                    size="1",
-                    class_name="text-slate-500 uppercase tracking-widest mt-1 text-center",
-                ),
-                class_name="flex flex-col items-center",
-            ),
-            # Profile photo (optional, not mirrored)
-            rx.cond(
-                profile_image,
-                rx.box(
-                    rx.box(
-                        rx.image(
-                            src=profile_image,
-                            alt="Profile photo",
-                            class_name="w-32 h-40 object-cover rounded",
-                        ),
-                        class_name="p-1 bg-white/10 rounded shadow-inner",
-                    ),
-                    rx.text(
-                        "PROFILE",
-                        size="1",
-                        class_name="text-slate-500 uppercase tracking-widest mt-1 text-center",
-                    ),
-                    class_name="flex flex-col items-center",
-                ),
-                rx.fragment(),
-            ),
-            spacing="4",
-            align="start",
-        ),
+        capture_photos_column(frontal_image, profile_image, image_src),
         spacing="6",
         align="start",
         width="100%",
     )
 
 
+@rx.memo
+def upload_zone_content() -> rx.Component:
+    """Static prompt inside upload_zone_enhanced; memoized, it never re-renders after mount."""
+    return rx.vstack(
+        rx.box(
+            rx.icon("image-plus", size=48, class_name="text-orange-400"),
+            class_name="p-6 bg-orange-500/10 rounded-full mb-4",
+        ),
+        rx.heading("Select from Gallery", size="4", class_name="text-white"),
+        rx.text(
+            "Choose a frontal photo for best results",
+            size="2",
+            class_name="text-slate-400 text-center",
+        ),
+        rx.button(
+            "Browse Files",
+            color_scheme="orange",
+            size="3",
+            variant="outline",
+            class_name="mt-4",
+        ),
+        rx.text(
+            "or drag and drop here",
+            size="1",
+            class_name="text-slate-500 mt-2",
+        ),
+        spacing="2",
+        align="center",
+    )
+
+
 def upload_zone_enhanced(upload_id: str, on_upload) -> rx.Component:
     """Enhanced upload zone with elegant styling matching camera aesthetic."""
     return rx.upload(
-        rx.vstack(
-            rx.box(
-                rx.icon("image-plus", size=48, class_name="text-orange-400"),
-                class_name="p-6 bg-orange-500/10 rounded-full mb-4",
-            ),
-            rx.heading("Select from Gallery", size="4", class_name="text-white"),
-            rx.text(
-                "Choose a frontal photo for best results",
-                size="2",
-                class_name="text-slate-400 text-center",
-            ),
-            rx.button(
-                "Browse Files",
-                color_scheme="orange",
-                size="3",
-                variant="outline",
-                class_name="mt-4",
-            ),
-            rx.text(
-                "or drag and drop here",
-                size="1",
-                class_name="text-slate-500 mt-2",
-            ),
-            spacing="2",
-            align="center",
-        ),
+        upload_zone_content(),
         id=upload_id,
         accept={"image/*": []},
         max_files=1,
         on_drop=on_upload,
-        class_name="border-2 border-dashed border-slate-600 hover:border-orange-500 bg-slate-800/30 hover:bg-slate-800/50 rounded-xl p-12 transition-all duration-300 cursor-pointer min-h-[300px] flex items-center justify-center w-full",
+        class_name=_UPLOAD_ZONE_LARGE_CLS,
     )
 
 
@@ -1822,7 +2148,8 @@ def wd_result_card(
     wd_value: rx.Var,
     classification: rx.Var,
     confidence: rx.Var,
-    confidence_value: rx.Var,
+    confidence_pct: rx.Var,
+    confidence_color: rx.Var,
     bizygomatic: rx.Var,
     bigonial: rx.Var,
     personality_traits: rx.Var,
@@ -1859,7 +2186,7 @@ def wd_result_card(
                 width="100%",
             ),
             # Confidence meter
-            confidence_meter(confidence_value, "Analysis Confidence"),
+            confidence_meter(confidence_pct, confidence_color, "Analysis Confidence"),
             # Measurements
             rx.box(
                 rx.vstack(
@@ -1908,7 +2235,8 @@ def wd_result_card(
 def forehead_result_card(
     angle: rx.Var,
     impulsiveness: rx.Var,
-    confidence_value: rx.Var,
+    confidence_pct: rx.Var,
+    confidence_color: rx.Var,
     height: rx.Var,
     geometry_details: rx.Var,
 ) -> rx.Component:
@@ -1944,7 +2272,7 @@ def forehead_result_card(
                 width="100%",
             ),
             # Confidence meter
-            confidence_meter(confidence_value, "Analysis Confidence"),
+            confidence_meter(confidence_pct, confidence_color, "Analysis Confidence"),
             # Forehead height
             rx.box(
                 rx.hstack(
@@ -1978,7 +2306,8 @@ def morphology_result_card(
     face_shape: rx.Var,
     facial_index: rx.Var,
     ratio: rx.Var,
-    confidence_value: rx.Var,
+    confidence_pct: rx.Var,
+    confidence_color: rx.Var,
     proportions: rx.Var,
 ) -> rx.Component:
     """Morphology Analysis result card for demo page."""
@@ -2023,7 +2352,7 @@ def morphology_result_card(
                 width="100%",
             ),
             # Confidence meter
-            confidence_meter(confidence_value, "Analysis Confidence"),
+            confidence_meter(confidence_pct, confidence_color, "Analysis Confidence"),
             # Proportions details (conditional)
             rx.cond(
                 proportions.length() > 0,
@@ -2045,7 +2374,8 @@ def morphology_result_card(
 
 def canons_result_card(
     overall_score: rx.Var,
-    overall_score_value: rx.Var,
+    overall_score_pct: rx.Var,
+    overall_score_color: rx.Var,
     measurements_list: rx.Var,
 ) -> rx.Component:
     """Neoclassical Canons result card for demo page."""
@@ -2066,7 +2396,7 @@ def canons_result_card(
                 class_name="p-5 bg-slate-800/50 rounded-lg text-center w-full",
             ),
             # Confidence meter using overall score
-            confidence_meter(overall_score_value, "Harmony Level"),
+            confidence_meter(overall_score_pct, overall_score_color, "Harmony Level"),
             # Canon measurements table (conditional)
             rx.cond(
                 measurements_list.length() > 0,
@@ -2153,7 +2483,8 @@ def wd_result_card_with_charts(
     wd_value: rx.Var,
     classification: rx.Var,
     confidence: rx.Var,
-    confidence_value: rx.Var,
+    confidence_pct: rx.Var,
+    confidence_color: rx.Var,
     bizygomatic: rx.Var,
     bigonial: rx.Var,
     personality_traits: rx.Var,
@@ -2200,7 +2531,7 @@ def wd_result_card_with_charts(
                 align="center",
             ),
             # Confidence meter
-            confidence_meter(confidence_value, "Analysis Confidence"),
+            confidence_meter(confidence_pct, confidence_color, "Analysis Confidence"),
             # Measurements
             rx.box(
                 rx.vstack(
@@ -2261,7 +2592,8 @@ def wd_result_card_with_charts(
 def forehead_result_card_with_charts(
     angle: rx.Var,
     impulsiveness: rx.Var,
-    confidence_value: rx.Var,
+    confidence_pct: rx.Var,
+    confidence_color: rx.Var,
     height: rx.Var,
     geometry_details: rx.Var,
     impulsivity_radar_figure: rx.Var,
@@ -2307,7 +2639,7 @@ def forehead_result_card_with_charts(
                 align="center",
             ),
             # Confidence meter
-            confidence_meter(confidence_value, "Analysis Confidence"),
+            confidence_meter(confidence_pct, confidence_color, "Analysis Confidence"),
             # Forehead height
             rx.box(
                 rx.hstack(
@@ -2365,7 +2697,8 @@ def morphology_result_card_with_charts(
     face_shape: rx.Var,
     facial_index: rx.Var,
     ratio: rx.Var,
-    confidence_value: rx.Var,
+    confidence_pct: rx.Var,
+    confidence_color: rx.Var,
     proportions: rx.Var,
     face_shape_donut_figure: rx.Var,
     proportions_bar_figure: rx.Var,
@@ -2412,7 +2745,7 @@ def morphology_result_card_with_charts(
                 width="100%",
             ),
             # Confidence meter
-            confidence_meter(confidence_value, "Analysis Confidence"),
+            confidence_meter(confidence_pct, confidence_color, "Analysis Confidence"),
             # Face shape distribution donut chart (using pre-computed figure)
             rx.box(
                 rx.vstack(
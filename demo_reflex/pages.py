@@ -7,7 +7,7 @@ import reflex as rx
 from .components import (
     navbar, mobile_bottom_nav, hero_section, stat_card, feature_card,
     error_alert, section_header, analysis_mode_card, quick_link_button,
-    docs_sidebar, docs_content_wrapper, docs_mobile_nav,
+    docs_sidebar, docs_content_wrapper, docs_mobile_nav, markdown_content,
     # Demo page result components
     wd_result_card, forehead_result_card,
     morphology_result_card, canons_result_card, analysis_summary_header,
@@ -384,6 +384,7 @@ def analyze_image(
 Analyze an image (numpy array or file path).
 
 **Parameters:**
+
 - `image`: Input image as numpy array OR path to image file
 - `analysis_id`: Optional identifier for this analysis
 - `subject_id`: Optional identifier for the subject
@@ -968,54 +969,30 @@ All referenced papers are included in the `data/` folder of the repository.
 """
 
 
+# Markdown for each documentation section, keyed by DocsState.active_section
+_DOCS_SECTIONS = (
+    ("intro", DOCS_INTRO),
+    ("getting_started", DOCS_GETTING_STARTED),
+    ("quick_start", DOCS_QUICK_START),
+    ("api_core", DOCS_API_CORE),
+    ("api_config", DOCS_API_CONFIG),
+    ("api_results", DOCS_API_RESULTS),
+    ("api_modules", DOCS_API_MODULES),
+    ("configuration", DOCS_CONFIGURATION),
+    ("examples", DOCS_EXAMPLES),
+    ("scientific", DOCS_SCIENTIFIC),
+    ("papers", DOCS_PAPERS),
+)
+
+
 def docs_page() -> rx.Component:
     """Unified documentation page with Nextra-style sidebar - responsive."""
 
-    # Content selector based on active section
-    content = rx.cond(
-        DocsState.is_intro,
-        docs_content_wrapper(rx.markdown(DOCS_INTRO)),
-        rx.cond(
-            DocsState.is_getting_started,
-            docs_content_wrapper(rx.markdown(DOCS_GETTING_STARTED)),
-            rx.cond(
-                DocsState.is_quick_start,
-                docs_content_wrapper(rx.markdown(DOCS_QUICK_START)),
-                rx.cond(
-                    DocsState.is_api_core,
-                    docs_content_wrapper(rx.markdown(DOCS_API_CORE)),
-                    rx.cond(
-                        DocsState.is_api_config,
-                        docs_content_wrapper(rx.markdown(DOCS_API_CONFIG)),
-                        rx.cond(
-                            DocsState.is_api_results,
-                            docs_content_wrapper(rx.markdown(DOCS_API_RESULTS)),
-                            rx.cond(
-                                DocsState.is_api_modules,
-                                docs_content_wrapper(rx.markdown(DOCS_API_MODULES)),
-                                rx.cond(
-                                    DocsState.is_configuration,
-                                    docs_content_wrapper(rx.markdown(DOCS_CONFIGURATION)),
-                                    rx.cond(
-                                        DocsState.is_examples,
-                                        docs_content_wrapper(rx.markdown(DOCS_EXAMPLES)),
-                                        rx.cond(
-                                            DocsState.is_scientific,
-                                            docs_content_wrapper(rx.markdown(DOCS_SCIENTIFIC)),
-                                            rx.cond(
-                                                DocsState.is_papers,
-                                                docs_content_wrapper(rx.markdown(DOCS_PAPERS)),
-                                                docs_content_wrapper(rx.markdown(DOCS_INTRO)),
-                                            ),
-                                        ),
-                                    ),
-                                ),
-                            ),
-                        ),
-                    ),
-                ),
-            ),
-        ),
+    # Only the active section is mounted; unknown sections fall back to the intro
+    content = rx.match(
+        DocsState.active_section,
+        *[(section, docs_content_wrapper(markdown_content(markdown))) for section, markdown in _DOCS_SECTIONS],
+        docs_content_wrapper(markdown_content(DOCS_INTRO)),
     )
 
     return rx.box(
@@ -1252,7 +1229,8 @@ def demo_page() -> rx.Component:
                                     wd_value=DemoState.wd_value,
                                     classification=DemoState.wd_classification,
                                     confidence=DemoState.wd_confidence,
-                                    confidence_value=DemoState.wd_confidence_value,
+                                    confidence_pct=DemoState.wd_confidence_pct,
+                                    confidence_color=DemoState.wd_confidence_color,
                                     bizygomatic=DemoState.wd_bizygomatic,
                                     bigonial=DemoState.wd_bigonial,
                                     personality_traits=DemoState.personality_traits,
@@ -1269,7 +1247,8 @@ def demo_page() -> rx.Component:
                                     face_shape=DemoState.morphology_shape,
                                     facial_index=DemoState.morphology_index,
                                     ratio=DemoState.morphology_ratio,
-                                    confidence_value=DemoState.morphology_confidence_value,
+                                    confidence_pct=DemoState.morphology_confidence_pct,
+                                    confidence_color=DemoState.morphology_confidence_color,
                                     proportions=DemoState.morphology_proportions,
                                     face_shape_donut_figure=DemoState.face_shape_donut_figure,
                                     proportions_bar_figure=DemoState.proportions_bar_figure,
@@ -1283,7 +1262,8 @@ def demo_page() -> rx.Component:
                                 forehead_result_card_with_charts(
                                     angle=DemoState.forehead_angle,
                                     impulsiveness=DemoState.forehead_impulsiveness,
-                                    confidence_value=DemoState.forehead_confidence_value,
+                                    confidence_pct=DemoState.forehead_confidence_pct,
+                                    confidence_color=DemoState.forehead_confidence_color,
                                     height=DemoState.forehead_height,
                                     geometry_details=DemoState.forehead_geometry_details,
                                     impulsivity_radar_figure=DemoState.impulsivity_radar_figure,
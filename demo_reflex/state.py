@@ -7,9 +7,16 @@ import reflex as rx
 from typing import Dict, Any, List, Optional
 import json
 from pathlib import Path
-import asyncio
 import plotly.graph_objects as go
 
+# orjson is optional; it serializes the nested results dict several times faster
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    orjson = None
+    HAS_ORJSON = False
+
 from .capa_service import capa_service
 from .plotly_charts import (
     create_personality_radar, create_demographic_gauge,
@@ -20,6 +27,60 @@ from .plotly_charts import (
 )
 
 
+def _json_default(value: Any) -> Any:
+    """Serialize numpy scalars/arrays left in SDK pass-through fields (e.g. confidence intervals)."""
+    tolist = getattr(value, "tolist", None)
+    if tolist is None:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    return tolist()
+
+
+def _meter_percent(value: float) -> int:
+    """Integer percentage (0-100) shown by a confidence meter."""
+    return int(max(0.0, min(1.0, value)) * 100)
+
+
+def _meter_color(value: float) -> str:
+    """Color tier of a confidence meter."""
+    return "green" if value >= 0.8 else ("amber" if value >= 0.6 else "red")
+
+
+# Table rows shown by personality_table / details_table: (label, result key[, format])
+_TRAIT_ROWS = (
+    ("Social Orientation", "social_orientation"),
+    ("Relational Field", "relational_field"),
+    ("Communication Style", "communication_style"),
+    ("Leadership", "leadership"),
+    ("Interpersonal Effectiveness", "interpersonal_effectiveness"),
+    ("Emotional Expressiveness", "emotional_expressiveness"),
+    ("Social Energy Level", "social_energy_level"),
+    ("Conflict Resolution", "conflict_resolution_style"),
+)
+
+_FOREHEAD_GEOMETRY_ROWS = (
+    ("Slant Angle", "slant_angle", "{:.1f}°"),
+    ("Forehead Height", "forehead_height", "{:.1f} px"),
+    ("Forehead Width", "forehead_width", "{:.1f} px"),
+    ("Curvature Index", "curvature", "{:.3f}"),
+    ("Frontal Prominence Index", "frontal_prominence", "{:.3f}"),
+    ("Width/Height Ratio", "width_height_ratio", "{:.2f}"),
+)
+
+_MORPHOLOGY_PROPORTION_ROWS = (
+    ("Upper Face Ratio", "upper_face_ratio", "{:.3f}"),
+    ("Middle Face Ratio", "middle_face_ratio", "{:.3f}"),
+    ("Lower Face Ratio", "lower_face_ratio", "{:.3f}"),
+    ("Facial Width", "facial_width", "{:.1f}px"),
+    ("Facial Height", "facial_height", "{:.1f}px"),
+    ("Facial Index", "facial_index", "{:.1f}"),
+)
+
+
+def _detail_rows(values: Dict[str, Any], spec) -> List[Dict[str, str]]:
+    """Build {metric, value} rows from a result dict and a row spec."""
+    return [{"metric": label, "value": fmt.format(values.get(key, 0))} for label, key, fmt in spec]
+
+
 class LanguageState(rx.State):
     """State for language management."""
     language: str = "en"
@@ -43,6 +104,20 @@ class LanguageState(rx.State):
         self.language = "es"
 
 
+class RouteState(rx.State):
+    """State for navigation link highlighting."""
+
+    @rx.var
+    def active_route(self) -> str:
+        """Get the navigation section of the current page: "home", "docs" or "demo"."""
+        path = self.router.url.path
+        if "/docs" in path:
+            return "docs"
+        if "/demo" in path:
+            return "demo"
+        return "home"
+
+
 class DocsState(rx.State):
     """State for documentation navigation."""
     active_section: str = "intro"
@@ -51,50 +126,6 @@ class DocsState(rx.State):
         """Set the active documentation section."""
         self.active_section = section
 
-    @rx.var
-    def is_intro(self) -> bool:
-        return self.active_section == "intro"
-
-    @rx.var
-    def is_getting_started(self) -> bool:
-        return self.active_section == "getting_started"
-
-    @rx.var
-    def is_quick_start(self) -> bool:
-        return self.active_section == "quick_start"
-
-    @rx.var
-    def is_api_core(self) -> bool:
-        return self.active_section == "api_core"
-
-    @rx.var
-    def is_api_config(self) -> bool:
-        return self.active_section == "api_config"
-
-    @rx.var
-    def is_api_results(self) -> bool:
-        return self.active_section == "api_results"
-
-    @rx.var
-    def is_api_modules(self) -> bool:
-        return self.active_section == "api_modules"
-
-    @rx.var
-    def is_configuration(self) -> bool:
-        return self.active_section == "configuration"
-
-    @rx.var
-    def is_examples(self) -> bool:
-        return self.active_section == "examples"
-
-    @rx.var
-    def is_scientific(self) -> bool:
-        return self.active_section == "scientific"
-
-    @rx.var
-    def is_papers(self) -> bool:
-        return self.active_section == "papers"
-
 
 class AppState(rx.State):
     """Base application state."""
@@ -248,18 +279,16 @@ class DemoState(rx.State):
                     {"path": self.frontal_image_path, "angle_type": "frontal"},
                     {"path": self.profile_image_path, "angle_type": "profile"},
                 ]
-                # Run in thread to avoid blocking
-                result = await asyncio.to_thread(
-                    capa_service.analyze_multi_angle,
-                    image_paths=image_paths,
+                # Runs in a worker thread to avoid blocking
+                result = await capa_service.analyze_multi_angle_async(
+                    image_paths,
                     subject_id="demo_subject",
                 )
             else:
                 print(f"[DEBUG] Starting single-image analysis...")
-                # Single image analysis - run in thread to avoid blocking
-                result = await asyncio.to_thread(
-                    capa_service.analyze_single_image,
-                    image_path=self.frontal_image_path,
+                # Single image analysis - runs in a worker thread to avoid blocking
+                result = await capa_service.analyze_single_image_async(
+                    self.frontal_image_path,
                     mode=self.analysis_mode,
                 )
 
@@ -400,6 +429,16 @@ class DemoState(rx.State):
             return max(0.0, min(1.0, conf))
         return 0.0
 
+    @rx.var
+    def wd_confidence_pct(self) -> int:
+        """Get WD confidence as integer percentage for the confidence meter."""
+        return _meter_percent(self.wd_confidence_value)
+
+    @rx.var
+    def wd_confidence_color(self) -> str:
+        """Get confidence meter color tier for WD confidence."""
+        return _meter_color(self.wd_confidence_value)
+
     @rx.var
     def wd_bizygomatic(self) -> str:
         """Get bizygomatic width with units."""
@@ -442,7 +481,7 @@ class DemoState(rx.State):
         return str(value)
 
     @rx.var
-    def personality_traits(self) -> List[Dict[str, Any]]:
+    def personality_traits(self) -> List[Dict[str, str]]:
         """Get personality traits as list with formatted values."""
         if not self.results:
             return []
@@ -451,14 +490,8 @@ class DemoState(rx.State):
             profile = self.results["wd_result"].get("personality_profile", {})
             if profile:
                 return [
-                    {"trait": "Social Orientation", "value": self._format_trait_value(profile.get("social_orientation", "N/A"))},
-                    {"trait": "Relational Field", "value": self._format_trait_value(profile.get("relational_field", "N/A"))},
-                    {"trait": "Communication Style", "value": self._format_trait_value(profile.get("communication_style", "N/A"))},
-                    {"trait": "Leadership", "value": self._format_trait_value(profile.get("leadership", "N/A"))},
-                    {"trait": "Interpersonal Effectiveness", "value": self._format_trait_value(profile.get("interpersonal_effectiveness", "N/A"))},
-                    {"trait": "Emotional Expressiveness", "value": self._format_trait_value(profile.get("emotional_expressiveness", "N/A"))},
-                    {"trait": "Social Energy Level", "value": self._format_trait_value(profile.get("social_energy_level", "N/A"))},
-                    {"trait": "Conflict Resolution", "value": self._format_trait_value(profile.get("conflict_resolution_style", "N/A"))},
+                    {"trait": label, "value": self._format_trait_value(profile.get(key, "N/A"))}
+                    for label, key in _TRAIT_ROWS
                 ]
             # If no profile, generate basic traits from classification
             classification = self.results["wd_result"].get("classification", "")
@@ -564,6 +597,16 @@ class DemoState(rx.State):
             return max(0.0, min(1.0, conf))
         return 0.0
 
+    @rx.var
+    def forehead_confidence_pct(self) -> int:
+        """Get forehead confidence as integer percentage for the confidence meter."""
+        return _meter_percent(self.forehead_confidence_value)
+
+    @rx.var
+    def forehead_confidence_color(self) -> str:
+        """Get confidence meter color tier for forehead confidence."""
+        return _meter_color(self.forehead_confidence_value)
+
     @rx.var
     def forehead_height(self) -> str:
         """Get forehead height."""
@@ -578,14 +621,7 @@ class DemoState(rx.State):
         if self.results and self.results.get("forehead_result"):
             geom = self.results["forehead_result"].get("geometry", {})
             if geom:
-                return [
-                    {"metric": "Slant Angle", "value": f"{geom.get('slant_angle', 0):.1f}°"},
-                    {"metric": "Forehead Height", "value": f"{geom.get('forehead_height', 0):.1f} px"},
-                    {"metric": "Forehead Width", "value": f"{geom.get('forehead_width', 0):.1f} px"},
-                    {"metric": "Curvature Index", "value": f"{geom.get('curvature', 0):.3f}"},
-                    {"metric": "Frontal Prominence Index", "value": f"{geom.get('frontal_prominence', 0):.3f}"},
-                    {"metric": "Width/Height Ratio", "value": f"{geom.get('width_height_ratio', 0):.2f}"},
-                ]
+                return _detail_rows(geom, _FOREHEAD_GEOMETRY_ROWS)
         return []
 
     # ========== Morphology Analysis Computed Vars ==========
@@ -672,20 +708,23 @@ class DemoState(rx.State):
             return max(0.0, min(1.0, conf))
         return 0.0
 
+    @rx.var
+    def morphology_confidence_pct(self) -> int:
+        """Get morphology confidence as integer percentage for the confidence meter."""
+        return _meter_percent(self.morphology_confidence_value)
+
+    @rx.var
+    def morphology_confidence_color(self) -> str:
+        """Get confidence meter color tier for morphology confidence."""
+        return _meter_color(self.morphology_confidence_value)
+
     @rx.var
     def morphology_proportions(self) -> List[Dict[str, str]]:
         """Get detailed facial proportions."""
         if self.results and self.results.get("morphology_result"):
             props = self.results["morphology_result"].get("proportions", {})
             if props:
-                return [
-                    {"metric": "Upper Face Ratio", "value": f"{props.get('upper_face_ratio', 0):.3f}"},
-                    {"metric": "Middle Face Ratio", "value": f"{props.get('middle_face_ratio', 0):.3f}"},
-                    {"metric": "Lower Face Ratio", "value": f"{props.get('lower_face_ratio', 0):.3f}"},
-                    {"metric": "Facial Width", "value": f"{props.get('facial_width', 0):.1f}px"},
-                    {"metric": "Facial Height", "value": f"{props.get('facial_height', 0):.1f}px"},
-                    {"metric": "Facial Index", "value": f"{props.get('facial_index', 0):.1f}"},
-                ]
+                return _detail_rows(props, _MORPHOLOGY_PROPORTION_ROWS)
         return []
 
     # ========== Neoclassical Canons Computed Vars ==========
@@ -1095,7 +1134,14 @@ class DemoState(rx.State):
             filename = f"demo_analysis_{timestamp}.json"
             filepath = export_dir / filename
 
-            json_data = json.dumps(self.results, indent=2)
+            if HAS_ORJSON:
+                json_data = orjson.dumps(
+                    self.results,
+                    default=_json_default,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                ).decode()
+            else:
+                json_data = json.dumps(self.results, indent=2, default=_json_default)
 
             with open(filepath, "w") as f:
                 f.write(json_data)
@@ -202,6 +202,24 @@ def mock_empty_results() -> Dict[str, Any]:
     return {}
 
 
+# =============================================================================
+# Service Fixtures
+# =============================================================================
+
+@pytest.fixture
+def capa_service_module():
+    """The capa_service module with empty class-level caches.
+
+    Skipped when the CAPA SDK is not importable.
+    """
+    module = pytest.importorskip("demo_reflex.capa_service")
+    module.CapaService._analyzer_cache.clear()
+    module.CapaService._result_cache.clear()
+    yield module
+    module.CapaService._analyzer_cache.clear()
+    module.CapaService._result_cache.clear()
+
+
 # =============================================================================
 # State Test Helpers
 # =============================================================================
@@ -5,10 +5,30 @@ These tests verify the capa_service.py correctly processes
 SDK results and transforms them for the demo UI.
 """
 
+import numpy as np
 import pytest
+from enum import Enum
+from types import SimpleNamespace
 from unittest.mock import Mock, patch, MagicMock
 from typing import Dict, Any
 
+from demo_reflex._formatters import (
+    clamp_confidence,
+    format_wd_result,
+    format_forehead_result,
+    format_morphology_result,
+    format_neoclassical_result,
+    format_canon_measurements,
+    within_mask,
+)
+
+
+class _Label(Enum):
+    RESERVED = "reserved"
+    LOW = "low"
+    OVAL = "oval"
+    ROUND = "round"
+
 
 class TestConfidenceClamping:
     """Tests for confidence value clamping in service layer."""
@@ -34,6 +54,11 @@ class TestConfidenceClamping:
 
         assert clamped == 0.649
 
+    def test_clamp_confidence_helper(self):
+        """Test the service clamp helper matches min/max clamping."""
+        for raw_conf in (1.005, -0.1, 0.649, 0.0, 1.0):
+            assert clamp_confidence(raw_conf) == max(0.0, min(1.0, raw_conf))
+
 
 class TestCanonDeviationThreshold:
     """Tests for canon deviation threshold logic."""
@@ -241,3 +266,264 @@ class TestGeometryDetailsFormatting:
         assert len(details) == 6
         assert details[0]["value"] == "15.0"
         assert details[3]["value"] == "0.125"
+
+
+class TestResultFormatters:
+    """Tests for the shared SDK result formatters."""
+
+    def test_wd_prefers_cm_values(self):
+        """Test cm values are used when calibrated and confidence is clamped."""
+        wd = SimpleNamespace(
+            wd_value=145.2, wd_value_cm=3.897,
+            bizygomatic_width=542.1, bizygomatic_width_cm=14.44,
+            bigonial_width=396.9, bigonial_width_cm=0,
+            primary_classification=_Label.RESERVED,
+            measurement_confidence=1.005,
+        )
+
+        result = format_wd_result(wd)
+
+        assert result["wd_value"] == 3.897
+        assert result["units"] == "cm"
+        assert result["bigonial_width"] == 396.9  # No cm value, falls back to px
+        assert result["confidence"] == 1.0
+        assert result["wd_ratio"] is None
+        assert "personality_profile" not in result
+
+    def test_wd_personality_profile_attribute_fallback(self):
+        """Test _score attributes are preferred and missing traits become N/A."""
+        wd = SimpleNamespace(
+            wd_value=145.2, bizygomatic_width=542.1, bigonial_width=396.9,
+            primary_classification=_Label.RESERVED,
+            measurement_confidence=0.649,
+            personality_profile=SimpleNamespace(
+                social_orientation_score=0.65,
+                relational_field=0.58,
+                leadership_tendency=0.45,
+            ),
+        )
+
+        profile = format_wd_result(wd)["personality_profile"]
+
+        assert profile["social_orientation"] == 0.65
+        assert profile["relational_field"] == 0.58
+        assert profile["leadership"] == 0.45
+        assert profile["communication_style"] == "N/A"
+
+    def test_forehead_geometry_ratio_derived(self):
+        """Test width/height ratio is derived when the SDK does not provide it."""
+        fh = SimpleNamespace(
+            forehead_geometry=SimpleNamespace(
+                slant_angle_degrees=15.0, forehead_height=60.0, forehead_width=120.0,
+            ),
+            impulsiveness_level=_Label.LOW,
+            measurement_confidence=0.85,
+        )
+
+        result = format_forehead_result(fh)
+
+        assert result["geometry"]["width_height_ratio"] == 2.0
+        assert result["geometry"]["curvature"] == 0
+        assert result["impulsiveness_level"] == "low"
+
+    def test_morphology_secondary_shape_fallback(self):
+        """Test shape probabilities are built from secondary shapes."""
+        morph = SimpleNamespace(
+            shape_classification=SimpleNamespace(
+                primary_shape=_Label.OVAL, confidence=0.6, secondary_shapes=[_Label.ROUND],
+            ),
+            facial_proportions=SimpleNamespace(facial_index=88.5, facial_width_height_ratio=0.78),
+            measurement_confidence=0.92,
+        )
+
+        result = format_morphology_result(morph)
+
+        assert result["shape_probabilities"]["oval"] == 0.6
+        assert result["shape_probabilities"]["round"] == pytest.approx(0.4)
+        assert result["proportions"]["upper_face_ratio"] == 0
+
+    def test_neoclassical_threshold_overrides_sdk_validity(self):
+        """Test deviation threshold replaces SDK is_valid when given."""
+        neo = SimpleNamespace(
+            overall_validity_score=0.291,
+            canons=[
+                SimpleNamespace(canon_name="Canon 1", deviation_percentage=9.5, is_valid=False),
+                SimpleNamespace(deviation_percentage=-38.6, is_valid=True),
+            ],
+        )
+
+        sdk = format_neoclassical_result(neo)["canon_measurements"]
+        uniform = format_neoclassical_result(neo, deviation_threshold=10.0)["canon_measurements"]
+
+        assert sdk["Canon 1"]["within_range"] is False
+        assert sdk["Canon 2"]["within_range"] is True
+        assert uniform["Canon 1"]["within_range"] is True
+        assert uniform["Canon 2"]["within_range"] is False
+
+    def test_canon_measurements_formatting(self):
+        """Test standalone canon measurements keep SDK range flags and names."""
+        measurements = {
+            "facial_thirds": SimpleNamespace(
+                measured_value=1.02, deviation_from_ideal=2.0,
+                within_acceptable_range=True, measurement_confidence=0.9,
+            ),
+        }
+
+        result = format_canon_measurements(measurements)
+
+        assert result == {"facial_thirds": {
+            "measured_value": 1.02, "deviation": 2.0, "confidence": 0.9, "within_range": True,
+        }}
+
+    def test_within_mask_large_batch(self):
+        """Test the range mask matches abs(deviation) <= threshold for large batches."""
+        deviations = np.linspace(-20.0, 20.0, 101)
+
+        mask = within_mask(deviations, 10.0)
+
+        assert mask.tolist() == [abs(d) <= 10.0 for d in deviations]
+
+
+class _BarrierLock:
+    """Analyzer lock stand-in that holds each caller until both requests have their analyzer."""
+
+    def __init__(self, barrier):
+        self.barrier = barrier
+
+    def __enter__(self):
+        self.barrier.wait(timeout=5)
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class TestCoreAnalyzerConcurrency:
+    """Tests for concurrent single-image analyses on the shared service."""
+
+    def test_concurrent_configs_use_their_own_analyzer(self, capa_service_module):
+        """Test two requests with different configs each run the analyzer for their config."""
+        import threading
+
+        service = capa_service_module.capa_service
+        barrier = threading.Barrier(2)
+        calls = []
+
+        def make_analyzer(label):
+            analyzer = Mock()
+            analyzer.analyze_image.side_effect = lambda path: calls.append((path, label))
+            return analyzer
+
+        flags_by_label = {
+            "wd_only": (True, False, False, False),
+            "all": (True, True, True, True),
+        }
+        for label, flags in flags_by_label.items():
+            capa_service_module.CapaService._analyzer_cache[("STANDARD", *flags)] = (
+                make_analyzer(label), _BarrierLock(barrier),
+            )
+
+        threads = [
+            threading.Thread(
+                target=service._run_single_image_analysis,
+                args=(label, "STANDARD", *flags),
+            )
+            for label, flags in flags_by_label.items()
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert sorted(calls) == [("all", "all"), ("wd_only", "wd_only")]
+
+
+class TestImageLoading:
+    """Tests for the shared image decode of the single-module analyzers."""
+
+    @pytest.fixture
+    def image_file(self, capa_service_module, tmp_path):
+        """An image path whose decode yields a small array; the decode cache starts empty."""
+        path = tmp_path / "face.jpg"
+        path.write_bytes(b"")
+        capa_service_module._decode_image.cache_clear()
+        yield str(path)
+        capa_service_module._decode_image.cache_clear()
+
+    def test_load_image_shares_read_only_array(self, capa_service_module, image_file):
+        """Test repeated loads return the same cached, read-only array instead of copies."""
+        import sys
+
+        cv2 = SimpleNamespace(imread=Mock(return_value=np.zeros((4, 4, 3), dtype=np.uint8)))
+        with patch.dict(sys.modules, {"cv2": cv2}):
+            first = capa_service_module._load_image(image_file)
+            second = capa_service_module._load_image(image_file)
+
+        assert first is second
+        assert not first.flags.writeable
+        cv2.imread.assert_called_once_with(image_file)
+
+    def test_analyze_all_decodes_once(self, capa_service_module, image_file):
+        """Test analyze_all decodes once and gives every analyzer its own writable copy."""
+        service = capa_service_module.capa_service
+        image = np.zeros((4, 4, 3), dtype=np.uint8)
+        image.setflags(write=False)
+        decoder = Mock(return_value=image)
+        received = []
+
+        def draw_on_input(array, **kwargs):
+            array[0, 0] = 255  # In-place write, as an OpenCV drawing call would do
+            received.append(array)
+
+        analyzers = {
+            name: Mock(**{"analyze_image.side_effect": draw_on_input})
+            for name in ("wd_analyzer", "forehead_analyzer", "morphology_analyzer", "neoclassical_analyzer")
+        }
+
+        with patch.object(capa_service_module, "_decode_image", decoder), \
+                patch.multiple(service, **analyzers):
+            results = service.analyze_all(image_file)
+
+        decoder.assert_called_once()
+        assert list(results) == ["wd", "forehead", "morphology", "neoclassical"]
+        assert len(received) == 4
+        assert len({id(array) for array in received}) == 4
+        assert all(array is not image for array in received)
+        assert not image.any()  # The shared decode is untouched
+
+    def test_overlapping_analyze_all_serializes_each_analyzer(self, capa_service_module, image_file):
+        """Test two overlapping analyze_all calls never run one analyzer instance on two threads."""
+        import threading
+        import time
+
+        service = capa_service_module.capa_service
+        image = np.zeros((4, 4, 3), dtype=np.uint8)
+        state_lock = threading.Lock()
+        active = {}
+        peak = {}
+
+        def make_analyzer(name):
+            def analyze_image(array, **kwargs):
+                with state_lock:
+                    active[name] = active.get(name, 0) + 1
+                    peak[name] = max(peak.get(name, 0), active[name])
+                time.sleep(0.05)
+                with state_lock:
+                    active[name] -= 1
+            return Mock(**{"analyze_image.side_effect": analyze_image})
+
+        analyzers = {
+            name: make_analyzer(name)
+            for name in ("wd_analyzer", "forehead_analyzer", "morphology_analyzer", "neoclassical_analyzer")
+        }
+
+        with patch.object(capa_service_module, "_decode_image", Mock(return_value=image)), \
+                patch.multiple(service, **analyzers):
+            threads = [threading.Thread(target=service.analyze_all, args=(image_file,)) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        assert peak == dict.fromkeys(analyzers, 1)
+        for analyzer in analyzers.values():
+            assert analyzer.analyze_image.call_count == 2
@@ -240,3 +240,14 @@ class TestConfidenceMeter:
 
         assert percentage_int == 64
         assert isinstance(percentage_int, int)
+
+    def test_confidence_percentage_clamped(self):
+        """Test the state meter helpers clamp and tier confidence at the boundaries."""
+        state = pytest.importorskip("demo_reflex.state")
+
+        assert state._meter_percent(-0.1) == 0
+        assert state._meter_percent(0.999) == 99
+        assert state._meter_percent(1.3) == 100
+        assert state._meter_color(0.6) == "amber"
+        assert state._meter_color(0.8) == "green"
+        assert state._meter_color(0.59) == "red"
@@ -0,0 +1,62 @@
+"""
+Tests for the docs markdown prerendering.
+
+These tests verify the static docs sections render to the expected HTML
+structure (lists, tables, highlighted code) with Python-Markdown.
+"""
+
+import re
+
+import pytest
+
+pytest.importorskip("markdown")
+
+from demo_reflex._markdown import render_markdown_html
+
+
+# Markdown list item outside a fenced code block
+_LIST_ITEM = re.compile(r"^\s*(?:[-*]|\d+\.)\s")
+
+
+def _docs_sections():
+    """All DOCS_* markdown constants of the docs page, by name."""
+    pages = pytest.importorskip("demo_reflex.pages")
+    return {name: getattr(pages, name) for name in dir(pages) if name.startswith("DOCS_")}
+
+
+def _has_list(source: str) -> bool:
+    """Whether a markdown source contains a list outside its code fences."""
+    in_fence = False
+    for line in source.splitlines():
+        if line.strip().startswith("```"):
+            in_fence = not in_fence
+        elif not in_fence and _LIST_ITEM.match(line):
+            return True
+    return False
+
+
+class TestDocsRendering:
+    """Tests for rendering the DOCS_* sections."""
+
+    def test_lists_render_as_list_elements(self):
+        """Test every docs section with a list renders <ul>/<ol> and no run-on list paragraphs."""
+        for name, source in _docs_sections().items():
+            html = render_markdown_html(source)
+            if _has_list(source):
+                assert "<ul>" in html or "<ol>" in html, name
+            assert not re.search(r"<p>[^<]*\n- ", html), name
+
+    def test_parameters_list_after_heading_line(self):
+        """Test the analyze_image parameters render as separate list items."""
+        html = render_markdown_html(_docs_sections()["DOCS_API_CORE"])
+
+        assert "<li><code>image</code>: Input image" in html
+        assert "<li><code>analysis_id</code>: Optional identifier" in html
+
+    def test_code_blocks_highlighted(self):
+        """Test fenced code blocks are highlighted with Pygments."""
+        pytest.importorskip("pygments")
+        html = render_markdown_html(_docs_sections()["DOCS_API_CORE"])
+
+        assert 'class="codehilite"' in html
+        assert "<span style=" in html